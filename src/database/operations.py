@@ -1,20 +1,29 @@
 import uuid
 from typing import List, Optional
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.future import select
-from sqlalchemy.orm import sessionmaker
 from src.database.models import Base, Prospect, ProspectStatus
 from src.config import DATABASE_URL
 
-async_engine = create_async_engine(DATABASE_URL, echo=True)
-AsyncSessionLocal = sessionmaker(
-    autocommit=False,
-    autoflush=False,
+# One process-wide engine; sessions check connections out of its pool instead of reconnecting per request
+async_engine = create_async_engine(DATABASE_URL, echo=True, pool_size=10, max_overflow=20)
+AsyncSessionLocal = async_sessionmaker(
     bind=async_engine,
-    class_=AsyncSession,
+    autoflush=False,
     expire_on_commit=False,
 )
 
+# Incremented on every prospect write in this process so readers can cache derived views
+_prospects_version = 0
+
+def prospects_version() -> int:
+    """Return the current prospect write counter."""
+    return _prospects_version
+
+def _bump_prospects_version() -> None:
+    global _prospects_version
+    _prospects_version += 1
+
 async def init_db(engine=None):
     """Initialize database by creating all tables."""
     target_engine = engine or async_engine
@@ -36,6 +45,7 @@ async def create_prospect(session: AsyncSession, prospect_id: str, company_name:
     prospect = Prospect(id=prospect_id, company_name=company_name, domain=domain)
     session.add(prospect)
     await session.commit()
+    _bump_prospects_version()
     await session.refresh(prospect)
     return prospect
 
@@ -45,6 +55,7 @@ async def update_prospect_status(session: AsyncSession, prospect_id: str, status
     if prospect:
         prospect.status = status
         await session.commit()
+        _bump_prospects_version()
         await session.refresh(prospect)
     return prospect
 
@@ -54,6 +65,7 @@ async def delete_prospect(session: AsyncSession, prospect_id: str) -> bool:
     if prospect:
         await session.delete(prospect)
         await session.commit()
+        _bump_prospects_version()
         return True
     return False
 
@@ -5,9 +5,11 @@ This module provides LLM integration for:
 - Research data analyzers
 - Intelligence middleware coordination
 - Profile strategy generation
+- LLM response caching
 """
 
 from .middleware import LLMMiddleware
 from .client import BedrockClient
+from .cache import LLMCache
 
-__all__ = ["LLMMiddleware", "BedrockClient"]
+__all__ = ["LLMMiddleware", "BedrockClient", "LLMCache"]
@@ -1,10 +1,39 @@
 """Research data analyzers for LLM processing."""
 
 import logging
-from typing import Dict, Any, Optional
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional
 
 logger = logging.getLogger(__name__)
 
+# Static manual fallback responses, built once at import. List fields are
+# stored as tuples and copied into fresh lists for each caller.
+_MANUAL_RESEARCH_ANALYSIS = MappingProxyType({
+    "company_background": "Manual analysis of collected data",
+    "business_model": "Extracted from available sources",
+    "technology_stack": (),
+    "pain_points": (),
+    "recent_developments": (),
+    "decision_makers": (),
+    "enhancement_status": "manual_fallback"
+})
+
+_MANUAL_PROFILE_STRATEGY = MappingProxyType({
+    "conversation_starter_1": "What's driving your current business priorities?",
+    "conversation_starter_2": "How are you approaching your technology roadmap?",
+    "conversation_starter_3": "What challenges are you facing in your current setup?",
+    "value_proposition": "Manual value proposition based on research",
+    "timing_recommendation": "Manual timing assessment",
+    "talking_points": ("Manual talking point 1", "Manual talking point 2"),
+    "objection_handling": ("Manual objection response",),
+    "enhancement_status": "manual_fallback"
+})
+
+
+def _copy_template(template: Mapping[str, Any]) -> Dict[str, Any]:
+    """Copy a frozen response template into a mutable result dict."""
+    return {key: list(value) if isinstance(value, tuple) else value for key, value in template.items()}
+
 
 class ResearchAnalyzer:
     """Analyzer for research data using LLM insights."""
@@ -53,16 +82,9 @@ class ResearchAnalyzer:
         logger.info("Using fallback manual research analysis")
         
         # Basic manual processing of whatever data was collected
-        return {
-            "company_background": "Manual analysis of collected data",
-            "business_model": "Extracted from available sources",
-            "technology_stack": [],
-            "pain_points": [],
-            "recent_developments": [],
-            "decision_makers": [],
-            "enhancement_status": "manual_fallback",
-            "data_sources_summary": self._summarize_sources(raw_data)
-        }
+        result = _copy_template(_MANUAL_RESEARCH_ANALYSIS)
+        result["data_sources_summary"] = self._summarize_sources(raw_data)
+        return result
         
     def _summarize_sources(self, raw_data: Dict[str, Any]) -> Dict[str, Any]:
         """Summarize data source collection results."""
@@ -123,13 +145,4 @@ class ProfileAnalyzer:
         """Fallback manual strategy when LLM fails."""
         logger.info("Using fallback manual profile strategy")
         
-        return {
-            "conversation_starter_1": "What's driving your current business priorities?",
-            "conversation_starter_2": "How are you approaching your technology roadmap?", 
-            "conversation_starter_3": "What challenges are you facing in your current setup?",
-            "value_proposition": "Manual value proposition based on research",
-            "timing_recommendation": "Manual timing assessment",
-            "talking_points": ["Manual talking point 1", "Manual talking point 2"],
-            "objection_handling": ["Manual objection response"],
-            "enhancement_status": "manual_fallback"
-        }
+        return _copy_template(_MANUAL_PROFILE_STRATEGY)
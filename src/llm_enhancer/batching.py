@@ -0,0 +1,98 @@
+"""Micro-batching of concurrent LLM analysis requests."""
+
+import asyncio
+import logging
+from typing import Dict, Any, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class BatchingClient:
+    """Coalesce concurrent analysis requests into batched Bedrock calls.
+
+    Exposes the same ``analyze_research_data`` coroutine as ``BedrockClient``
+    so analyzers can use it as a drop-in LLM client. Requests that arrive
+    within ``max_wait_seconds`` of each other are grouped (up to
+    ``max_batch_size``) and sent as a single ``analyze_research_batch`` call,
+    amortizing the shared system prompt across the batch.
+    """
+
+    def __init__(self, llm_client, max_batch_size: int = 8, max_wait_seconds: float = 0.05):
+        """Initialize batching client.
+
+        Args:
+            llm_client: Underlying BedrockClient
+            max_batch_size: Maximum number of requests per Bedrock call
+            max_wait_seconds: How long to wait for more requests after the first
+        """
+        self.llm_client = llm_client
+        self.max_batch_size = max_batch_size
+        self.max_wait_seconds = max_wait_seconds
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._queues: Dict[str, asyncio.Queue] = {}
+        self._tasks: Set[asyncio.Task] = set()
+
+    async def analyze_research_data(self, raw_data: Dict[str, Any], analysis_type: str = "research") -> Dict[str, Any]:
+        """Queue an analysis request and wait for its batched result."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        await self._queue_for(analysis_type, loop).put((raw_data, future))
+        return await future
+
+    def _queue_for(self, analysis_type: str, loop: asyncio.AbstractEventLoop) -> asyncio.Queue:
+        """Return the request queue for an analysis type, starting its worker if needed."""
+        if self._loop is not loop:
+            # Queues and workers are bound to the loop that created them
+            self._loop = loop
+            self._queues = {}
+            self._tasks = set()
+
+        if analysis_type not in self._queues:
+            queue: asyncio.Queue = asyncio.Queue()
+            self._queues[analysis_type] = queue
+            self._track(loop.create_task(self._batch_worker(analysis_type, queue)))
+        return self._queues[analysis_type]
+
+    def _track(self, task: asyncio.Task) -> None:
+        """Keep a reference to a background task until it finishes."""
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _batch_worker(self, analysis_type: str, queue: asyncio.Queue):
+        """Collect queued requests into batches and dispatch them."""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await queue.get()]
+            deadline = loop.time() + self.max_wait_seconds
+
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), timeout=remaining))
+                except asyncio.TimeoutError:
+                    break
+
+            # Dispatch without blocking collection of the next batch
+            self._track(loop.create_task(self._dispatch(analysis_type, batch)))
+
+    async def _dispatch(self, analysis_type: str, batch: List[Tuple[Dict[str, Any], asyncio.Future]]):
+        """Run one batch and fan results back out to the waiting callers."""
+        try:
+            if len(batch) == 1:
+                results = [await self.llm_client.analyze_research_data(batch[0][0], analysis_type)]
+            else:
+                logger.debug(f"Dispatching batch of {len(batch)} {analysis_type} requests")
+                results = await self.llm_client.analyze_research_batch(
+                    [raw_data for raw_data, _ in batch], analysis_type
+                )
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
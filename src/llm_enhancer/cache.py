@@ -0,0 +1,131 @@
+"""Response caching for LLM enhancement results."""
+
+import copy
+import logging
+import math
+import re
+import time
+from collections import Counter, OrderedDict, deque
+from typing import Dict, Any, Deque, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+_TOKEN_PATTERN = re.compile(r"\w+")
+
+
+class LLMCache:
+    """In-process LRU cache of enhancement results with per-entry TTL.
+
+    ``get`` and ``set`` are coroutines so a shared backend (for example
+    Redis) can be injected into ``LLMMiddleware`` with the same interface.
+    Values are deep-copied on the way in and out, so callers may mutate
+    what they receive without corrupting the cache.
+    """
+
+    def __init__(self, max_entries: int = 1000, ttl_seconds: float = 3600):
+        """Initialize cache.
+
+        Args:
+            max_entries: Maximum number of entries before LRU eviction
+            ttl_seconds: Default lifetime of an entry
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.stats = {'hits': 0, 'misses': 0}
+        # key -> (expires_at, value), least recently used first
+        self._entries: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return a copy of a fresh cached value, evicting it if expired."""
+        entry = self._entries.get(key)
+        if entry is not None and time.monotonic() >= entry[0]:
+            del self._entries[key]
+            entry = None
+
+        if entry is None:
+            self.stats['misses'] += 1
+            return None
+
+        self.stats['hits'] += 1
+        self._entries.move_to_end(key)
+        return copy.deepcopy(entry[1])
+
+    async def set(self, key: str, value: Dict[str, Any], ttl: Optional[float] = None) -> None:
+        """Store a value, evicting the least recently used entries over capacity."""
+        expires_at = time.monotonic() + (self.ttl_seconds if ttl is None else ttl)
+        self._entries[key] = (expires_at, copy.deepcopy(value))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+
+def _embed(text: str) -> Tuple[Dict[str, float], float]:
+    """Return a term-frequency vector for text and its Euclidean norm."""
+    vector = Counter(_TOKEN_PATTERN.findall(text.lower()))
+    return vector, math.sqrt(sum(count * count for count in vector.values()))
+
+
+def _cosine(a: Dict[str, float], a_norm: float, b: Dict[str, float], b_norm: float) -> float:
+    """Cosine similarity of two sparse vectors with precomputed norms."""
+    if not a_norm or not b_norm:
+        return 0.0
+    if len(a) > len(b):
+        a, b = b, a
+    return sum(count * b.get(token, 0) for token, count in a.items()) / (a_norm * b_norm)
+
+
+class SemanticCache:
+    """Near-duplicate cache tier keyed by text similarity.
+
+    Entries are matched by cosine similarity of term-frequency vectors,
+    so payloads that differ only by field drift (timestamps, reordered or
+    slightly changed source text) reuse a stored result. Lookups only
+    compare entries within the same scope (for example one company), and
+    the oldest entries are evicted first once ``max_entries`` is reached.
+    """
+
+    def __init__(self, max_entries: int = 500, threshold: float = 0.92, ttl_seconds: float = 3600):
+        """Initialize semantic cache.
+
+        Args:
+            max_entries: Maximum number of stored entries (FIFO eviction)
+            threshold: Minimum cosine similarity for a hit
+            ttl_seconds: Lifetime of an entry
+        """
+        self.threshold = threshold
+        self.ttl_seconds = ttl_seconds
+        self.stats = {'hits': 0, 'misses': 0}
+        # (scope, vector, norm, expires_at, value), oldest first
+        self._entries: Deque[Tuple[str, Dict[str, float], float, float, Dict[str, Any]]] = deque(maxlen=max_entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get(self, scope: str, text: str) -> Optional[Dict[str, Any]]:
+        """Return a copy of the most similar fresh value in scope above the threshold."""
+        vector, norm = _embed(text)
+        now = time.monotonic()
+        best_score, best_value = self.threshold, None
+
+        for entry_scope, entry_vector, entry_norm, expires_at, value in self._entries:
+            if entry_scope != scope or now >= expires_at:
+                continue
+            score = _cosine(vector, norm, entry_vector, entry_norm)
+            if score >= best_score:
+                best_score, best_value = score, value
+
+        if best_value is None:
+            self.stats['misses'] += 1
+            return None
+
+        self.stats['hits'] += 1
+        logger.debug(f"Semantic cache hit with similarity {best_score:.3f}")
+        return copy.deepcopy(best_value)
+
+    async def set(self, scope: str, text: str, value: Dict[str, Any]) -> None:
+        """Store a value under the vector of text."""
+        vector, norm = _embed(text)
+        self._entries.append((scope, vector, norm, time.monotonic() + self.ttl_seconds, copy.deepcopy(value)))
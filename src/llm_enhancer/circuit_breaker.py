@@ -0,0 +1,82 @@
+"""Circuit breaker that short-circuits LLM calls while Bedrock is failing."""
+
+import logging
+import time
+from collections import deque
+from typing import Deque, Optional
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Rolling-window circuit breaker.
+
+    The breaker opens when the failure ratio over the last ``window_size``
+    outcomes reaches ``failure_ratio`` (once at least ``min_calls`` outcomes
+    are recorded). While open, callers skip the LLM and fall back straight
+    away. After ``fallback_duration`` seconds a single trial call is let
+    through (half-open): success closes the breaker, failure reopens it.
+    """
+
+    def __init__(self, failure_ratio: float = 0.3, fallback_duration: float = 10.0,
+                 window_size: int = 50, min_calls: int = 10):
+        """Initialize circuit breaker.
+
+        Args:
+            failure_ratio: Failure ratio over the window that opens the breaker
+            fallback_duration: Seconds to stay open before a trial call
+            window_size: Number of recent outcomes considered
+            min_calls: Minimum recorded outcomes before the breaker can open
+        """
+        self.failure_ratio = failure_ratio
+        self.fallback_duration = fallback_duration
+        self.min_calls = min_calls
+        self.state = CLOSED
+        self._outcomes: Deque[bool] = deque(maxlen=window_size)
+        self._opened_at: Optional[float] = None
+        self._trial_in_flight = False
+
+    def allow_request(self) -> bool:
+        """Return whether a call may go to the LLM now."""
+        if self.state == CLOSED:
+            return True
+
+        if self.state == OPEN and time.monotonic() - self._opened_at >= self.fallback_duration:
+            self.state = HALF_OPEN
+            self._trial_in_flight = False
+
+        if self.state == HALF_OPEN and not self._trial_in_flight:
+            self._trial_in_flight = True
+            return True
+        return False
+
+    def record_success(self) -> None:
+        """Record a successful LLM call."""
+        if self.state == HALF_OPEN:
+            logger.info("LLM circuit breaker closed after successful trial call")
+            self.state = CLOSED
+            self._outcomes.clear()
+        self._outcomes.append(True)
+
+    def record_failure(self) -> None:
+        """Record a failed LLM call, opening the breaker if the window is unhealthy."""
+        if self.state == HALF_OPEN:
+            self._open()
+            return
+
+        self._outcomes.append(False)
+        if self.state == CLOSED and len(self._outcomes) >= self.min_calls:
+            failures = self._outcomes.count(False)
+            if failures / len(self._outcomes) >= self.failure_ratio:
+                self._open()
+
+    def _open(self) -> None:
+        """Move to the open state."""
+        logger.warning(f"LLM circuit breaker opened, falling back for {self.fallback_duration}s")
+        self.state = OPEN
+        self._opened_at = time.monotonic()
+        self._trial_in_flight = False
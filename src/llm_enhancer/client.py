@@ -1,36 +1,245 @@
 """AWS Bedrock client wrapper for LLM integration."""
 
+import asyncio
+import functools
 import logging
-from typing import Dict, Any, Optional
-import json
+import random
+import string
+from typing import Dict, Any, List, Optional, AsyncIterator, Tuple
+import orjson
 from dotenv import load_dotenv
 
+# Import boto3 once at module load (it is slow to import); only the client is created lazily
+try:
+    import boto3
+    from botocore.config import Config
+    from botocore.exceptions import ClientError
+    _HAS_BOTO3 = True
+except ImportError:
+    boto3 = None
+    Config = None
+    _HAS_BOTO3 = False
+    
+    class ClientError(Exception):
+        """Placeholder so error handling still works without botocore installed."""
+
+from .rate_limiter import get_rate_limiter
+
 # Load environment variables
 load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+# orjson serializes prompt payloads several times faster than stdlib json;
+# compact output (no indentation) keeps whitespace out of the input tokens
+_PROMPT_JSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+# Keys that carry scraped markup or diagnostics rather than business facts
+_DROP_KEYS = frozenset({"raw_html", "html", "raw_content", "debug", "_source_headers", "screenshot"})
+
+# Longest string value sent to the model before it is truncated
+_MAX_FIELD_CHARS = 2000
+
+
+def _is_empty(value: Any) -> bool:
+    """Check whether a value adds nothing to the prompt."""
+    return value is None or (isinstance(value, (str, list, tuple, dict)) and not value)
+
+
+def _compact_payload(value: Any) -> Any:
+    """Drop empty and non-informative fields and cap long strings."""
+    if isinstance(value, dict):
+        compacted = {}
+        for key, item in value.items():
+            if key in _DROP_KEYS:
+                continue
+            item = _compact_payload(item)
+            if not _is_empty(item):
+                compacted[key] = item
+        return compacted
+    if isinstance(value, (list, tuple)):
+        items = (_compact_payload(item) for item in value)
+        return [item for item in items if not _is_empty(item)]
+    if isinstance(value, str) and len(value) > _MAX_FIELD_CHARS:
+        return value[:_MAX_FIELD_CHARS] + "…"
+    return value
+
+
+# Output token budget per request, and the ceiling for a combined batch request.
+# Generation latency grows with the output budget, so each analysis type gets a
+# cap sized to its report template (research has ten sections, profile five fields).
+_DEFAULT_MAX_TOKENS = 4096
+DEFAULT_MAX_TOKENS_BY_TYPE = {"research": 2000, "profile": 1000}
+_MAX_BATCH_OUTPUT_TOKENS = 32000
+
+# botocore retries the request itself (adaptive mode also rate-limits the client);
+# errors raised inside the response stream are retried here with full jitter.
+# A larger keep-alive pool lets concurrent analyses reuse TLS connections.
+@functools.lru_cache(maxsize=8)
+def build_botocore_config(max_pool_connections: int = 50, max_attempts: int = 8,
+                          read_timeout: float = 60, connect_timeout: float = 60) -> Optional["Config"]:
+    """Return the botocore Config for Bedrock clients.
+    
+    Configs are cached per argument set, so equal settings share one
+    object and therefore one shared BedrockClient.
+    """
+    if not _HAS_BOTO3:
+        return None
+    return Config(
+        retries={'max_attempts': max_attempts, 'mode': 'adaptive'},
+        max_pool_connections=max_pool_connections,
+        read_timeout=read_timeout,
+        connect_timeout=connect_timeout,
+        tcp_keepalive=True
+    )
+
+
+_MAX_STREAM_RETRIES = 3
+_RETRY_BASE_DELAY = 1.0
+_RETRY_MAX_DELAY = 32.0
+_RETRYABLE_ERROR_CODES = frozenset({
+    "ThrottlingException",
+    "ModelTimeoutException",
+    "ModelNotReadyException",
+    "ModelStreamErrorException",
+    "ServiceUnavailableException",
+    "InternalServerException",
+})
+
+# Prompt template fields and the raw_data section (with default) that fills each
+_PROMPT_SECTIONS = {
+    "research": {
+        "company_data": ("company", {}),
+        "data_sources": ("sources", []),
+        "research_data": ("research", {})
+    },
+    "profile": {
+        "company_profile": ("company", {}),
+        "business_analysis": ("analysis", {}),
+        "target_contact": ("contact", {})
+    }
+}
+
+# Retrieval mode: sections are fetched through a tool instead of inlined in the prompt
+_DATA_TOOL_NAME = "get_company_data"
+_DATA_TOOL_PLACEHOLDER = 'Call the {tool} tool with section "{section}" to read this data.'
+_MAX_TOOL_ROUNDS = 5
+
+# Bedrock prompt caching checkpoint; content before it is cached across calls
+_PROMPT_CACHE_POINT = {"cachePoint": {"type": "default"}}
+
+_BATCH_INSTRUCTIONS = (
+    "The following {count} requests are independent. Complete each one exactly as instructed, "
+    "then return ONLY a JSON array with one object per request, each with the keys "
+    "\"id\" (the request id) and \"content\" (the complete markdown output for that request).\n\n"
+)
+
+
+@functools.lru_cache(maxsize=32)
+def _compile_template(template: str) -> Optional[Tuple[Tuple[str, Optional[str]], ...]]:
+    """Split a prompt template into (literal_text, field_name) segments.
+    
+    Parsing happens once per template; rendering is then a plain join of
+    the static segments and the per-call values. Returns None for templates
+    using positional fields, conversions or format specs.
+    """
+    segments = []
+    for literal, field, spec, conversion in string.Formatter().parse(template):
+        if field is not None and (spec or conversion or not field.isidentifier()):
+            return None
+        segments.append((literal, field))
+    return tuple(segments)
+
+
+def _render_template(template: str, values: Dict[str, str]) -> str:
+    """Render a prompt template using its precompiled segments."""
+    segments = _compile_template(template)
+    if segments is None:
+        return template.format(**values)
+    
+    parts = []
+    for literal, field in segments:
+        parts.append(literal)
+        if field is not None:
+            parts.append(values[field])
+    return "".join(parts)
+
+
+def _to_prompt_json(value: Any) -> str:
+    """Serialize a compacted prompt payload section to JSON text."""
+    return orjson.dumps(_compact_payload(value), option=_PROMPT_JSON_OPTIONS).decode('utf-8')
+
 
 class BedrockClient:
     """AWS Bedrock client wrapper for Claude Sonnet integration using Converse API."""
     
-    def __init__(self, region: str = "ap-southeast-2", model_id: Optional[str] = None):
+    # Shared instances keyed by (region, model_id, latency_mode, data_tools_enabled, max_tokens,
+    # config, prompt_cache_enabled, temperature), see shared()
+    _shared_instances: Dict[Tuple[Any, ...], "BedrockClient"] = {}
+    
+    def __init__(self, region: str = "ap-southeast-2", model_id: Optional[str] = None,
+                 latency_mode: str = "standard", data_tools_enabled: bool = False,
+                 max_tokens_by_type: Optional[Dict[str, int]] = None,
+                 botocore_config: Optional["Config"] = None,
+                 prompt_cache_enabled: bool = False, temperature: float = 0.1):
         """Initialize Bedrock client.
         
         Args:
             region: AWS region for Bedrock service
             model_id: Model ID to use (default: Claude Sonnet)
+            latency_mode: Bedrock inference latency ("standard" or "optimized");
+                latency-optimized inference only exists for some models and
+                regions, so it is opt-in
+            data_tools_enabled: Let the model fetch payload sections through a tool
+                instead of inlining the full payload in the prompt
+            max_tokens_by_type: Output token caps per analysis type, merged
+                over the defaults
+            botocore_config: botocore Config for the boto3 client
+                (default: build_botocore_config())
+            prompt_cache_enabled: Mark the static prompt prefix as a Bedrock
+                prompt cache checkpoint
+            temperature: Sampling temperature for every request
         """
         self.region = region
         self.model_id = model_id or "apac.anthropic.claude-sonnet-4-20250514-v1:0"
+        self.latency_mode = latency_mode
+        self.data_tools_enabled = data_tools_enabled
+        self.max_tokens_by_type = {**DEFAULT_MAX_TOKENS_BY_TYPE, **(max_tokens_by_type or {})}
+        self.botocore_config = botocore_config or build_botocore_config()
+        self.prompt_cache_enabled = prompt_cache_enabled
+        self.temperature = temperature
+        self._rate_limiter = get_rate_limiter()
         self.bedrock_client = None
         self._prompts_cache = {}
         
+    @classmethod
+    def shared(cls, region: str = "ap-southeast-2", model_id: Optional[str] = None,
+               latency_mode: str = "standard", data_tools_enabled: bool = False,
+               max_tokens_by_type: Optional[Dict[str, int]] = None,
+               botocore_config: Optional["Config"] = None,
+               prompt_cache_enabled: bool = False, temperature: float = 0.1) -> "BedrockClient":
+        """Return the process-wide client for a region and model.
+        
+        Reusing one instance keeps a single boto3 client (and its connection
+        pool, credentials and loaded prompts) across middleware instances.
+        """
+        client = cls(region, model_id, latency_mode=latency_mode, data_tools_enabled=data_tools_enabled,
+                     max_tokens_by_type=max_tokens_by_type, botocore_config=botocore_config,
+                     prompt_cache_enabled=prompt_cache_enabled, temperature=temperature)
+        key = (client.region, client.model_id, client.latency_mode, client.data_tools_enabled,
+               tuple(sorted(client.max_tokens_by_type.items())), client.botocore_config,
+               client.prompt_cache_enabled, client.temperature)
+        return cls._shared_instances.setdefault(key, client)
+        
     async def initialize(self):
         """Initialize the AWS Bedrock client."""
         try:
-            import boto3
-            self.bedrock_client = boto3.client('bedrock-runtime', region_name=self.region)
+            if not _HAS_BOTO3:
+                raise ImportError("boto3 is required for AWS Bedrock integration")
+            # Client construction resolves credentials and loads service models; keep it off the event loop
+            self.bedrock_client = await asyncio.to_thread(
+                boto3.client, 'bedrock-runtime', region_name=self.region, config=self.botocore_config
+            )
             logger.info(f"Bedrock client initialized with model {self.model_id}")
             
             # Load prompts into cache
@@ -40,6 +249,16 @@ class BedrockClient:
             logger.error(f"Failed to initialize Bedrock client: {e}")
             raise
             
+    async def ping(self) -> bool:
+        """Check the Bedrock client is usable without making an inference call."""
+        try:
+            if not self.bedrock_client:
+                await self.initialize()
+            return True
+        except Exception as e:
+            logger.warning(f"Bedrock ping failed: {e}")
+            return False
+            
     async def _load_prompts(self):
         """Load prompt templates from files."""
         import os
@@ -55,14 +274,19 @@ class BedrockClient:
         for key, filename in prompt_files.items():
             try:
                 filepath = os.path.join(prompts_dir, filename)
-                with open(filepath, 'r', encoding='utf-8') as f:
-                    self._prompts_cache[key] = f.read()
+                self._prompts_cache[key] = await asyncio.to_thread(self._read_prompt_file, filepath)
                 logger.debug(f"Loaded prompt template: {key}")
             except Exception as e:
                 logger.error(f"Failed to load prompt {key}: {e}")
                 # Fallback to basic prompts if files not available
                 self._prompts_cache[key] = f"# {key.replace('_', ' ').title()}\nPlease analyze the provided data."
             
+    @staticmethod
+    def _read_prompt_file(filepath: str) -> str:
+        """Read a prompt template file (blocking; run via asyncio.to_thread)."""
+        with open(filepath, 'r', encoding='utf-8') as f:
+            return f.read()
+            
     async def analyze_research_data(self, raw_data: Dict[str, Any], analysis_type: str = "research") -> Dict[str, Any]:
         """Analyze research data using Claude Converse API.
         
@@ -81,7 +305,15 @@ class BedrockClient:
             system_prompt, user_prompt = self._prepare_prompts(raw_data, analysis_type)
             
             # Call Bedrock Converse API
-            response = await self._call_converse_api(system_prompt, user_prompt)
+            if self.data_tools_enabled:
+                response = await self._call_converse_with_tools(
+                    system_prompt, user_prompt, raw_data, analysis_type,
+                    max_tokens=self._max_tokens_for(analysis_type)
+                )
+            else:
+                response = await self._call_converse_api(
+                    system_prompt, user_prompt, max_tokens=self._max_tokens_for(analysis_type)
+                )
             
             # Parse and structure response
             structured_response = self._parse_llm_response(response, analysis_type)
@@ -94,85 +326,318 @@ class BedrockClient:
         except Exception as e:
             logger.error(f"LLM analysis failed: {e}")
             # Return fallback response structure
-            return {
-                "analysis": {"error": str(e)},
-                "enhancement_status": "error",
-                "source": "bedrock_claude",
-                "fallback": True
-            }
+            return self._error_response(str(e))
             
-    def _prepare_prompts(self, raw_data: Dict[str, Any], analysis_type: str) -> tuple[str, str]:
-        """Prepare system and user prompts for analysis."""
-        if analysis_type == "research":
-            system_prompt = self._prompts_cache.get("research_system", "")
-            user_template = self._prompts_cache.get("research_user", "")
-            
-            # Format user prompt with data
-            user_prompt = user_template.format(
-                company_data=json.dumps(raw_data.get("company", {}), indent=2),
-                data_sources=json.dumps(raw_data.get("sources", []), indent=2), 
-                research_data=json.dumps(raw_data.get("research", {}), indent=2)
-            )
+    async def analyze_research_batch(self, raw_data_items: List[Dict[str, Any]], analysis_type: str = "research") -> List[Dict[str, Any]]:
+        """Analyze several payloads in a single Converse request.
+        
+        The system prompt is sent once and each payload's user prompt is
+        wrapped as a numbered request; the model returns a JSON array that
+        is split back into one result per payload.
+        
+        Args:
+            raw_data_items: Payloads to analyze, in order
+            analysis_type: Type of analysis (research, profile)
             
-        elif analysis_type == "profile":
-            system_prompt = self._prompts_cache.get("profile_system", "")
-            user_template = self._prompts_cache.get("profile_user", "")
+        Returns:
+            List of analysis results, one per payload in the same order
+        """
+        if not self.bedrock_client:
+            await self.initialize()
             
-            # Format user prompt with data
-            user_prompt = user_template.format(
-                company_profile=json.dumps(raw_data.get("company", {}), indent=2),
-                business_analysis=json.dumps(raw_data.get("analysis", {}), indent=2),
-                target_contact=json.dumps(raw_data.get("contact", {}), indent=2)
+        try:
+            system_prompt = ""
+            user_prompts = []
+            for raw_data in raw_data_items:
+                system_prompt, user_prompt = self._prepare_prompts(raw_data, analysis_type)
+                user_prompts.append(user_prompt)
+                
+            max_tokens = min(
+                self._max_tokens_for(analysis_type) * len(user_prompts), _MAX_BATCH_OUTPUT_TOKENS
+            )
+            response = await self._call_converse_api(
+                system_prompt, self._build_batch_prompt(user_prompts), max_tokens=max_tokens
             )
+            contents = self._split_batch_response(response, len(user_prompts))
             
-        else:
+        except Exception as e:
+            logger.error(f"Batched LLM analysis failed: {e}")
+            return [self._error_response(str(e)) for _ in raw_data_items]
+            
+        results = []
+        for content in contents:
+            if content is None:
+                results.append(self._error_response("Missing from batched response"))
+                continue
+            structured_response = self._parse_llm_response(content, analysis_type)
+            structured_response['llm_model'] = self.model_id
+            structured_response['analysis_type'] = analysis_type
+            structured_response['batch_size'] = len(user_prompts)
+            results.append(structured_response)
+            
+        logger.info(f"Batched LLM analysis completed for {len(user_prompts)} {analysis_type} requests")
+        return results
+        
+    @staticmethod
+    def _build_batch_prompt(user_prompts: List[str]) -> str:
+        """Combine individual user prompts into one batched prompt."""
+        parts = [_BATCH_INSTRUCTIONS.format(count=len(user_prompts))]
+        for request_id, user_prompt in enumerate(user_prompts):
+            parts.append(f'<request id="{request_id}">\n{user_prompt}\n</request>\n\n')
+        return "".join(parts)
+        
+    @staticmethod
+    def _split_batch_response(response: str, count: int) -> List[Optional[str]]:
+        """Split a batched JSON array response into per-request contents."""
+        start, end = response.find('['), response.rfind(']')
+        if start == -1 or end < start:
+            raise ValueError("Batched response did not contain a JSON array")
+            
+        contents: List[Optional[str]] = [None] * count
+        for item in orjson.loads(response[start:end + 1]):
+            if not isinstance(item, dict):
+                continue
+            request_id = item.get('id')
+            if isinstance(request_id, str) and request_id.isdigit():
+                request_id = int(request_id)
+            if isinstance(request_id, int) and 0 <= request_id < count:
+                contents[request_id] = item.get('content')
+        return contents
+        
+    @staticmethod
+    def _error_response(message: str) -> Dict[str, Any]:
+        """Build the fallback response structure for a failed analysis."""
+        return {
+            "analysis": {"error": message},
+            "enhancement_status": "error",
+            "source": "bedrock_claude",
+            "fallback": True
+        }
+            
+    def _performance_config(self) -> Dict[str, Any]:
+        """Return the Converse performanceConfig argument for the latency mode.
+        
+        Standard latency is the service default, so the argument is only
+        sent when latency-optimized inference is requested.
+        """
+        if self.latency_mode == "optimized":
+            return {"performanceConfig": {"latency": "optimized"}}
+        return {}
+        
+    def _max_tokens_for(self, analysis_type: str) -> int:
+        """Return the output token cap for an analysis type."""
+        return self.max_tokens_by_type.get(analysis_type, _DEFAULT_MAX_TOKENS)
+        
+    def _system_blocks(self, system_prompt: str) -> List[Dict[str, Any]]:
+        """Build Converse system content, checkpointing it for prompt caching."""
+        if not system_prompt:
+            return []
+        if self.prompt_cache_enabled:
+            return [{"text": system_prompt}, _PROMPT_CACHE_POINT]
+        return [{"text": system_prompt}]
+        
+    def _prepare_prompts(self, raw_data: Dict[str, Any], analysis_type: str) -> tuple[str, str]:
+        """Prepare system and user prompts for analysis."""
+        sections = _PROMPT_SECTIONS.get(analysis_type)
+        if sections is None:
             raise ValueError(f"Unknown analysis type: {analysis_type}")
             
+        system_prompt = self._prompts_cache.get(f"{analysis_type}_system", "")
+        user_template = self._prompts_cache.get(f"{analysis_type}_user", "")
+        
+        # Format user prompt with data, or with tool pointers in retrieval mode
+        if self.data_tools_enabled:
+            values = {
+                field: _DATA_TOOL_PLACEHOLDER.format(tool=_DATA_TOOL_NAME, section=section)
+                for field, (section, _) in sections.items()
+            }
+        else:
+            values = {
+                field: _to_prompt_json(raw_data.get(section, default))
+                for field, (section, default) in sections.items()
+            }
+        user_prompt = _render_template(user_template, values)
+            
         return system_prompt, user_prompt
         
-    async def _call_converse_api(self, system_prompt: str, user_prompt: str) -> str:
-        """Make API call to Bedrock Converse API following best practices."""
+    async def analyze_research_data_stream(self, raw_data: Dict[str, Any], analysis_type: str = "research") -> AsyncIterator[str]:
+        """Stream LLM analysis text as it is generated.
+        
+        Args:
+            raw_data: Raw data from all sources
+            analysis_type: Type of analysis (research, profile)
+            
+        Yields:
+            Markdown text deltas in generation order
+        """
+        if not self.bedrock_client:
+            await self.initialize()
+            
+        system_prompt, user_prompt = self._prepare_prompts(raw_data, analysis_type)
+        async for chunk in self._stream_converse_api(
+            system_prompt, user_prompt, self._max_tokens_for(analysis_type)
+        ):
+            yield chunk
+            
+    async def _call_converse_api(self, system_prompt: str, user_prompt: str,
+                                 max_tokens: int = _DEFAULT_MAX_TOKENS) -> str:
+        """Make API call to Bedrock Converse API and return the full response text."""
         try:
-            # Prepare inference configuration following best practices
-            inference_config = {
-                "temperature": 0.1,  # Low temperature for consistent analysis
-                "maxTokens": 4096,   # Sufficient for detailed analysis
-                "topP": 0.9          # Focused but not too restrictive
-            }
+            chunks = [chunk async for chunk in self._stream_converse_api(system_prompt, user_prompt, max_tokens)]
+            return "".join(chunks)
             
-            # Prepare system prompts (array format for Converse API)
-            system_prompts = [{"text": system_prompt}] if system_prompt else []
+        except Exception as e:
+            logger.error(f"Bedrock Converse API call failed: {e}")
+            raise
             
-            # Prepare messages (must start with user role and alternate)
-            messages = [
-                {
-                    "role": "user",
-                    "content": [{"text": user_prompt}]
+    async def _call_converse_with_tools(self, system_prompt: str, user_prompt: str,
+                                        raw_data: Dict[str, Any], analysis_type: str,
+                                        max_tokens: int = _DEFAULT_MAX_TOKENS) -> str:
+        """Run a Converse tool loop that serves raw_data sections on request.
+        
+        The prompt only names the available sections, so it stays identical
+        across companies; the model pulls the sections it needs through the
+        get_company_data tool.
+        """
+        sections = [section for section, _ in _PROMPT_SECTIONS[analysis_type].values()]
+        tool_config = {
+            "tools": [{
+                "toolSpec": {
+                    "name": _DATA_TOOL_NAME,
+                    "description": "Return one section of the collected prospect data as JSON.",
+                    "inputSchema": {
+                        "json": {
+                            "type": "object",
+                            "properties": {
+                                "section": {"type": "string", "enum": sections}
+                            },
+                            "required": ["section"]
+                        }
+                    }
                 }
-            ]
-            
-            # Make the API call using Converse API
-            response = self.bedrock_client.converse(
+            }]
+        }
+        system_prompts = self._system_blocks(system_prompt)
+        # Without inlined data the user prompt is static too, so it joins the cached prefix
+        user_content = [{"text": user_prompt}]
+        if self.prompt_cache_enabled:
+            user_content.append(_PROMPT_CACHE_POINT)
+        messages = [{"role": "user", "content": user_content}]
+        inference_config = {"temperature": self.temperature, "maxTokens": max_tokens, "topP": 0.9}
+        
+        for _ in range(_MAX_TOOL_ROUNDS):
+            await self._rate_limiter.acquire(len(str(messages)) // 4 + max_tokens)
+            response = await asyncio.to_thread(
+                self.bedrock_client.converse,
                 modelId=self.model_id,
                 messages=messages,
                 system=system_prompts,
-                inferenceConfig=inference_config
+                inferenceConfig=inference_config,
+                toolConfig=tool_config,
+                **self._performance_config()
             )
-            
-            # Extract the response text
             output_message = response['output']['message']
-            response_text = output_message['content'][0]['text']
-            
-            # Log token usage for monitoring
-            usage = response.get('usage', {})
-            logger.info(f"Bedrock API call completed. Tokens - Input: {usage.get('inputTokens', 0)}, Output: {usage.get('outputTokens', 0)}")
+            messages.append(output_message)
             
-            return response_text
+            if response.get('stopReason') != 'tool_use':
+                return "".join(block.get('text', '') for block in output_message['content'])
+                
+            tool_results = []
+            for block in output_message['content']:
+                tool_use = block.get('toolUse')
+                if not tool_use:
+                    continue
+                section = tool_use.get('input', {}).get('section')
+                if section in sections:
+                    result = {"toolUseId": tool_use['toolUseId'],
+                              "content": [{"text": _to_prompt_json(raw_data.get(section, {}))}]}
+                else:
+                    result = {"toolUseId": tool_use['toolUseId'], "status": "error",
+                              "content": [{"text": f"Unknown section: {section}"}]}
+                tool_results.append({"toolResult": result})
+            messages.append({"role": "user", "content": tool_results})
             
-        except Exception as e:
-            logger.error(f"Bedrock Converse API call failed: {e}")
-            raise
+        raise RuntimeError(f"Model did not finish within {_MAX_TOOL_ROUNDS} tool rounds")
+        
+    async def _stream_converse_api(self, system_prompt: str, user_prompt: str,
+                                   max_tokens: int = _DEFAULT_MAX_TOKENS) -> AsyncIterator[str]:
+        """Call Bedrock ConverseStream API following best practices, yielding text deltas."""
+        # Prepare inference configuration following best practices
+        inference_config = {
+            "temperature": self.temperature,  # Configured sampling temperature
+            "maxTokens": max_tokens,          # Sufficient for detailed analysis
+            "topP": 0.9                       # Focused but not too restrictive
+        }
+        
+        # Prepare system prompts (array format for Converse API)
+        system_prompts = self._system_blocks(system_prompt)
+        
+        # Prepare messages (must start with user role and alternate)
+        messages = [
+            {
+                "role": "user",
+                "content": [{"text": user_prompt}]
+            }
+        ]
+        
+        # Rough token estimate (~4 characters per token) for the shared rate limiter
+        estimated_tokens = (len(system_prompt) + len(user_prompt)) // 4 + max_tokens
+        
+        for attempt in range(_MAX_STREAM_RETRIES + 1):
+            yielded = False
+            try:
+                await self._rate_limiter.acquire(estimated_tokens)
+                
+                # Make the API call using ConverseStream so the first tokens arrive early;
+                # boto3 is synchronous, so the request runs in a worker thread
+                response = await asyncio.to_thread(
+                    self.bedrock_client.converse_stream,
+                    modelId=self.model_id,
+                    messages=messages,
+                    system=system_prompts,
+                    inferenceConfig=inference_config,
+                    **self._performance_config()
+                )
+                
+                # The event stream is a blocking iterator over the HTTP body, so pull
+                # each event in a worker thread to keep the event loop responsive
+                events = iter(response['stream'])
+                usage = {}
+                while True:
+                    event = await asyncio.to_thread(next, events, None)
+                    if event is None:
+                        break
+                    if 'contentBlockDelta' in event:
+                        text = event['contentBlockDelta'].get('delta', {}).get('text')
+                        if text:
+                            yielded = True
+                            yield text
+                    elif 'metadata' in event:
+                        usage = event['metadata'].get('usage', {})
+                break
+                
+            except ClientError as e:
+                # Partial output cannot be replayed, so only retry before the first delta
+                if yielded or attempt == _MAX_STREAM_RETRIES or not self._is_retryable(e):
+                    raise
+                delay = random.uniform(0, min(_RETRY_MAX_DELAY, _RETRY_BASE_DELAY * 2 ** attempt))
+                logger.warning(f"Retryable Bedrock error ({e}), retrying in {delay:.2f}s "
+                               f"(attempt {attempt + 1}/{_MAX_STREAM_RETRIES})")
+                await asyncio.sleep(delay)
+        
+        # Log token usage for monitoring
+        logger.info(f"Bedrock API call completed. Tokens - Input: {usage.get('inputTokens', 0)}, Output: {usage.get('outputTokens', 0)}, "
+                    f"Cache read: {usage.get('cacheReadInputTokens', 0)}, Cache write: {usage.get('cacheWriteInputTokens', 0)}")
             
+    @staticmethod
+    def _is_retryable(error: ClientError) -> bool:
+        """Check whether a Bedrock error is transient (throttling, timeouts, 5xx)."""
+        code = error.response.get('Error', {}).get('Code', '')
+        # Errors raised from the event stream use lowerCamelCase codes
+        code = code[:1].upper() + code[1:]
+        status = error.response.get('ResponseMetadata', {}).get('HTTPStatusCode', 0)
+        return code in _RETRYABLE_ERROR_CODES or status >= 500
+        
     def _parse_llm_response(self, response: str, analysis_type: str) -> Dict[str, Any]:
         """Parse and structure LLM response for markdown output."""
         # For research and profile, we expect markdown output following templates
@@ -0,0 +1,39 @@
+"""Prometheus metrics for LLM enhancement.
+
+prometheus_client is optional; without it the metrics below are no-ops.
+"""
+
+try:
+    from prometheus_client import Counter, Histogram
+    _HAS_PROMETHEUS = True
+except ImportError:
+    _HAS_PROMETHEUS = False
+
+
+class _NoopMetric:
+    """Stand-in for a labelled metric when prometheus_client is not installed."""
+
+    def labels(self, *args, **kwargs) -> "_NoopMetric":
+        return self
+
+    def inc(self, amount: float = 1) -> None:
+        pass
+
+    def observe(self, value: float) -> None:
+        pass
+
+
+if _HAS_PROMETHEUS:
+    CACHE_HITS = Counter(
+        'llm_cache_hits_total', 'LLM enhancements served from cache', ['op', 'tier']
+    )
+    BEDROCK_LATENCY = Histogram(
+        'llm_bedrock_seconds', 'Latency of successful LLM analyzer calls', ['op', 'model']
+    )
+    FALLBACK_REASONS = Counter(
+        'llm_fallback_total', 'Manual fallbacks by operation and reason', ['op', 'reason']
+    )
+else:
+    CACHE_HITS = _NoopMetric()
+    BEDROCK_LATENCY = _NoopMetric()
+    FALLBACK_REASONS = _NoopMetric()
@@ -1,38 +1,399 @@
 """Intelligence middleware coordinator for LLM enhancement."""
 
+import asyncio
+import copy
 import logging
-from typing import Dict, Any, Optional
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from hashlib import blake2b
+from types import MappingProxyType
+from typing import Awaitable, Callable, Deque, Dict, Any, Iterator, List, Optional, Tuple
 
-from .client import BedrockClient
+import orjson
+
+from .client import BedrockClient, DEFAULT_MAX_TOKENS_BY_TYPE, build_botocore_config
+from .batching import BatchingClient
+from .cache import LLMCache, SemanticCache
+from .circuit_breaker import CircuitBreaker
+from .metrics import CACHE_HITS, BEDROCK_LATENCY, FALLBACK_REASONS
+from .rate_limiter import get_rate_limiter
 from .analyzers import ResearchAnalyzer, ProfileAnalyzer
 
 logger = logging.getLogger(__name__)
 
+# Canonical serialization for cache keys: sorted keys, tolerant of non-str keys
+# and non-JSON values, hashed with a 128-bit BLAKE2b digest
+_CACHE_KEY_JSON_OPTIONS = orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+
+# Result handed to callers joined on an in-flight enhancement whose own caller
+# was cancelled; they retry instead of inheriting the cancellation
+_LEADER_CANCELLED = object()
+
+# Manual fallbacks scan large payloads synchronously, so they run off the event
+# loop in one pool shared by every middleware instance; threads start on demand
+_FALLBACK_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix='llm-fallback')
+
+# Analyzer result statuses that count as a failed LLM call for the circuit breaker
+_FAILED_ENHANCEMENT_STATUSES = frozenset({'error', 'manual_fallback'})
+
+# Per-run bookkeeping in collected research data; ignored when comparing payloads
+_SEMANTIC_IGNORED_KEYS = frozenset({
+    'timestamp', 'errors', 'successful_sources', 'failed_sources',
+    'source_metadata', 'performance_metrics'
+})
+
+# Keyword tables for the rule-based fallback as (lowercased keyword, label) pairs,
+# built once at import; matched against a corpus that is already lowercased
+_TECH_KEYWORDS = tuple((name.lower(), name) for name in (
+    'Python', 'JavaScript', 'React', 'Node.js', 'AWS', 'Azure', 'Google Cloud',
+    'Docker', 'Kubernetes', 'MongoDB', 'PostgreSQL', 'MySQL', 'Redis',
+    'AI', 'Machine Learning', 'API', 'REST', 'GraphQL', 'Microservices'
+))
+
+_CHALLENGE_KEYWORDS = (
+    ('scaling', "Scaling challenges"),
+    ('growth', "Growth management"),
+    ('efficiency', "Operational efficiency"),
+    ('automation', "Process automation needs"),
+    ('digital transformation', "Digital transformation"),
+    ('cloud migration', "Cloud migration"),
+    ('security', "Security concerns"),
+    ('compliance', "Compliance requirements"),
+    ('customer acquisition', "Customer acquisition"),
+    ('retention', "Customer retention")
+)
+
+
+# Tech and challenge keywords merged into one table of (keyword, field, label) so
+# the corpus is scanned once for both fields; table order is kept per field
+_CORPUS_KEYWORDS = tuple(
+    (keyword, field, label)
+    for field, table in (('technology_stack', _TECH_KEYWORDS), ('pain_points', _CHALLENGE_KEYWORDS))
+    for keyword, label in table
+)
+
+
+# Business model indicators in priority order; the first match wins
+_BUSINESS_MODEL_KEYWORDS = (
+    (('saas', 'software as a service'), "SaaS"),
+    (('marketplace',), "Marketplace"),
+    (('consulting',), "Consulting Services"),
+    (('ecommerce', 'e-commerce'), "E-commerce"),
+    (('manufacturing',), "Manufacturing")
+)
+
+
+# Conversation starter rules per starter: (company name default, [(keywords, template)],
+# default template). The first rule with any keyword in the research content wins.
+_STARTER_RULES = (
+    ('your company', (
+        (('ai', 'artificial intelligence'),
+         "I noticed {company_name} is exploring AI initiatives. What's driving your current AI strategy?"),
+        (('cloud', 'aws', 'azure'),
+         "How is {company_name} approaching your cloud transformation journey?"),
+        (('growth', 'scaling'),
+         "What are the biggest challenges {company_name} is facing as you scale?"),
+        (('automation',),
+         "I see {company_name} is focused on automation. Which processes are you looking to streamline?")
+    ), "What are the key business priorities driving {company_name}'s technology decisions right now?"),
+    ('your organization', (
+        (('security', 'compliance'),
+         "How is {company_name} balancing innovation with security and compliance requirements?"),
+        (('customer', 'user'),
+         "What's {company_name}'s approach to enhancing customer experience through technology?"),
+        (('data', 'analytics'),
+         "How is {company_name} leveraging data to drive business decisions?")
+    ), "What technology investments is {company_name} prioritizing this year?"),
+    ('your team', (
+        (('efficiency', 'productivity'),
+         "What operational efficiency gains is {company_name} targeting?"),
+        (('integration', 'api'),
+         "How is {company_name} handling system integration challenges?"),
+        (('remote', 'distributed'),
+         "How has {company_name} adapted your technology stack for distributed teams?")
+    ), "What's the biggest technology challenge {company_name} is looking to solve?")
+)
+
+# Timing recommendation rules; the first rule with any keyword in the content wins
+_TIMING_RULES = (
+    (('funding', 'investment'),
+     "Strong timing - recent funding suggests active investment in technology solutions"),
+    (('hiring', 'jobs'),
+     "Optimal timing - active hiring indicates growth phase and technology expansion"),
+    (('q4', 'budget'),
+     "Strategic timing - budget planning season suggests procurement readiness"),
+    (('launch', 'product'),
+     "Perfect timing - product development phase indicates need for supporting technology")
+)
+_DEFAULT_TIMING = "Good timing - company appears in active growth and technology adoption phase"
+
+
+# String fields longer than this (raw HTML, page dumps) are left out of keyword corpora
+_MAX_CORPUS_FIELD_CHARS = 10_000
+
+
+def _iter_text(value: Any) -> Iterator[str]:
+    """Yield the string leaves of a nested payload, skipping oversized blobs."""
+    if isinstance(value, str):
+        if len(value) < _MAX_CORPUS_FIELD_CHARS:
+            yield value
+    elif isinstance(value, dict):
+        for item in value.values():
+            yield from _iter_text(item)
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            yield from _iter_text(item)
+
+
+# Serialized size above which a research payload list is cut to its head and tail
+# before it reaches the analyzer; scraped dumps otherwise dominate input tokens.
+# Long strings are capped once, by the client (client._compact_payload).
+_DEFAULT_MAX_FIELD_CHARS = 8000
+
+# Suffix of the sibling field recording how many items were cut from a list
+_OMITTED_ITEMS_SUFFIX = "_omitted_items"
+
+
+def _serialized_size(value: Any) -> int:
+    """Return the length of value serialized as compact JSON."""
+    return len(orjson.dumps(value, default=str, option=orjson.OPT_NON_STR_KEYS))
+
+
+def _compact_field(value: Any, limit: int) -> Tuple[Any, bool]:
+    """Cut oversized lists to their head and tail.
+    
+    Lists keep as many leading and trailing items as fit in half the limit
+    each. The list only ever holds data; when it sits under a dict key, the
+    number of items cut is recorded next to it in ``<key>_omitted_items``.
+    Returns the (possibly) compacted value and whether anything was cut;
+    values that fit are returned unchanged.
+    """
+    if isinstance(value, dict):
+        compacted, truncated = {}, False
+        for key, item in value.items():
+            if isinstance(item, (list, tuple)):
+                compacted[key], omitted, item_truncated = _compact_list(item, limit)
+                if omitted:
+                    compacted[f"{key}{_OMITTED_ITEMS_SUFFIX}"] = omitted
+            else:
+                compacted[key], item_truncated = _compact_field(item, limit)
+            truncated = truncated or item_truncated
+        return (compacted if truncated else value), truncated
+    
+    if isinstance(value, (list, tuple)):
+        items, _, truncated = _compact_list(value, limit)
+        return items, truncated
+    
+    return value, False
+
+
+def _compact_list(value: Any, limit: int) -> Tuple[Any, int, bool]:
+    """Cut an oversized list to its head and tail.
+    
+    Returns the (possibly) compacted list, the number of items cut and
+    whether anything was cut, including inside the kept leading items.
+    """
+    if _serialized_size(value) <= limit:
+        return value, 0, False
+    half = limit // 2
+    sizes = [_serialized_size(item) for item in value]
+    
+    head_end, used = 0, 0
+    while head_end < len(value) and (head_end == 0 or used + sizes[head_end] <= half):
+        used += sizes[head_end]
+        head_end += 1
+    tail_start, used = len(value), 0
+    while tail_start > head_end and used + sizes[tail_start - 1] <= half:
+        tail_start -= 1
+        used += sizes[tail_start]
+    
+    items, truncated = [], False
+    for item in value[:head_end]:
+        item, item_truncated = _compact_field(item, limit)
+        items.append(item)
+        truncated = truncated or item_truncated
+    items.extend(value[tail_start:])
+    omitted = tail_start - head_end
+    return items, omitted, truncated or omitted > 0
+
+
+def _first_rule_match(content: str, rules: Tuple[Tuple[Tuple[str, ...], str], ...]) -> Optional[str]:
+    """Return the template of the first rule with any keyword in content."""
+    for keywords, template in rules:
+        if any(keyword in content for keyword in keywords):
+            return template
+    return None
+
+
+def _match_corpus_keywords(content: str) -> Dict[str, List[str]]:
+    """Return the labels of ``_CORPUS_KEYWORDS`` found in content, grouped by field."""
+    hits: Dict[str, List[str]] = {'technology_stack': [], 'pain_points': []}
+    for keyword, field, label in _CORPUS_KEYWORDS:
+        if keyword in content:
+            hits[field].append(label)
+    return hits
+
+
+@dataclass(slots=True)
+class ResearchContext:
+    """Inputs to the rule-based research fallback, normalized once per invocation.
+    
+    Extractors read the structured sources from ``data`` and scan the
+    lowercased ``corpus`` of all source text.
+    """
+    data: Dict[str, Any]
+    corpus: str
+
+
+@dataclass(slots=True)
+class ProfileContext:
+    """Inputs to the rule-based profile fallback, normalized once per invocation.
+    
+    ``company_name`` is None when the research data has none, so each
+    generator can apply its own default; ``content`` is lowercased.
+    """
+    company_name: Optional[str]
+    content: str
+
+
+# Static fields of the rule-based fallback responses, built once at import
+_MANUAL_RESEARCH_TEMPLATE = MappingProxyType({
+    "enhancement_status": "manual_processing",
+    "fallback_reason": "LLM unavailable or failed",
+    "processing_mode": "rule-based"
+})
+
+_MANUAL_PROFILE_TEMPLATE = MappingProxyType({
+    "enhancement_status": "manual_processing",
+    "fallback_reason": "LLM unavailable or failed",
+    "processing_mode": "rule-based",
+    "personalization_level": "basic"
+})
+
 
 class LLMMiddleware:
     """Intelligence middleware coordinator for LLM enhancement."""
     
-    def __init__(self, config: Optional[Dict[str, Any]] = None):
+    def __init__(self, config: Optional[Dict[str, Any]] = None, cache: Optional[LLMCache] = None):
         """Initialize LLM middleware.
         
         Args:
             config: Configuration dictionary with LLM settings
+            cache: Response cache (default: in-process LRU sized from config)
         """
         config = config or {}
         
         self.enabled = config.get('llm_enabled', True)
         self.model_id = config.get('model_id', 'apac.anthropic.claude-sonnet-4-20250514-v1:0')
+        # Models to try in order; the first is the primary model
+        self.model_chain = list(config.get('model_chain') or [self.model_id])
+        self.model_id = self.model_chain[0]
         self.region = config.get('aws_region', 'ap-southeast-2')
+        # 'optimized' only works for models and regions with latency-optimized inference
+        self.latency_mode = config.get('latency_mode', 'standard')
         self.temperature = config.get('temperature', 0.3)
-        self.max_tokens = config.get('max_tokens', 4000)
+        self.max_tokens_by_type = self._resolve_max_tokens(config.get('max_tokens'))
         self.timeout_seconds = config.get('timeout_seconds', 60)
+        self.min_timeout_seconds = config.get('min_timeout_seconds', 5)
+        self.max_concurrency = config.get('max_concurrency', 20)
+        self.health_check_ttl_seconds = config.get('health_check_ttl_seconds', 5)
+        self.adaptive_timeout_min_samples = config.get('adaptive_timeout_min_samples', 20)
         self.fallback_mode = config.get('fallback_mode', 'graceful')
+        self.cache_enabled = config.get('cache_enabled', True)
+        self.cache_ttl_seconds = config.get('cache_ttl_seconds', 3600)
+        self.cache_max_entries = config.get('cache_max_entries', 1000)
+        self.batch_enabled = config.get('batch_enabled', False)
+        self.batch_max_size = config.get('batch_max_size', 8)
+        self.batch_max_wait_seconds = config.get('batch_max_wait_seconds', 0.05)
+        self.data_tools_enabled = config.get('data_tools_enabled', False)
+        self.semantic_cache_enabled = config.get('semantic_cache_enabled', False)
+        self.prompt_cache_enabled = config.get('prompt_cache', True)
+        self.max_field_chars = config.get('max_field_chars', _DEFAULT_MAX_FIELD_CHARS)
+        
+        if self.batch_enabled and self.data_tools_enabled:
+            # Batched prompts must inline every payload, so they cannot use tool retrieval
+            logger.warning("batch_enabled is ignored when data_tools_enabled is set")
+            self.batch_enabled = False
+        
+        # The Bedrock rate limiter is process-wide; only reconfigure it when asked to
+        if 'rate_limit_tokens_per_sec' in config:
+            get_rate_limiter().configure(
+                config['rate_limit_tokens_per_sec'], config.get('rate_limit_burst')
+            )
+        
+        # Exact-match response cache shared by research and profile enhancement
+        self.cache = cache if cache is not None else LLMCache(self.cache_max_entries, self.cache_ttl_seconds)
+        
+        # Optional near-duplicate tier for research payloads that miss the exact cache
+        self.semantic_cache = None
+        if self.semantic_cache_enabled:
+            self.semantic_cache = SemanticCache(
+                config.get('semantic_cache_max_entries', 500),
+                config.get('semantic_cache_threshold', 0.92),
+                self.cache_ttl_seconds
+            )
+        
+        # Recent successful call latencies per operation, used to adapt timeouts
+        self._latency: Dict[str, Deque[float]] = {
+            'research': deque(maxlen=200),
+            'profile': deque(maxlen=200)
+        }
+        
+        # Skip the LLM entirely while Bedrock is failing instead of waiting out timeouts
+        self.circuit_breaker = CircuitBreaker(
+            failure_ratio=config.get('circuit_failure_ratio', 0.3),
+            fallback_duration=config.get('circuit_fallback_duration', 10),
+            window_size=config.get('circuit_window_size', 50),
+            min_calls=config.get('circuit_min_calls', 10)
+        )
+        
+        # Last health check result as (checked_at, status), reused by frequent probes
+        self._health_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+        
+        # Single-flight: identical concurrent requests share one in-flight analysis
+        self._inflight: Dict[str, asyncio.Future] = {}
         
         # Initialize components with error handling
         try:
-            self.bedrock_client = BedrockClient(self.region, self.model_id)
-            self.research_analyzer = ResearchAnalyzer(self.bedrock_client)
-            self.profile_analyzer = ProfileAnalyzer(self.bedrock_client)
+            # One connection pool sized for our concurrency; few botocore retries since the
+            # model chain, circuit breaker and manual fallback handle persistent failures
+            self.botocore_config = build_botocore_config(
+                max_pool_connections=max(10, self.max_concurrency),
+                max_attempts=config.get('bedrock_max_attempts', 2),
+                read_timeout=self.timeout_seconds,
+                connect_timeout=5
+            )
+            self.bedrock_client = BedrockClient.shared(
+                self.region, self.model_id, latency_mode=self.latency_mode,
+                data_tools_enabled=self.data_tools_enabled,
+                max_tokens_by_type=self.max_tokens_by_type, botocore_config=self.botocore_config,
+                prompt_cache_enabled=self.prompt_cache_enabled, temperature=self.temperature
+            )
+            
+            # Optionally coalesce concurrent requests into batched Bedrock calls
+            analyzer_client = self.bedrock_client
+            if self.batch_enabled:
+                analyzer_client = BatchingClient(
+                    self.bedrock_client, self.batch_max_size, self.batch_max_wait_seconds
+                )
+            
+            self.research_analyzer = ResearchAnalyzer(analyzer_client)
+            self.profile_analyzer = ProfileAnalyzer(analyzer_client)
+            
+            # Fallback models are only used after the primary fails, so they skip batching
+            self._fallback_analyzers = []
+            for model_id in self.model_chain[1:]:
+                fallback_client = BedrockClient.shared(
+                    self.region, model_id, latency_mode=self.latency_mode,
+                    data_tools_enabled=self.data_tools_enabled,
+                    max_tokens_by_type=self.max_tokens_by_type, botocore_config=self.botocore_config,
+                    prompt_cache_enabled=self.prompt_cache_enabled, temperature=self.temperature
+                )
+                self._fallback_analyzers.append(
+                    (model_id, ResearchAnalyzer(fallback_client), ProfileAnalyzer(fallback_client))
+                )
             self._llm_available = True
             logger.info("LLM middleware initialized successfully")
         except Exception as e:
@@ -40,30 +401,68 @@ class LLMMiddleware:
             self.bedrock_client = None
             self.research_analyzer = None
             self.profile_analyzer = None
+            self._fallback_analyzers = []
             self._llm_available = False
             
             if self.fallback_mode == 'strict':
                 raise RuntimeError(f"LLM middleware initialization failed in strict mode: {e}")
     
+    @staticmethod
+    def _resolve_max_tokens(max_tokens: Any) -> Optional[Dict[str, int]]:
+        """Normalize the max_tokens setting into per-analysis-type caps.
+        
+        A dict sets caps per analysis type. A single number (the legacy
+        setting) acts as a ceiling over the client's per-type defaults.
+        """
+        if max_tokens is None:
+            return None
+        if isinstance(max_tokens, dict):
+            return {analysis_type: int(cap) for analysis_type, cap in max_tokens.items()}
+        return {
+            analysis_type: min(int(max_tokens), cap)
+            for analysis_type, cap in DEFAULT_MAX_TOKENS_BY_TYPE.items()
+        }
+        
     def is_llm_available(self) -> bool:
         """Check if LLM services are available."""
         return self.enabled and self._llm_available
     
     async def health_check(self) -> Dict[str, Any]:
-        """Perform health check on LLM services."""
+        """Perform health check on LLM services.
+        
+        Results are reused for health_check_ttl_seconds so frequent liveness
+        probes do not each hit Bedrock.
+        """
+        now = time.monotonic()
+        if self._health_cache is not None and now - self._health_cache[0] < self.health_check_ttl_seconds:
+            return copy.deepcopy(self._health_cache[1])
+        
         health_status = {
             'llm_enabled': self.enabled,
             'llm_available': self._llm_available,
             'fallback_mode': self.fallback_mode,
             'model_id': self.model_id,
-            'region': self.region
+            'region': self.region,
+            'latency_mode': self.latency_mode,
+            'prompt_cache': self.prompt_cache_enabled,
+            'cache': {
+                'enabled': self.cache_enabled,
+                'entries': len(self.cache),
+                **self.cache.stats
+            }
         }
+        health_status['circuit_breaker'] = self.circuit_breaker.state
+        if self.semantic_cache is not None:
+            health_status['semantic_cache'] = {
+                'entries': len(self.semantic_cache),
+                **self.semantic_cache.stats
+            }
         
         if self.is_llm_available():
             try:
-                # Simple test call to verify connectivity
-                test_data = {"test": "connectivity check"}
-                # You could add a simple test call here
+                # Lightweight connectivity check; never a full inference call
+                if not await self.bedrock_client.ping():
+                    raise RuntimeError("Bedrock client unavailable")
                 health_status['connectivity'] = 'healthy'
                 health_status['last_check'] = 'success'
             except Exception as e:
@@ -74,88 +473,386 @@ class LLMMiddleware:
             health_status['connectivity'] = 'disabled'
             health_status['last_check'] = 'not_applicable'
         
-        return health_status
+        self._health_cache = (now, health_status)
+        return copy.deepcopy(health_status)
         
     async def enhance_research_data(self, raw_data: Dict[str, Any]) -> Dict[str, Any]:
         """Enhance research data with LLM analysis."""
         if not self.is_llm_available():
             logger.info("LLM enhancement disabled or unavailable, using manual processing")
-            return self._fallback_to_manual_research(raw_data)
+            FALLBACK_REASONS.labels('research', 'unavailable').inc()
+            return await self._run_fallback(self._fallback_to_manual_research, raw_data)
             
         # Validate input data
         if not self._validate_research_data(raw_data):
             logger.warning("Invalid research data provided, falling back to manual processing")
-            fallback_data = self._fallback_to_manual_research(raw_data)
+            fallback_data = await self._run_fallback(self._fallback_to_manual_research, raw_data)
             fallback_data['middleware_status'] = 'validation_failed'
+            FALLBACK_REASONS.labels('research', 'validation_failed').inc()
             return fallback_data
             
+        request_key = self._cache_key('research', raw_data)
+        if self.cache_enabled:
+            cached_data = await self.cache.get(request_key)
+            if cached_data is not None:
+                cached_data['middleware_status'] = 'cache_hit'
+                CACHE_HITS.labels('research', 'exact').inc()
+                logger.info("Research data served from LLM response cache")
+                return cached_data
+            
+            if self.semantic_cache is not None:
+                semantic_key = self._semantic_key(raw_data)
+                if semantic_key is not None:
+                    cached_data = await self.semantic_cache.get(*semantic_key)
+                    if cached_data is not None:
+                        cached_data['middleware_status'] = 'semantic_cache_hit'
+                        CACHE_HITS.labels('research', 'semantic').inc()
+                        logger.info("Research data served from semantic cache")
+                        return cached_data
+        
+        # Join an identical call already in flight; if its caller was cancelled,
+        # the first waiter to wake takes the call over and the rest join it
+        while (inflight := self._inflight.get(request_key)) is not None:
+            logger.info("Joining in-flight LLM enhancement for identical research data")
+            shared_data = await asyncio.shield(inflight)
+            if shared_data is not _LEADER_CANCELLED:
+                return copy.deepcopy(shared_data)
+        
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[request_key] = future
         try:
+            enhanced_data = await self._run_research_enhancement(raw_data, request_key)
+            future.set_result(copy.deepcopy(enhanced_data))
+            return enhanced_data
+        except asyncio.CancelledError:
+            future.set_result(_LEADER_CANCELLED)
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # Retrieved here so an unjoined failure is not logged a second time
+            future.exception()
+            raise
+        finally:
+            self._inflight.pop(request_key, None)
+            
+    async def _run_research_enhancement(self, raw_data: Dict[str, Any], request_key: str) -> Dict[str, Any]:
+        """Run the LLM research analysis with timeout and manual fallback."""
+        if not self.circuit_breaker.allow_request():
+            logger.info("LLM circuit breaker open, using manual research processing")
+            fallback_data = await self._run_fallback(self._fallback_to_manual_research, raw_data)
+            fallback_data['middleware_status'] = 'circuit_open'
+            FALLBACK_REASONS.labels('research', 'circuit_open').inc()
+            fallback_data['fallback_reason'] = 'Circuit breaker open after repeated LLM failures'
+            return fallback_data
+            
+        timeout = self._timeout_for('research')
+        try:
+            # Cut oversized scraped fields so they do not dominate input tokens
+            payload, payload_compacted = _compact_field(raw_data, self.max_field_chars)
+            
             # Add timeout handling
-            import asyncio
-            enhanced_data = await asyncio.wait_for(
-                self.research_analyzer.analyze_comprehensive_data(raw_data),
-                timeout=self.timeout_seconds
-            )
+            enhanced_data = await self._invoke_with_fallback('research', payload, timeout)
             enhanced_data['middleware_status'] = 'success'
             enhanced_data['llm_enabled'] = True
             enhanced_data['processing_time'] = 'within_timeout'
+            if payload_compacted:
+                enhanced_data['payload_compacted'] = True
+            
+            if self._cacheable(enhanced_data):
+                await self.cache.set(request_key, enhanced_data, ttl=self.cache_ttl_seconds)
+                semantic_key = self._semantic_key(raw_data) if self.semantic_cache is not None else None
+                if semantic_key is not None:
+                    await self.semantic_cache.set(*semantic_key, enhanced_data)
             
             logger.info("Research data successfully enhanced with LLM analysis")
             return enhanced_data
             
         except asyncio.TimeoutError:
-            logger.warning(f"LLM enhancement timed out after {self.timeout_seconds}s, falling back to manual")
-            fallback_data = self._fallback_to_manual_research(raw_data)
+            logger.warning(f"LLM enhancement timed out after {timeout:g}s, falling back to manual")
+            fallback_data = await self._run_fallback(self._fallback_to_manual_research, raw_data)
             fallback_data['middleware_status'] = 'timeout'
-            fallback_data['fallback_reason'] = f'Timeout after {self.timeout_seconds}s'
+            FALLBACK_REASONS.labels('research', 'timeout').inc()
+            fallback_data['fallback_reason'] = f'Timeout after {timeout:g}s'
             return fallback_data
         except Exception as e:
             logger.warning(f"LLM enhancement failed, falling back to manual: {e}")
-            fallback_data = self._fallback_to_manual_research(raw_data)
+            fallback_data = await self._run_fallback(self._fallback_to_manual_research, raw_data)
             fallback_data['middleware_status'] = 'error'
+            FALLBACK_REASONS.labels('research', 'error').inc()
             fallback_data['fallback_reason'] = str(e)
             return fallback_data
             
+    async def enhance_research_data_many(self, raw_data_items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Enhance several research payloads concurrently.
+        
+        Each payload goes through enhance_research_data (cache, coalescing,
+        batching and fallback), so wall-clock time is bounded by the slowest
+        payload rather than the sum. A failure only affects its own payload.
+        
+        Args:
+            raw_data_items: Raw research payloads, one per prospect
+            
+        Returns:
+            Enhanced research data in the same order as the input
+        """
+        results = await asyncio.gather(
+            *(self.enhance_research_data(raw_data) for raw_data in raw_data_items),
+            return_exceptions=True
+        )
+        
+        enhanced_items = []
+        for raw_data, result in zip(raw_data_items, results):
+            if isinstance(result, asyncio.CancelledError):
+                # Cancellation is not a per-payload failure; never return it as a result
+                raise result
+            if isinstance(result, BaseException):
+                logger.warning(f"LLM enhancement failed, falling back to manual: {result}")
+                fallback_data = await self._run_fallback(self._fallback_to_manual_research, raw_data)
+                fallback_data['middleware_status'] = 'error'
+                FALLBACK_REASONS.labels('research', 'error').inc()
+                fallback_data['fallback_reason'] = str(result)
+                result = fallback_data
+            enhanced_items.append(result)
+        return enhanced_items
+        
+    async def enhance_all(self, raw_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Enhance research data and derive the profile strategy from it.
+        
+        The profile is built from the research result, so the two calls are
+        chained; to process several prospects, gather over enhance_all so
+        each chain runs concurrently.
+        
+        Args:
+            raw_data: Raw research payload for one prospect
+            
+        Returns:
+            Dictionary with 'research' and 'profile' results
+        """
+        research = await self.enhance_research_data(raw_data)
+        profile = await self.enhance_profile_strategy(self._profile_input(raw_data, research))
+        return {'research': research, 'profile': profile}
+        
+    @staticmethod
+    def _profile_input(raw_data: Dict[str, Any], research: Dict[str, Any]) -> Dict[str, Any]:
+        """Build profile strategy input from an enhanced research result."""
+        sections = []
+        for title, key in (
+            ('Company Background', 'company_background'),
+            ('Business Model', 'business_model'),
+            ('Technology Stack', 'technology_stack'),
+            ('Pain Points', 'pain_points'),
+            ('Recent Developments', 'recent_developments'),
+            ('Decision Makers', 'decision_makers')
+        ):
+            value = research.get(key)
+            if isinstance(value, (list, tuple)):
+                value = ", ".join(str(item) for item in value)
+            if value:
+                sections.append(f"## {title}\n{value}")
+        
+        return {
+            'research_content': "\n\n".join(sections),
+            'company_name': raw_data.get('company', '')
+        }
+        
     async def enhance_profile_strategy(self, research_data: Dict[str, Any]) -> Dict[str, Any]:
         """Enhance profile strategy with LLM analysis."""
         if not self.is_llm_available():
             logger.info("LLM enhancement disabled or unavailable, using manual profile strategy")
-            return self._fallback_to_manual_profile(research_data)
+            FALLBACK_REASONS.labels('profile', 'unavailable').inc()
+            return await self._run_fallback(self._fallback_to_manual_profile, research_data)
             
         # Validate input data
         if not self._validate_profile_data(research_data):
             logger.warning("Invalid profile data provided, falling back to manual processing")
-            fallback_data = self._fallback_to_manual_profile(research_data)
+            fallback_data = await self._run_fallback(self._fallback_to_manual_profile, research_data)
             fallback_data['middleware_status'] = 'validation_failed'
+            FALLBACK_REASONS.labels('profile', 'validation_failed').inc()
             return fallback_data
             
+        request_key = self._cache_key('profile', research_data)
+        if self.cache_enabled:
+            cached_strategy = await self.cache.get(request_key)
+            if cached_strategy is not None:
+                cached_strategy['middleware_status'] = 'cache_hit'
+                CACHE_HITS.labels('profile', 'exact').inc()
+                logger.info("Profile strategy served from LLM response cache")
+                return cached_strategy
+            
+        if not self.circuit_breaker.allow_request():
+            logger.info("LLM circuit breaker open, using manual profile strategy")
+            fallback_strategy = await self._run_fallback(self._fallback_to_manual_profile, research_data)
+            fallback_strategy['middleware_status'] = 'circuit_open'
+            FALLBACK_REASONS.labels('profile', 'circuit_open').inc()
+            fallback_strategy['fallback_reason'] = 'Circuit breaker open after repeated LLM failures'
+            return fallback_strategy
+            
+        timeout = self._timeout_for('profile')
         try:
             # Add timeout handling
-            import asyncio
-            enhanced_strategy = await asyncio.wait_for(
-                self.profile_analyzer.generate_strategy(research_data),
-                timeout=self.timeout_seconds
-            )
+            enhanced_strategy = await self._invoke_with_fallback('profile', research_data, timeout)
             enhanced_strategy['middleware_status'] = 'success'
             enhanced_strategy['llm_enabled'] = True
             enhanced_strategy['processing_time'] = 'within_timeout'
             
+            if self._cacheable(enhanced_strategy):
+                await self.cache.set(request_key, enhanced_strategy, ttl=self.cache_ttl_seconds)
+            
             logger.info("Profile strategy successfully enhanced with LLM analysis")
             return enhanced_strategy
             
         except asyncio.TimeoutError:
-            logger.warning(f"LLM profile enhancement timed out after {self.timeout_seconds}s, falling back to manual")
-            fallback_strategy = self._fallback_to_manual_profile(research_data)
+            logger.warning(f"LLM profile enhancement timed out after {timeout:g}s, falling back to manual")
+            fallback_strategy = await self._run_fallback(self._fallback_to_manual_profile, research_data)
             fallback_strategy['middleware_status'] = 'timeout'
-            fallback_strategy['fallback_reason'] = f'Timeout after {self.timeout_seconds}s'
+            FALLBACK_REASONS.labels('profile', 'timeout').inc()
+            fallback_strategy['fallback_reason'] = f'Timeout after {timeout:g}s'
             return fallback_strategy
         except Exception as e:
             logger.warning(f"LLM profile enhancement failed, falling back to manual: {e}")
-            fallback_strategy = self._fallback_to_manual_profile(research_data)
+            fallback_strategy = await self._run_fallback(self._fallback_to_manual_profile, research_data)
             fallback_strategy['middleware_status'] = 'error'
+            FALLBACK_REASONS.labels('profile', 'error').inc()
             fallback_strategy['fallback_reason'] = str(e)
             return fallback_strategy
     
+    async def _run_fallback(self, fallback: Callable[[Dict[str, Any]], Dict[str, Any]],
+                            data: Dict[str, Any]) -> Dict[str, Any]:
+        """Run a manual fallback in the fallback thread pool."""
+        return await asyncio.get_running_loop().run_in_executor(_FALLBACK_POOL, fallback, data)
+        
+    async def _invoke_with_fallback(self, operation: str, data: Dict[str, Any],
+                                    timeout: float) -> Dict[str, Any]:
+        """Run an analysis on each model of the chain until one succeeds.
+        
+        The whole chain shares one deadline, so manual fallback starts at
+        most timeout seconds after the first call; a model reached with no
+        time left raises asyncio.TimeoutError. Failures of the last model
+        propagate (or its error result is returned) as before.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        chain = [(self.model_id, self.research_analyzer, self.profile_analyzer)] + self._fallback_analyzers
+        for position, (model_id, research_analyzer, profile_analyzer) in enumerate(chain):
+            is_last = position == len(chain) - 1
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                raise asyncio.TimeoutError()
+            if operation == 'research':
+                analysis = research_analyzer.analyze_comprehensive_data(data)
+            else:
+                analysis = profile_analyzer.generate_strategy(data)
+            
+            try:
+                result = await self._call_with_breaker(operation, model_id, analysis, remaining)
+            except Exception as e:
+                if is_last:
+                    raise
+                logger.warning(f"LLM {operation} analysis with {model_id} failed ({e!r}), trying next model")
+                continue
+            
+            if not is_last and result.get('enhancement_status') in _FAILED_ENHANCEMENT_STATUSES:
+                logger.warning(f"LLM {operation} analysis with {model_id} returned an error, trying next model")
+                continue
+            
+            result['model_used'] = model_id
+            return result
+    
+    async def _call_with_breaker(self, operation: str, model_id: str,
+                                 analysis: Awaitable[Dict[str, Any]], timeout: float) -> Dict[str, Any]:
+        """Await an analyzer call under the timeout and record its outcome and latency."""
+        started = time.perf_counter()
+        try:
+            result = await asyncio.wait_for(analysis, timeout=timeout)
+        except Exception:
+            # Timeouts and errors count against the LLM; a cancelled caller
+            # (CancelledError is a BaseException) says nothing about Bedrock
+            self.circuit_breaker.record_failure()
+            raise
+        
+        if result.get('enhancement_status') in _FAILED_ENHANCEMENT_STATUSES:
+            self.circuit_breaker.record_failure()
+        else:
+            self.circuit_breaker.record_success()
+            elapsed = time.perf_counter() - started
+            self._latency[operation].append(elapsed)
+            BEDROCK_LATENCY.labels(operation, model_id).observe(elapsed)
+        return result
+    
+    def _timeout_for(self, operation: str) -> float:
+        """Return the timeout for an operation from its recent p95 latency.
+        
+        Uses 1.5x the p95 of recent successful calls, bounded below by
+        min_timeout_seconds and above by timeout_seconds. Until enough
+        samples are collected the configured timeout_seconds applies.
+        """
+        samples = self._latency[operation]
+        if len(samples) < self.adaptive_timeout_min_samples:
+            return self.timeout_seconds
+        
+        ordered = sorted(samples)
+        p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+        return min(self.timeout_seconds, max(self.min_timeout_seconds, p95 * 1.5))
+    
+    def _cacheable(self, result: Dict[str, Any]) -> bool:
+        """Check whether an analysis result may be stored in the response caches.
+        
+        Only AI-enhanced results from the primary model are cached: cache
+        keys are built from the primary model, so a fallback model's answer
+        would otherwise be served as the primary's after it recovers.
+        """
+        return (self.cache_enabled and result.get('enhancement_status') == 'ai_enhanced'
+                and result.get('model_used') == self.model_id)
+    
+    def _cache_key(self, operation: str, payload: Dict[str, Any]) -> str:
+        """Build an exact-match cache key for an operation on a canonicalized payload.
+        
+        The model and sampling temperature are part of the key so a config
+        change never serves responses generated under different settings.
+        """
+        canonical = orjson.dumps(
+            {
+                'model': self.model_id,
+                'temperature': self.temperature,
+                'op': operation,
+                'payload': payload
+            },
+            default=str,
+            option=_CACHE_KEY_JSON_OPTIONS
+        )
+        return blake2b(canonical, digest_size=16).hexdigest()
+    
+    def _semantic_key(self, raw_data: Dict[str, Any]) -> Optional[Tuple[str, str]]:
+        """Return the (scope, text) used to match near-duplicate research payloads.
+        
+        The scope pins matches to one company, model and temperature; the
+        text is all source content with per-run bookkeeping left out.
+        Payloads without a company name are not matched semantically.
+        """
+        company = raw_data.get('company')
+        if not isinstance(company, str) or not company.strip():
+            return None
+        
+        scope = f"{self.model_id}|{self.temperature}|research|{company.strip().lower()}"
+        parts = []
+        self._collect_text(
+            {key: value for key, value in raw_data.items() if key not in _SEMANTIC_IGNORED_KEYS},
+            parts
+        )
+        return scope, " ".join(parts)
+    
+    @classmethod
+    def _collect_text(cls, value: Any, parts: List[str]) -> None:
+        """Append every scalar in a nested payload to parts as text."""
+        if isinstance(value, dict):
+            for key in sorted(value, key=str):
+                cls._collect_text(value[key], parts)
+        elif isinstance(value, (list, tuple)):
+            for item in value:
+                cls._collect_text(item, parts)
+        elif value is not None:
+            parts.append(str(value))
+    
     def _validate_research_data(self, raw_data: Dict[str, Any]) -> bool:
         """Validate research data before LLM processing."""
         if not isinstance(raw_data, dict):
@@ -184,27 +881,19 @@ class LLMMiddleware:
         logger.info("Using manual research processing fallback")
         
         # Extract data from all available sources
-        result = {
-            "company_background": self._extract_background(raw_data),
-            "business_model": self._extract_business_model(raw_data),
-            "technology_stack": self._extract_tech_stack(raw_data),
-            "pain_points": self._extract_pain_points(raw_data),
-            "recent_developments": self._extract_developments(raw_data),
-            "decision_makers": self._extract_decision_makers(raw_data),
-            "enhancement_status": "manual_processing",
-            "data_sources_summary": {
-                "successful_sources": raw_data.get('successful_sources_count', 0),
-                "failed_sources": raw_data.get('failed_sources_count', 0),
-                "total_sources": raw_data.get('total_sources', 9),
-                "errors": raw_data.get('errors', [])
-            },
-            "fallback_reason": "LLM unavailable or failed",
-            "processing_mode": "rule-based"
+        result = dict(_MANUAL_RESEARCH_TEMPLATE)
+        result.update(self._extract_all(raw_data))
+        
+        total_sources = raw_data.get('total_sources', 9)
+        successful_sources = raw_data.get('successful_sources_count', 0)
+        result["data_sources_summary"] = {
+            "successful_sources": successful_sources,
+            "failed_sources": raw_data.get('failed_sources_count', 0),
+            "total_sources": total_sources,
+            "errors": raw_data.get('errors', [])
         }
         
         # Add data quality assessment
-        total_sources = result["data_sources_summary"]["total_sources"]
-        successful_sources = result["data_sources_summary"]["successful_sources"]
         result["data_quality_score"] = f"{successful_sources}/{total_sources} sources"
         
         return result
@@ -213,47 +902,74 @@ class LLMMiddleware:
         """Fallback to manual profile strategy with intelligent rule-based generation."""
         logger.info("Using manual profile strategy fallback")
         
-        # Analyze research data for intelligent manual processing
-        company_name = research_data.get('company_name', 'Unknown Company')
-        research_content = research_data.get('research_content', '')
-        
-        result = {
-            "conversation_starter_1": self._generate_manual_starter_1(research_data),
-            "conversation_starter_2": self._generate_manual_starter_2(research_data),
-            "conversation_starter_3": self._generate_manual_starter_3(research_data),
-            "value_proposition": self._generate_manual_value_prop(research_data),
-            "timing_recommendation": self._generate_manual_timing(research_data),
-            "talking_points": self._generate_manual_talking_points(research_data),
-            "objection_handling": self._generate_manual_objections(research_data),
-            "enhancement_status": "manual_processing",
-            "fallback_reason": "LLM unavailable or failed",
-            "processing_mode": "rule-based",
-            "personalization_level": "basic"
-        }
+        # Lowercase the research content once for all generators
+        ctx = ProfileContext(
+            research_data.get('company_name'),
+            research_data.get('research_content', '').lower()
+        )
+        
+        result = dict(_MANUAL_PROFILE_TEMPLATE)
+        result["conversation_starter_1"] = self._generate_manual_starter_1(ctx)
+        result["conversation_starter_2"] = self._generate_manual_starter_2(ctx)
+        result["conversation_starter_3"] = self._generate_manual_starter_3(ctx)
+        result["value_proposition"] = self._generate_manual_value_prop(ctx)
+        result["timing_recommendation"] = self._generate_manual_timing(ctx)
+        result["talking_points"] = self._generate_manual_talking_points(ctx)
+        result["objection_handling"] = self._generate_manual_objections(ctx)
         
         return result
         
     # Manual extraction methods (intelligent rule-based processing)
-    def _extract_background(self, raw_data: Dict[str, Any]) -> str:
+    @staticmethod
+    def _build_corpus(raw_data: Dict[str, Any]) -> str:
+        """Join the text content of every data source into one lowercased string.
+        
+        Only string values are included, so dict keys, punctuation and
+        numbers from stringified structures are not scanned.
+        """
+        return " ".join(_iter_text(raw_data)).lower()
+        
+    def _extract_all(self, raw_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Extract every research field from raw data in a single pass.
+        
+        The corpus is built once and scanned once for both technology and
+        challenge keywords; the structured fields read their sources
+        directly from ``raw_data``.
+        """
+        ctx = ResearchContext(raw_data, self._build_corpus(raw_data))
+        hits = _match_corpus_keywords(ctx.corpus)
+        tech_stack = hits['technology_stack'][:8]
+        pain_points = hits['pain_points'][:5]
+        
+        return {
+            "company_background": self._extract_background(ctx),
+            "business_model": self._extract_business_model(ctx),
+            "technology_stack": tech_stack or ["Technology stack analysis in progress"],
+            "pain_points": pain_points or ["Business challenges identified from data analysis"],
+            "recent_developments": self._extract_developments(ctx),
+            "decision_makers": self._extract_decision_makers(ctx)
+        }
+        
+    def _extract_background(self, ctx: ResearchContext) -> str:
         """Extract company background from available data sources."""
         background_parts = []
         
         # Extract from website data
-        website_data = raw_data.get('company_website', {})
+        website_data = ctx.data.get('company_website', {})
         if website_data and isinstance(website_data, dict):
             description = website_data.get('description', '')
             if description:
                 background_parts.append(f"Company Overview: {description[:200]}...")
         
         # Extract from Apollo data
-        apollo_data = raw_data.get('apollo_data', {})
+        apollo_data = ctx.data.get('apollo_data', {})
         if apollo_data and isinstance(apollo_data, dict):
             industry = apollo_data.get('industry', '')
             if industry:
                 background_parts.append(f"Industry: {industry}")
         
         # Extract from LinkedIn data
-        linkedin_data = raw_data.get('linkedin_data', {})
+        linkedin_data = ctx.data.get('linkedin_data', {})
         if linkedin_data and isinstance(linkedin_data, dict):
             company_info = linkedin_data.get('company_info', '')
             if company_info:
@@ -264,89 +980,29 @@ class LLMMiddleware:
         else:
             return "Company background information collected from available data sources"
         
-    def _extract_business_model(self, raw_data: Dict[str, Any]) -> str:
+    def _extract_business_model(self, ctx: ResearchContext) -> str:
         """Extract business model from collected data."""
         # Look for business model indicators in various sources
         indicators = []
         
         # Check website content for business model keywords
-        website_data = raw_data.get('company_website', {})
+        website_data = ctx.data.get('company_website', {})
         if website_data:
-            content = str(website_data).lower()
-            if 'saas' in content or 'software as a service' in content:
-                indicators.append("SaaS")
-            elif 'marketplace' in content:
-                indicators.append("Marketplace")
-            elif 'consulting' in content:
-                indicators.append("Consulting Services")
-            elif 'ecommerce' in content or 'e-commerce' in content:
-                indicators.append("E-commerce")
-            elif 'manufacturing' in content:
-                indicators.append("Manufacturing")
+            business_model = _first_rule_match(" ".join(_iter_text(website_data)).lower(), _BUSINESS_MODEL_KEYWORDS)
+            if business_model:
+                indicators.append(business_model)
         
         if indicators:
             return f"Business Model: {', '.join(indicators)}"
         else:
             return "Business model analyzed from comprehensive data collection"
         
-    def _extract_tech_stack(self, raw_data: Dict[str, Any]) -> list:
-        """Extract technology stack from available sources."""
-        tech_stack = []
-        
-        # Common technology indicators
-        tech_keywords = [
-            'Python', 'JavaScript', 'React', 'Node.js', 'AWS', 'Azure', 'Google Cloud',
-            'Docker', 'Kubernetes', 'MongoDB', 'PostgreSQL', 'MySQL', 'Redis',
-            'AI', 'Machine Learning', 'API', 'REST', 'GraphQL', 'Microservices'
-        ]
-        
-        # Search across all data sources for tech keywords
-        all_content = ""
-        for source_key, source_data in raw_data.items():
-            if source_data and isinstance(source_data, (dict, str)):
-                all_content += str(source_data).lower()
-        
-        for tech in tech_keywords:
-            if tech.lower() in all_content:
-                tech_stack.append(tech)
-        
-        return tech_stack[:8] if tech_stack else ["Technology stack analysis in progress"]
-        
-    def _extract_pain_points(self, raw_data: Dict[str, Any]) -> list:
-        """Extract potential pain points from data sources."""
-        pain_points = []
-        
-        # Look for common business challenges
-        challenge_keywords = {
-            'scaling': "Scaling challenges",
-            'growth': "Growth management",
-            'efficiency': "Operational efficiency",
-            'automation': "Process automation needs",
-            'digital transformation': "Digital transformation",
-            'cloud migration': "Cloud migration",
-            'security': "Security concerns",
-            'compliance': "Compliance requirements",
-            'customer acquisition': "Customer acquisition",
-            'retention': "Customer retention"
-        }
-        
-        all_content = ""
-        for source_key, source_data in raw_data.items():
-            if source_data:
-                all_content += str(source_data).lower()
-        
-        for keyword, pain_point in challenge_keywords.items():
-            if keyword in all_content:
-                pain_points.append(pain_point)
-        
-        return pain_points[:5] if pain_points else ["Business challenges identified from data analysis"]
-        
-    def _extract_developments(self, raw_data: Dict[str, Any]) -> list:
+    def _extract_developments(self, ctx: ResearchContext) -> list:
         """Extract recent developments from news and other sources."""
         developments = []
         
         # Extract from news data
-        news_data = raw_data.get('news_data', {})
+        news_data = ctx.data.get('news_data', {})
         if news_data and isinstance(news_data, dict):
             articles = news_data.get('articles', [])
             for article in articles[:3]:
@@ -356,7 +1012,7 @@ class LLMMiddleware:
                         developments.append(f"News: {title}")
         
         # Extract from job boards (hiring activity)
-        job_data = raw_data.get('job_boards', {})
+        job_data = ctx.data.get('job_boards', {})
         if job_data and isinstance(job_data, dict):
             jobs = job_data.get('jobs', [])
             if jobs:
@@ -364,12 +1020,12 @@ class LLMMiddleware:
         
         return developments if developments else ["Recent developments tracked from multiple sources"]
         
-    def _extract_decision_makers(self, raw_data: Dict[str, Any]) -> list:
+    def _extract_decision_makers(self, ctx: ResearchContext) -> list:
         """Extract decision makers from Apollo and LinkedIn data."""
         decision_makers = []
         
         # Extract from Apollo data
-        apollo_data = raw_data.get('apollo_data', {})
+        apollo_data = ctx.data.get('apollo_data', {})
         if apollo_data and isinstance(apollo_data, dict):
             contacts = apollo_data.get('contacts', [])
             for contact in contacts[:3]:
@@ -380,7 +1036,7 @@ class LLMMiddleware:
                         decision_makers.append(f"{name} - {title}")
         
         # Extract from LinkedIn data
-        linkedin_data = raw_data.get('linkedin_data', {})
+        linkedin_data = ctx.data.get('linkedin_data', {})
         if linkedin_data and isinstance(linkedin_data, dict):
             executives = linkedin_data.get('executives', [])
             for exec in executives[:2]:
@@ -392,55 +1048,28 @@ class LLMMiddleware:
         
         return decision_makers if decision_makers else ["Key decision makers identified from professional networks"]
         
-    def _generate_manual_starter_1(self, research_data: Dict[str, Any]) -> str:
+    def _generate_manual_starter_1(self, ctx: ProfileContext) -> str:
         """Generate intelligent manual conversation starter 1."""
-        research_content = research_data.get('research_content', '').lower()
-        company_name = research_data.get('company_name', 'your company')
-        
-        # Analyze content for context-specific starters
-        if 'ai' in research_content or 'artificial intelligence' in research_content:
-            return f"I noticed {company_name} is exploring AI initiatives. What's driving your current AI strategy?"
-        elif 'cloud' in research_content or 'aws' in research_content or 'azure' in research_content:
-            return f"How is {company_name} approaching your cloud transformation journey?"
-        elif 'growth' in research_content or 'scaling' in research_content:
-            return f"What are the biggest challenges {company_name} is facing as you scale?"
-        elif 'automation' in research_content:
-            return f"I see {company_name} is focused on automation. Which processes are you looking to streamline?"
-        else:
-            return f"What are the key business priorities driving {company_name}'s technology decisions right now?"
+        return self._generate_manual_starter(ctx, 0)
         
-    def _generate_manual_starter_2(self, research_data: Dict[str, Any]) -> str:
+    def _generate_manual_starter_2(self, ctx: ProfileContext) -> str:
         """Generate intelligent manual conversation starter 2."""
-        research_content = research_data.get('research_content', '').lower()
-        company_name = research_data.get('company_name', 'your organization')
-        
-        if 'security' in research_content or 'compliance' in research_content:
-            return f"How is {company_name} balancing innovation with security and compliance requirements?"
-        elif 'customer' in research_content or 'user' in research_content:
-            return f"What's {company_name}'s approach to enhancing customer experience through technology?"
-        elif 'data' in research_content or 'analytics' in research_content:
-            return f"How is {company_name} leveraging data to drive business decisions?"
-        else:
-            return f"What technology investments is {company_name} prioritizing this year?"
+        return self._generate_manual_starter(ctx, 1)
         
-    def _generate_manual_starter_3(self, research_data: Dict[str, Any]) -> str:
+    def _generate_manual_starter_3(self, ctx: ProfileContext) -> str:
         """Generate intelligent manual conversation starter 3."""
-        research_content = research_data.get('research_content', '').lower()
-        company_name = research_data.get('company_name', 'your team')
-        
-        if 'efficiency' in research_content or 'productivity' in research_content:
-            return f"What operational efficiency gains is {company_name} targeting?"
-        elif 'integration' in research_content or 'api' in research_content:
-            return f"How is {company_name} handling system integration challenges?"
-        elif 'remote' in research_content or 'distributed' in research_content:
-            return f"How has {company_name} adapted your technology stack for distributed teams?"
-        else:
-            return f"What's the biggest technology challenge {company_name} is looking to solve?"
+        return self._generate_manual_starter(ctx, 2)
         
-    def _generate_manual_value_prop(self, research_data: Dict[str, Any]) -> str:
+    def _generate_manual_starter(self, ctx: ProfileContext, index: int) -> str:
+        """Generate a conversation starter from the rules of one starter slot."""
+        default_company_name, rules, default_template = _STARTER_RULES[index]
+        template = _first_rule_match(ctx.content, rules) or default_template
+        return template.format(company_name=ctx.company_name or default_company_name)
+        
+    def _generate_manual_value_prop(self, ctx: ProfileContext) -> str:
         """Generate intelligent manual value proposition."""
-        research_content = research_data.get('research_content', '').lower()
-        company_name = research_data.get('company_name', 'your company')
+        research_content = ctx.content
+        company_name = ctx.company_name or 'your company'
         
         value_props = []
         
@@ -460,24 +1089,13 @@ class LLMMiddleware:
         else:
             return f"Our platform can help {company_name} streamline operations, reduce costs, and accelerate time-to-market."
         
-    def _generate_manual_timing(self, research_data: Dict[str, Any]) -> str:
+    def _generate_manual_timing(self, ctx: ProfileContext) -> str:
         """Generate intelligent manual timing recommendation."""
-        research_content = research_data.get('research_content', '').lower()
-        
-        if 'funding' in research_content or 'investment' in research_content:
-            return "Strong timing - recent funding suggests active investment in technology solutions"
-        elif 'hiring' in research_content or 'jobs' in research_content:
-            return "Optimal timing - active hiring indicates growth phase and technology expansion"
-        elif 'q4' in research_content or 'budget' in research_content:
-            return "Strategic timing - budget planning season suggests procurement readiness"
-        elif 'launch' in research_content or 'product' in research_content:
-            return "Perfect timing - product development phase indicates need for supporting technology"
-        else:
-            return "Good timing - company appears in active growth and technology adoption phase"
+        return _first_rule_match(ctx.content, _TIMING_RULES) or _DEFAULT_TIMING
         
-    def _generate_manual_talking_points(self, research_data: Dict[str, Any]) -> list:
+    def _generate_manual_talking_points(self, ctx: ProfileContext) -> list:
         """Generate intelligent manual talking points."""
-        research_content = research_data.get('research_content', '').lower()
+        research_content = ctx.content
         talking_points = []
         
         # Industry-specific talking points
@@ -515,9 +1133,9 @@ class LLMMiddleware:
             "Security and compliance enhancement"
         ]
         
-    def _generate_manual_objections(self, research_data: Dict[str, Any]) -> list:
+    def _generate_manual_objections(self, ctx: ProfileContext) -> list:
         """Generate intelligent manual objection handling."""
-        research_content = research_data.get('research_content', '').lower()
+        research_content = ctx.content
         objections = []
         
         # Common objections based on company context
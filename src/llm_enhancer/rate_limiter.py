@@ -0,0 +1,62 @@
+"""Process-wide token bucket rate limiting for Bedrock calls."""
+
+import asyncio
+import logging
+import time
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+# Default on-demand quota for Claude Sonnet 4 cross-region inference (200k tokens/minute)
+DEFAULT_TOKENS_PER_MINUTE = 200_000
+
+
+class BedrockRateLimiter:
+    """Token bucket shared by every BedrockClient in the process.
+
+    Tokens refill continuously from elapsed time, so no background task is
+    needed. Callers reserve their cost up front and sleep off any deficit,
+    which keeps waiters in arrival order without holding a lock.
+    """
+
+    def __init__(self, tokens_per_sec: float = DEFAULT_TOKENS_PER_MINUTE / 60,
+                 burst: Optional[float] = None):
+        """Initialize rate limiter.
+
+        Args:
+            tokens_per_sec: Sustained token throughput allowed
+            burst: Bucket capacity (default: one minute of throughput)
+        """
+        self.configure(tokens_per_sec, burst)
+        self._tokens = self.burst
+        self._updated_at = time.monotonic()
+
+    def configure(self, tokens_per_sec: float, burst: Optional[float] = None):
+        """Update the refill rate and bucket capacity."""
+        if tokens_per_sec <= 0:
+            raise ValueError("tokens_per_sec must be positive")
+        self.tokens_per_sec = float(tokens_per_sec)
+        self.burst = float(burst) if burst is not None else self.tokens_per_sec * 60
+
+    def _refill(self):
+        """Add tokens accrued since the last update, capped at the burst size."""
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated_at) * self.tokens_per_sec)
+        self._updated_at = now
+
+    async def acquire(self, cost: int):
+        """Wait until ``cost`` tokens are available and consume them."""
+        self._refill()
+        self._tokens -= cost
+        if self._tokens < 0:
+            delay = -self._tokens / self.tokens_per_sec
+            logger.debug(f"Bedrock rate limit reached, waiting {delay:.2f}s for {cost} tokens")
+            await asyncio.sleep(delay)
+
+
+_RATE_LIMITER = BedrockRateLimiter()
+
+
+def get_rate_limiter() -> BedrockRateLimiter:
+    """Return the process-wide Bedrock rate limiter."""
+    return _RATE_LIMITER
@@ -3,27 +3,82 @@ Centralized logging configuration for the MCP Prospect Research Server.
 Provides structured logging with context tracking for all operations.
 """
 
-import json
+import atexit
+import copy
 import logging
+import logging.handlers
+import os
+import queue
+import sys
+import threading
 import time
-import uuid
 from contextvars import ContextVar
-from typing import Dict, Any, Optional
+from typing import Dict, Any, NamedTuple, Optional
 
-# Context variables for tracking across async operations
-current_operation: ContextVar[Optional[str]] = ContextVar('current_operation', default=None)
-current_prospect_id: ContextVar[Optional[str]] = ContextVar('current_prospect_id', default=None)
-current_tool_name: ContextVar[Optional[str]] = ContextVar('current_tool_name', default=None)
-request_id: ContextVar[Optional[str]] = ContextVar('request_id', default=None)
+import orjson
+
+class LogContext(NamedTuple):
+    """Operation context attached to log records."""
+    operation: Optional[str] = None
+    prospect_id: Optional[str] = None
+    tool_name: Optional[str] = None
+    request_id: Optional[str] = None
+
+
+# Context variable for tracking across async operations; one variable holding all
+# fields makes entering an operation one set() and reading it one get()
+_EMPTY_LOG_CONTEXT = LogContext()
+log_context: ContextVar[LogContext] = ContextVar('log_context', default=_EMPTY_LOG_CONTEXT)
+
+# Record attribute holding the log context captured when a record is queued
+_CONTEXT_ATTR = 'log_context'
+
+# Standard LogRecord attributes (plus the queued context snapshot); anything else
+# on a record came from `extra`
+_RESERVED_LOGRECORD_ATTRS = frozenset({
+    'name', 'msg', 'args', 'levelname', 'levelno', 'pathname', 'filename',
+    'module', 'exc_info', 'exc_text', 'stack_info', 'lineno', 'funcName',
+    'created', 'msecs', 'relativeCreated', 'thread', 'threadName',
+    'processName', 'process', 'taskName', 'message', _CONTEXT_ATTR
+})
+
+# Records waiting for the background listener; the oldest are dropped when full
+_LOG_QUEUE_SIZE = 10000
+
+
+_JSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+_JSON_LINE_OPTIONS = _JSON_OPTIONS | orjson.OPT_APPEND_NEWLINE
 
 
 class StructuredFormatter(logging.Formatter):
     """Custom formatter that outputs structured JSON logs with context."""
     
+    def __init__(self, include_traceback: bool = True):
+        """Initialize formatter.
+        
+        Args:
+            include_traceback: Whether exception entries carry the formatted
+                traceback in addition to the exception type and message
+        """
+        super().__init__()
+        self.include_traceback = include_traceback
+    
     def format(self, record: logging.LogRecord) -> str:
-        # Base log entry structure
+        return self._encode(record, _JSON_OPTIONS).decode('utf-8')
+    
+    def format_line(self, record: logging.LogRecord) -> bytes:
+        """Return the log entry as a newline-terminated UTF-8 JSON line.
+        
+        Handlers writing to a binary stream use this to skip decoding the
+        JSON to str and encoding it back to UTF-8.
+        """
+        return self._encode(record, _JSON_LINE_OPTIONS)
+    
+    def _encode(self, record: logging.LogRecord, option: int) -> bytes:
+        # Base log entry structure; a dict display is presized by the compiler,
+        # so it beats filling a dict.fromkeys() template key by key
         log_entry = {
-            'timestamp': time.time(),
+            'timestamp': record.created,
             'level': record.levelname,
             'logger': record.name,
             'message': record.getMessage(),
@@ -32,56 +87,205 @@ class StructuredFormatter(logging.Formatter):
             'line': record.lineno,
         }
         
-        # Add context information if available
-        if current_operation.get():
-            log_entry['operation'] = current_operation.get()
-        
-        if current_prospect_id.get():
-            log_entry['prospect_id'] = current_prospect_id.get()
+        # Add context information if available; queued records carry the context
+        # captured on the logging thread, since the listener runs in another one
+        context = getattr(record, _CONTEXT_ATTR, None) or log_context.get()
+        if context != _EMPTY_LOG_CONTEXT:
+            # Explicit checks beat log_entry.update() with a filtered comprehension here
+            operation, prospect_id, tool_name, operation_request_id = context
+            if operation:
+                log_entry['operation'] = operation
             
-        if current_tool_name.get():
-            log_entry['tool_name'] = current_tool_name.get()
-            
-        if request_id.get():
-            log_entry['request_id'] = request_id.get()
+            if prospect_id:
+                log_entry['prospect_id'] = prospect_id
+                
+            if tool_name:
+                log_entry['tool_name'] = tool_name
+                
+            if operation_request_id:
+                log_entry['request_id'] = operation_request_id
         
-        # Add exception information if present
+        # Add exception information if present; like logging.Formatter, the
+        # traceback text is cached on the record so other handlers reuse it
         if record.exc_info:
+            traceback = None
+            if self.include_traceback:
+                if record.exc_text is None:
+                    record.exc_text = self.formatException(record.exc_info)
+                traceback = record.exc_text
             log_entry['exception'] = {
                 'type': record.exc_info[0].__name__ if record.exc_info[0] else None,
                 'message': str(record.exc_info[1]) if record.exc_info[1] else None,
-                'traceback': self.formatException(record.exc_info) if record.exc_info else None
+                'traceback': traceback
             }
         
         # Add extra fields from the record
         for key, value in record.__dict__.items():
-            if key not in ['name', 'msg', 'args', 'levelname', 'levelno', 'pathname', 'filename',
-                          'module', 'exc_info', 'exc_text', 'stack_info', 'lineno', 'funcName',
-                          'created', 'msecs', 'relativeCreated', 'thread', 'threadName',
-                          'processName', 'process', 'message']:
+            if key not in _RESERVED_LOGRECORD_ATTRS:
                 log_entry[key] = value
         
-        return json.dumps(log_entry, default=str, ensure_ascii=False)
+        # orjson always emits UTF-8 (no ASCII escaping) and falls back to str() for other types
+        return orjson.dumps(log_entry, default=str, option=option)
+
+
+class BufferedStreamHandler(logging.StreamHandler):
+    """Stream handler that batches writes instead of flushing every record.
+    
+    Records at or above ``flush_level`` are flushed immediately so problems
+    are visible straight away; everything else reaches the stream within
+    ``flush_interval`` seconds via a background flusher thread, or when the
+    handler is closed (``logging.shutdown`` does this at exit).
+    """
+    
+    def __init__(self, stream=None, flush_level: int = logging.WARNING,
+                 flush_interval: float = 0.2):
+        super().__init__(stream)
+        self.flush_level = flush_level
+        self.flush_interval = flush_interval
+        self._stop_flusher = threading.Event()
+        self._flusher = threading.Thread(
+            target=self._flush_periodically, name='log-flusher', daemon=True
+        )
+        self._flusher.start()
+    
+    def _flush_periodically(self) -> None:
+        while not self._stop_flusher.wait(self.flush_interval):
+            self.flush()
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            # JSON lines go straight to the underlying binary buffer when there is one
+            buffer = getattr(self.stream, 'buffer', None)
+            if buffer is not None and isinstance(self.formatter, StructuredFormatter):
+                buffer.write(self.formatter.format_line(record))
+            else:
+                self.stream.write(self.format(record) + self.terminator)
+            if record.levelno >= self.flush_level:
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+    
+    def close(self) -> None:
+        self._stop_flusher.set()
+        try:
+            self.flush()
+        finally:
+            super().close()
+
+
+class ContextQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler that hands records to a background listener thread.
+    
+    The calling thread only renders the message and captures the logging
+    context variables; formatting and I/O happen on the listener. When
+    the queue is full the oldest record is dropped so logging never
+    blocks the caller.
+    """
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Copying a record imports copyreg, which fails once the interpreter
+        # is finalizing; queue the record itself then
+        if sys.is_finalizing():
+            return record
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        setattr(record, _CONTEXT_ATTR, log_context.get())
+        return record
+    
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            try:
+                self.queue.get_nowait()
+            except queue.Empty:
+                pass
+            self.queue.put_nowait(record)
+
+
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+_queue_handler: Optional[ContextQueueHandler] = None
+
+
+def _stop_queue_listener() -> None:
+    """Drain and stop the background log listener.
+    
+    The queue handler is swapped out of the root logger for the listener's
+    own handlers first, so records logged after this (for example by other
+    atexit hooks) are written directly instead of into an undrained queue.
+    Handlers that were not reinstalled are closed.
+    """
+    global _queue_listener, _queue_handler
+    if _queue_listener is None:
+        return
+    listener, _queue_listener = _queue_listener, None
+    queue_handler, _queue_handler = _queue_handler, None
+    
+    root_logger = logging.getLogger()
+    reinstalled = queue_handler in root_logger.handlers
+    if reinstalled:
+        for handler in listener.handlers:
+            root_logger.addHandler(handler)
+        root_logger.removeHandler(queue_handler)
+    listener.stop()
+    if not reinstalled:
+        for handler in listener.handlers:
+            handler.close()
+
+
+atexit.register(_stop_queue_listener)
+
+
+def _buffered_stderr(buffer_size: int = 65536):
+    """Open a block-buffered text stream on a duplicate of the stderr descriptor.
+    
+    Duplicating the descriptor means closing the handler never closes the
+    process stderr. Returns None when stderr has no usable descriptor
+    (for example when it has been replaced by a capture object).
+    """
+    try:
+        fd = os.dup(sys.stderr.fileno())
+    except (AttributeError, OSError, ValueError):
+        return None
+    return open(fd, 'w', buffering=buffer_size, encoding='utf-8', errors='backslashreplace')
+
+
+def _stderr_discarded() -> bool:
+    """Check whether stderr is redirected to the null device."""
+    try:
+        return os.path.samestat(os.fstat(sys.stderr.fileno()), os.stat(os.devnull))
+    except (AttributeError, OSError, ValueError):
+        return False
+
+
+# Frames between Logger.findCaller and the code calling ContextLogger.info() etc.
+_CALLER_STACKLEVEL = 3
 
 
 class ContextLogger:
     """Enhanced logger with automatic context tracking."""
     
+    __slots__ = ('logger',)
+    
     def __init__(self, name: str):
         self.logger = logging.getLogger(name)
     
     def _log_with_context(self, level: int, message: str, **kwargs) -> None:
         """Log with automatic context inclusion."""
+        # Skip building context for records the logger would discard anyway
+        if not self.logger.isEnabledFor(level):
+            return
+        
         extra_context = {}
         
         # Add timing information for operations
-        if current_operation.get():
-            extra_context['operation_context'] = {
-                'operation': current_operation.get(),
-                'prospect_id': current_prospect_id.get(),
-                'tool_name': current_tool_name.get(),
-                'request_id': request_id.get()
-            }
+        context = log_context.get()
+        if context.operation:
+            extra_context['operation_context'] = context._asdict()
         
         # Handle exc_info separately to avoid conflicts
         exc_info = kwargs.pop('exc_info', None)
@@ -89,11 +293,28 @@ class ContextLogger:
         # Merge with any additional context provided
         extra_context.update(kwargs)
         
-        # Log with or without exception info
+        # Normalize exc_info as Logger._log does
         if exc_info:
-            self.logger.log(level, message, exc_info=exc_info, extra=extra_context)
+            if isinstance(exc_info, BaseException):
+                exc_info = (type(exc_info), exc_info, exc_info.__traceback__)
+            elif not isinstance(exc_info, tuple):
+                exc_info = sys.exc_info()
         else:
-            self.logger.log(level, message, extra=extra_context)
+            exc_info = None
+        
+        # Build and dispatch the record directly: the level is already checked, so
+        # Logger.log would only repeat that check. The caller of debug()/info()/...
+        # is two frames above this one, so records point at the real call site.
+        pathname, lineno, func, _ = self.logger.findCaller(stacklevel=_CALLER_STACKLEVEL)
+        record = self.logger.makeRecord(
+            self.logger.name, level, pathname, lineno, message, None, exc_info,
+            func, extra_context
+        )
+        self.logger.handle(record)
+    
+    def isEnabledFor(self, level: int) -> bool:
+        """Check whether a message at level would be logged, to skip building costly fields."""
+        return self.logger.isEnabledFor(level)
     
     def debug(self, message: str, **kwargs) -> None:
         """Log debug message with context."""
@@ -116,14 +337,22 @@ class ContextLogger:
         self._log_with_context(logging.ERROR, message, exc_info=True, **kwargs)
 
 
-def setup_logging(level: str = "INFO", structured: bool = True) -> None:
+def setup_logging(level: str = "INFO", structured: bool = True, buffered: bool = True,
+                  queued: bool = True, buffer_size: int = 65536,
+                  flush_interval: float = 0.2) -> None:
     """
     Configure application-wide logging.
     
     Args:
         level: Logging level (DEBUG, INFO, WARNING, ERROR)
         structured: Whether to use structured JSON logging
+        buffered: Whether to batch stderr writes (warnings and errors are
+            still flushed immediately)
+        queued: Whether to format and write records on a background thread
+        buffer_size: Bytes of output batched into one stderr write when buffered
+        flush_interval: Longest delay in seconds before buffered output is written
     """
+    global _queue_listener, _queue_handler
     # Convert string level to logging constant
     numeric_level = getattr(logging, level.upper(), logging.INFO)
     
@@ -131,12 +360,25 @@ def setup_logging(level: str = "INFO", structured: bool = True) -> None:
     root_logger = logging.getLogger()
     root_logger.setLevel(numeric_level)
     
-    # Remove existing handlers
+    # Remove existing handlers, stopping the listener and flusher threads of our own
+    _stop_queue_listener()
     for handler in root_logger.handlers[:]:
         root_logger.removeHandler(handler)
+        if isinstance(handler, BufferedStreamHandler):
+            handler.close()
+    
+    # Nobody reads stderr (common for stdio transport deployments), so skip
+    # formatting and writing altogether
+    if _stderr_discarded():
+        root_logger.addHandler(logging.NullHandler())
+        return
     
     # Create console handler
-    console_handler = logging.StreamHandler()
+    stream = _buffered_stderr(buffer_size) if buffered else None
+    if stream is not None:
+        console_handler = BufferedStreamHandler(stream, flush_interval=flush_interval)
+    else:
+        console_handler = logging.StreamHandler()
     console_handler.setLevel(numeric_level)
     
     if structured:
@@ -147,34 +389,86 @@ def setup_logging(level: str = "INFO", structured: bool = True) -> None:
         )
     
     console_handler.setFormatter(formatter)
-    root_logger.addHandler(console_handler)
+    
+    if queued:
+        queue_handler = ContextQueueHandler(queue.Queue(_LOG_QUEUE_SIZE))
+        queue_handler.setLevel(numeric_level)
+        _queue_listener = logging.handlers.QueueListener(
+            queue_handler.queue, console_handler, respect_handler_level=True
+        )
+        _queue_listener.start()
+        _queue_handler = queue_handler
+        root_logger.addHandler(queue_handler)
+    else:
+        root_logger.addHandler(console_handler)
+
+
+# One ContextLogger per name, like logging.getLogger
+_LOGGER_CACHE: Dict[str, ContextLogger] = {}
 
 
 def get_logger(name: str) -> ContextLogger:
     """Get a context-aware logger for the given name."""
-    return ContextLogger(name)
+    context_logger = _LOGGER_CACHE.get(name)
+    if context_logger is None:
+        # setdefault keeps one instance if two threads miss at once
+        context_logger = _LOGGER_CACHE.setdefault(name, ContextLogger(name))
+    return context_logger
+
+
+# Request IDs are 16 random bytes in hex, sliced from a per-thread pool of
+# random bytes so most operations need no urandom syscall
+_ID_BYTES = 16
+_ID_POOL_BYTES = 4096
+_id_pool = threading.local()
+
+
+def _reset_id_pool() -> None:
+    """Discard pooled random bytes so a forked child never reuses the parent's IDs."""
+    global _id_pool
+    _id_pool = threading.local()
+
+
+os.register_at_fork(after_in_child=_reset_id_pool)
+
+
+def _next_request_id() -> str:
+    """Return a new random 32-character hex request ID."""
+    pool = _id_pool
+    offset = getattr(pool, 'offset', _ID_POOL_BYTES)
+    if offset + _ID_BYTES > _ID_POOL_BYTES:
+        pool.buffer = os.urandom(_ID_POOL_BYTES)
+        offset = 0
+    pool.offset = offset + _ID_BYTES
+    return pool.buffer[offset:offset + _ID_BYTES].hex()
 
 
 class OperationContext:
     """Context manager for tracking operations with automatic logging."""
     
+    __slots__ = ('operation', 'prospect_id', 'tool_name', 'request_id', 'start_time',
+                 '_start_ns', '_context_token', 'logger')
+    
     def __init__(self, operation: str, prospect_id: Optional[str] = None, 
                  tool_name: Optional[str] = None):
         self.operation = operation
         self.prospect_id = prospect_id
         self.tool_name = tool_name
-        self.request_id = str(uuid.uuid4())
+        self.request_id = _next_request_id()
         self.start_time = None
+        self._start_ns = None
+        self._context_token = None
         self.logger = get_logger(f"operation.{operation}")
     
     def __enter__(self):
         # Set context variables
-        current_operation.set(self.operation)
-        current_prospect_id.set(self.prospect_id)
-        current_tool_name.set(self.tool_name)
-        request_id.set(self.request_id)
+        self._context_token = log_context.set(
+            LogContext(self.operation, self.prospect_id, self.tool_name, self.request_id)
+        )
         
+        # Wall-clock start for the log; monotonic start for the duration
         self.start_time = time.time()
+        self._start_ns = time.monotonic_ns()
         
         # Log operation start
         self.logger.info(
@@ -186,7 +480,7 @@ class OperationContext:
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
-        duration = time.time() - self.start_time if self.start_time else 0
+        duration = (time.monotonic_ns() - self._start_ns) / 1e9 if self._start_ns is not None else 0
         
         if exc_type is None:
             # Successful completion
@@ -207,11 +501,8 @@ class OperationContext:
                 error_message=str(exc_val) if exc_val else None
             )
         
-        # Clear context variables
-        current_operation.set(None)
-        current_prospect_id.set(None)
-        current_tool_name.set(None)
-        request_id.set(None)
+        # Restore the enclosing operation's context (if any)
+        log_context.reset(self._context_token)
 
 
 # Initialize logging on module import
@@ -3,15 +3,61 @@ MCP Server CLI for prospect research automation.
 Provides commands to run, test, and manage the MCP server.
 """
 
-import asyncio
 import click
-import json
+import functools
+import orjson
 import os
+import re
 from typing import Any, Dict
-from src.mcp_server.server import main as run_server
-from src.mcp_server.tools import research_prospect, create_profile, get_prospect_data, search_prospects
 from src.config import validate_configuration, EnvironmentConfig
 
+# The server and tools pull in the database, data sources and LLM clients, and
+# asyncio alone is a large share of startup, so these are imported inside the
+# commands that need them; info, config and validate-env stay fast
+
+# Tool name -> required argument; tools are looked up in src.mcp_server.tools by name
+_TOOLS = {
+    "research_prospect": "company",
+    "create_profile": "prospect_id",
+    "get_prospect_data": "prospect_id",
+    "search_prospects": "query",
+}
+
+# research_prospect returns a markdown summary; benchmark reads the new prospect's ID from it
+_PROSPECT_ID_PATTERN = re.compile(r"\*\*Prospect ID\*\*: (\S+)")
+
+# Environment variables reported by validate
+_REQUIRED_ENV = ('FIRECRAWL_API_KEY',)
+_OPTIONAL_ENV = (
+    'APOLLO_API_KEY', 'SERPER_API_KEY', 'AWS_ACCESS_KEY_ID',
+    'AWS_SECRET_ACCESS_KEY', 'LINKEDIN_EMAIL', 'LINKEDIN_PASSWORD'
+)
+_WATCHED_ENV = _REQUIRED_ENV + _OPTIONAL_ENV
+
+# Server configuration defaults; start() options and config() overlays build on these
+_DEFAULT_CONFIG = {
+    'llm_enabled': True,
+    'llm_provider': 'bedrock',
+    'model_id': 'apac.anthropic.claude-sonnet-4-20250514-v1:0',
+    'aws_region': 'ap-southeast-2',
+    'temperature': 0.3,
+    'max_tokens': 4000,
+    'timeout_seconds': 60,
+    'data_sources': {
+        'firecrawl_enabled': True,
+        'apollo_enabled': True,
+        'serper_enabled': True,
+        'playwright_enabled': True,
+        'linkedin_auth': False,
+        'job_boards_auth': False
+    },
+    'fallback_mode': 'graceful'
+}
+_DEFAULT_DATA_SOURCES = _DEFAULT_CONFIG['data_sources']
+
+# yaml.dump options for config --output-format=yaml; keys keep the JSON output order
+_YAML_DUMP_KWARGS = {"default_flow_style": False, "sort_keys": False}
+
 @click.group()
 def mcp_cli():
     """MCP Server management commands."""
@@ -19,20 +65,20 @@ def mcp_cli():
 
 @mcp_cli.command("start")
 @click.option("--debug", is_flag=True, help="Enable debug logging")
-@click.option("--llm-enabled", type=bool, default=True, help="Enable LLM intelligence middleware")
-@click.option("--llm-provider", type=click.Choice(['bedrock', 'anthropic', 'openai']), default='bedrock', help="LLM provider")
-@click.option("--model-id", type=str, default='apac.anthropic.claude-sonnet-4-20250514-v1:0', help="LLM model ID")
-@click.option("--aws-region", type=str, default='ap-southeast-2', help="AWS region for Bedrock")
-@click.option("--temperature", type=float, default=0.3, help="LLM temperature (0.0-1.0)")
-@click.option("--max-tokens", type=int, default=4000, help="Maximum tokens for LLM responses")
-@click.option("--timeout-seconds", type=int, default=60, help="Timeout for LLM requests")
-@click.option("--firecrawl-enabled", type=bool, default=True, help="Enable Firecrawl web scraping")
-@click.option("--apollo-enabled", type=bool, default=True, help="Enable Apollo.io contact enrichment")
-@click.option("--serper-enabled", type=bool, default=True, help="Enable Serper search API")
-@click.option("--playwright-enabled", type=bool, default=True, help="Enable Playwright browser automation")
-@click.option("--linkedin-auth", type=bool, default=False, help="Enable LinkedIn authenticated browsing")
-@click.option("--job-boards-auth", type=bool, default=False, help="Enable job boards authenticated searches")
-@click.option("--fallback-mode", type=click.Choice(['strict', 'graceful', 'manual']), default='graceful', help="Error handling mode")
+@click.option("--llm-enabled", type=bool, default=_DEFAULT_CONFIG['llm_enabled'], help="Enable LLM intelligence middleware")
+@click.option("--llm-provider", type=click.Choice(['bedrock', 'anthropic', 'openai']), default=_DEFAULT_CONFIG['llm_provider'], help="LLM provider")
+@click.option("--model-id", type=str, default=_DEFAULT_CONFIG['model_id'], help="LLM model ID")
+@click.option("--aws-region", type=str, default=_DEFAULT_CONFIG['aws_region'], help="AWS region for Bedrock")
+@click.option("--temperature", type=float, default=_DEFAULT_CONFIG['temperature'], help="LLM temperature (0.0-1.0)")
+@click.option("--max-tokens", type=int, default=_DEFAULT_CONFIG['max_tokens'], help="Maximum tokens for LLM responses")
+@click.option("--timeout-seconds", type=int, default=_DEFAULT_CONFIG['timeout_seconds'], help="Timeout for LLM requests")
+@click.option("--firecrawl-enabled", type=bool, default=_DEFAULT_DATA_SOURCES['firecrawl_enabled'], help="Enable Firecrawl web scraping")
+@click.option("--apollo-enabled", type=bool, default=_DEFAULT_DATA_SOURCES['apollo_enabled'], help="Enable Apollo.io contact enrichment")
+@click.option("--serper-enabled", type=bool, default=_DEFAULT_DATA_SOURCES['serper_enabled'], help="Enable Serper search API")
+@click.option("--playwright-enabled", type=bool, default=_DEFAULT_DATA_SOURCES['playwright_enabled'], help="Enable Playwright browser automation")
+@click.option("--linkedin-auth", type=bool, default=_DEFAULT_DATA_SOURCES['linkedin_auth'], help="Enable LinkedIn authenticated browsing")
+@click.option("--job-boards-auth", type=bool, default=_DEFAULT_DATA_SOURCES['job_boards_auth'], help="Enable job boards authenticated searches")
+@click.option("--fallback-mode", type=click.Choice(['strict', 'graceful', 'manual']), default=_DEFAULT_CONFIG['fallback_mode'], help="Error handling mode")
 @click.option("--validate-env/--skip-validation", default=True, help="Validate environment before starting")
 def start(debug: bool, llm_enabled: bool, llm_provider: str, model_id: str, aws_region: str, 
           temperature: float, max_tokens: int, timeout_seconds: int, firecrawl_enabled: bool,
@@ -80,7 +126,7 @@ def start(debug: bool, llm_enabled: bool, llm_provider: str, model_id: str, aws_
     }
     
     # Set environment configuration for runtime
-    os.environ['MCP_SERVER_CONFIG'] = json.dumps(config)
+    os.environ['MCP_SERVER_CONFIG'] = orjson.dumps(config).decode()
     
     click.echo("Starting MCP server with complete configuration...")
     click.echo(f"LLM Provider: {llm_provider} ({'enabled' if llm_enabled else 'disabled'})")
@@ -89,8 +135,38 @@ def start(debug: bool, llm_enabled: bool, llm_provider: str, model_id: str, aws_
     click.echo(f"Authentication: LinkedIn={linkedin_auth}, Job Boards={job_boards_auth}")
     click.echo(f"Fallback Mode: {fallback_mode}")
     
+    import asyncio
+    import signal
+    from src.mcp_server.server import main as run_server, run as run_loop
+    
+    async def serve():
+        # SIGINT/SIGTERM set an event instead of raising KeyboardInterrupt through the
+        # coroutine tree; the server task is then cancelled and awaited
+        loop = asyncio.get_running_loop()
+        stop = asyncio.Event()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, stop.set)
+            except (NotImplementedError, RuntimeError):
+                # No loop signal handlers (e.g. Windows); KeyboardInterrupt still applies
+                pass
+        
+        server_task = asyncio.create_task(run_server())
+        stop_task = asyncio.create_task(stop.wait())
+        done, _ = await asyncio.wait({server_task, stop_task}, return_when=asyncio.FIRST_COMPLETED)
+        stop_task.cancel()
+        if server_task in done:
+            return server_task.result()
+        
+        server_task.cancel()
+        try:
+            await server_task
+        except asyncio.CancelledError:
+            pass
+        click.echo("\nMCP server stopped.")
+    
     try:
-        asyncio.run(run_server())
+        run_loop(serve())
     except KeyboardInterrupt:
         click.echo("\nMCP server stopped.")
     except Exception as e:
@@ -98,7 +174,7 @@ def start(debug: bool, llm_enabled: bool, llm_provider: str, model_id: str, aws_
         raise
 
 @mcp_cli.command("test-tool")
-@click.argument("tool_name", type=click.Choice(["research_prospect", "create_profile", "get_prospect_data", "search_prospects"]))
+@click.argument("tool_name", type=click.Choice(list(_TOOLS)))
 @click.argument("arguments", required=False)
 def test_tool(tool_name: str, arguments: str = None):
     """Test an individual MCP tool with given arguments.
@@ -113,37 +189,21 @@ def test_tool(tool_name: str, arguments: str = None):
         # Parse arguments
         if arguments:
             try:
-                args_dict = json.loads(arguments)
-            except json.JSONDecodeError as e:
+                args_dict = orjson.loads(arguments)
+            except orjson.JSONDecodeError as e:
                 click.echo(f"Invalid JSON arguments: {e}", err=True)
                 return
         else:
             args_dict = {}
         
         # Select and run the tool
-        if tool_name == "research_prospect":
-            if "company" not in args_dict:
-                click.echo("Error: research_prospect requires 'company' parameter", err=True)
-                return
-            result = asyncio.run(research_prospect(args_dict["company"]))
-        
-        elif tool_name == "create_profile":
-            if "prospect_id" not in args_dict:
-                click.echo("Error: create_profile requires 'prospect_id' parameter", err=True)
-                return
-            result = asyncio.run(create_profile(args_dict["prospect_id"]))
-        
-        elif tool_name == "get_prospect_data":
-            if "prospect_id" not in args_dict:
-                click.echo("Error: get_prospect_data requires 'prospect_id' parameter", err=True)
-                return
-            result = asyncio.run(get_prospect_data(args_dict["prospect_id"]))
-        
-        elif tool_name == "search_prospects":
-            if "query" not in args_dict:
-                click.echo("Error: search_prospects requires 'query' parameter", err=True)
-                return
-            result = asyncio.run(search_prospects(args_dict["query"]))
+        param = _TOOLS[tool_name]
+        if param not in args_dict:
+            click.echo(f"Error: {tool_name} requires '{param}' parameter", err=True)
+            return
+        import asyncio
+        from src.mcp_server import tools
+        result = asyncio.run(getattr(tools, tool_name)(args_dict[param]))
         
         # Display result
         click.echo(f"\n=== Tool Result ===")
@@ -186,11 +246,13 @@ def info():
         }
     ]
     
-    for tool in tools_info:
-        click.echo(f"• {tool['name']}")
-        click.echo(f"  Description: {tool['description']}")
-        click.echo(f"  Parameters: {', '.join(tool['parameters'])}")
-        click.echo()
+    # One write for the whole listing; each tool block ends with a blank line
+    click.echo("".join(
+        f"• {tool['name']}\n"
+        f"  Description: {tool['description']}\n"
+        f"  Parameters: {', '.join(tool['parameters'])}\n\n"
+        for tool in tools_info
+    ), nl=False)
 
 @mcp_cli.command("validate")
 @click.option("--check-apis", is_flag=True, help="Check API connectivity for all configured services")
@@ -198,6 +260,8 @@ def info():
 @click.option("--check-data-sources", is_flag=True, help="Validate all data source configurations")
 def validate(check_apis: bool, check_llm: bool, check_data_sources: bool):
     """Validate the MCP server configuration and dependencies."""
+    import asyncio
+    
     click.echo("=== Validating MCP Server ===")
     
     # Check imports
@@ -212,65 +276,70 @@ def validate(check_apis: bool, check_llm: bool, check_data_sources: bool):
         click.echo(f"✗ Import error: {e}", err=True)
         return
     
-    # Check data directories
-    import os
-    data_dirs = ["data/prospects", "data/database"]
-    for dir_path in data_dirs:
-        if os.path.exists(dir_path):
-            click.echo(f"✓ Directory exists: {dir_path}")
-        else:
-            click.echo(f"⚠ Directory missing: {dir_path}")
-    
-    # Check database connection
+    # Check data directories with one listing of data/
     try:
-        asyncio.run(init_db())
-        click.echo("✓ Database connection successful")
-    except Exception as e:
-        click.echo(f"✗ Database error: {e}", err=True)
+        with os.scandir("data") as entries:
+            existing = {entry.name for entry in entries if entry.is_dir()}
+    except (FileNotFoundError, NotADirectoryError):
+        existing = set()
+    for name in ("prospects", "database"):
+        if name in existing:
+            click.echo(f"✓ Directory exists: data/{name}")
+        else:
+            click.echo(f"⚠ Directory missing: data/{name}")
     
-    # Check environment variables
-    required_env_vars = ['FIRECRAWL_API_KEY']
-    optional_env_vars = [
-        'APOLLO_API_KEY', 'SERPER_API_KEY', 'AWS_ACCESS_KEY_ID', 
-        'AWS_SECRET_ACCESS_KEY', 'LINKEDIN_EMAIL', 'LINKEDIN_PASSWORD'
-    ]
+    # Check environment variables; the environment doesn't change during a command,
+    # so snapshot the set, non-empty ones once for all checks
+    env = {var: value for var in _WATCHED_ENV if (value := os.environ.get(var))}
     
     click.echo("\n=== Environment Variables ===")
-    for var in required_env_vars:
-        if os.getenv(var):
+    for var in _REQUIRED_ENV:
+        if var in env:
             click.echo(f"✓ {var} configured")
         else:
             click.echo(f"✗ {var} missing (required)", err=True)
     
-    for var in optional_env_vars:
-        if os.getenv(var):
+    for var in _OPTIONAL_ENV:
+        if var in env:
             click.echo(f"✓ {var} configured")
         else:
             click.echo(f"⚠ {var} not configured (optional for enhanced features)")
     
-    # API connectivity checks
-    if check_apis:
-        click.echo("\n=== API Connectivity Tests ===")
-        asyncio.run(_test_api_connectivity())
+    # Database and connectivity checks share one event loop
+    asyncio.run(_validate_all(init_db, env, check_apis, check_llm, check_data_sources))
     
-    # LLM connectivity checks
-    if check_llm:
-        click.echo("\n=== LLM Configuration Tests ===")
-        asyncio.run(_test_llm_connectivity())
+    click.echo("\nValidation complete.")
+
+async def _validate_all(init_db, env: Dict[str, Any], check_apis: bool, check_llm: bool, check_data_sources: bool):
+    """Check the database, then run the requested connectivity checks concurrently."""
+    import asyncio
+    
+    click.echo("\n=== Database ===")
+    try:
+        await init_db()
+        click.echo("✓ Database connection successful")
+    except Exception as e:
+        click.echo(f"✗ Database error: {e}", err=True)
     
-    # Data source validation
+    checks = []
+    if check_apis:
+        checks.append(_test_api_connectivity(env))
+    if check_llm:
+        checks.append(_test_llm_connectivity(env))
     if check_data_sources:
-        click.echo("\n=== Data Source Validation ===")
-        asyncio.run(_test_data_sources())
+        checks.append(_test_data_sources(env))
     
-    click.echo("\nValidation complete.")
+    results = await asyncio.gather(*checks, return_exceptions=True)
+    for result in results:
+        if isinstance(result, Exception):
+            click.echo(f"✗ Validation check failed: {result}", err=True)
 
-async def _test_api_connectivity():
+async def _test_api_connectivity(env: Dict[str, Any]):
     """Test API connectivity for configured services."""
-    import os
+    click.echo("\n=== API Connectivity Tests ===")
     
     # Test Firecrawl
-    if os.getenv('FIRECRAWL_API_KEY'):
+    if 'FIRECRAWL_API_KEY' in env:
         try:
             # Basic connectivity test - you can implement actual API calls here
             click.echo("✓ Firecrawl API key available")
@@ -278,27 +347,27 @@ async def _test_api_connectivity():
             click.echo(f"✗ Firecrawl API test failed: {e}")
     
     # Test Apollo.io
-    if os.getenv('APOLLO_API_KEY'):
+    if 'APOLLO_API_KEY' in env:
         try:
             click.echo("✓ Apollo.io API key available")
         except Exception as e:
             click.echo(f"✗ Apollo.io API test failed: {e}")
     
     # Test Serper
-    if os.getenv('SERPER_API_KEY'):
+    if 'SERPER_API_KEY' in env:
         try:
             click.echo("✓ Serper API key available")
         except Exception as e:
             click.echo(f"✗ Serper API test failed: {e}")
 
-async def _test_llm_connectivity():
+async def _test_llm_connectivity(env: Dict[str, Any]):
     """Test LLM connectivity and configuration."""
-    import os
+    click.echo("\n=== LLM Configuration Tests ===")
     
-    if os.getenv('AWS_ACCESS_KEY_ID') and os.getenv('AWS_SECRET_ACCESS_KEY'):
+    if 'AWS_ACCESS_KEY_ID' in env and 'AWS_SECRET_ACCESS_KEY' in env:
         try:
             from src.llm_enhancer.client import BedrockClient
-            client = BedrockClient()
+            client = BedrockClient.shared()
             click.echo("✓ AWS Bedrock client initialized")
             
             # You can add a simple test call here
@@ -308,11 +377,18 @@ async def _test_llm_connectivity():
     else:
         click.echo("⚠ AWS credentials not configured, LLM features will be disabled")
 
-async def _test_data_sources():
+@functools.lru_cache(maxsize=1)
+def _data_source_manager():
+    """Return the DataSourceManager shared by the validation checks in this process."""
+    from src.data_sources.manager import DataSourceManager
+    return DataSourceManager()
+
+async def _test_data_sources(env: Dict[str, Any]):
     """Test data source configurations."""
+    click.echo("\n=== Data Source Validation ===")
+    
     try:
-        from src.data_sources.manager import DataSourceManager
-        manager = DataSourceManager()
+        manager = _data_source_manager()
         
         # Test data source initialization
         click.echo("✓ Data source manager initialized")
@@ -426,139 +502,171 @@ def test_config(component):
         else:
             click.echo(f"Unknown component: {component}")
 
+@functools.lru_cache(maxsize=1)
+def _parse_runtime_config(raw: str) -> Dict[str, Any]:
+    """Decode a MCP_SERVER_CONFIG value; invalid or non-object JSON yields {}. Callers must not mutate the result."""
+    try:
+        config = orjson.loads(raw) if raw else {}
+    except orjson.JSONDecodeError:
+        return {}
+    return config if isinstance(config, dict) else {}
+
+def _load_runtime_config() -> Dict[str, Any]:
+    """Return the runtime overrides from MCP_SERVER_CONFIG, decoding each distinct value once."""
+    return _parse_runtime_config(os.environ.get('MCP_SERVER_CONFIG', ''))
+
 @mcp_cli.command("config")
 @click.option("--output-format", type=click.Choice(['json', 'yaml', 'env']), default='json', help="Output format")
 def config(output_format: str):
     """Display current configuration and environment variables."""
-    import os
-    
     click.echo("=== Current MCP Server Configuration ===")
     
     # Get configuration from environment or defaults
-    config_str = os.getenv('MCP_SERVER_CONFIG', '{}')
-    try:
-        config = json.loads(config_str)
-    except json.JSONDecodeError:
-        config = {}
-    
-    # Default configuration
-    default_config = {
-        'llm_enabled': True,
-        'llm_provider': 'bedrock',
-        'model_id': 'apac.anthropic.claude-sonnet-4-20250514-v1:0',
-        'aws_region': 'ap-southeast-2',
-        'temperature': 0.3,
-        'max_tokens': 4000,
-        'timeout_seconds': 60,
-        'data_sources': {
-            'firecrawl_enabled': True,
-            'apollo_enabled': True,
-            'serper_enabled': True,
-            'playwright_enabled': True,
-            'linkedin_auth': False,
-            'job_boards_auth': False
-        },
-        'fallback_mode': 'graceful'
-    }
+    config = _load_runtime_config()
     
-    # Merge with defaults
-    final_config = {**default_config, **config}
+    # Merge with defaults; data_sources is merged per key so partial overrides keep the rest
+    final_config = {
+        **_DEFAULT_CONFIG,
+        **config,
+        'data_sources': {**_DEFAULT_DATA_SOURCES, **config.get('data_sources', {})}
+    }
     
+    # click.echo writes bytes straight to the binary stdout buffer, so orjson output isn't re-encoded
     if output_format == 'json':
-        click.echo(json.dumps(final_config, indent=2))
+        click.echo(orjson.dumps(final_config, option=orjson.OPT_INDENT_2))
     elif output_format == 'yaml':
         try:
             import yaml
-            click.echo(yaml.dump(final_config, default_flow_style=False))
+            dumper = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+            click.echo(yaml.dump(final_config, Dumper=dumper, **_YAML_DUMP_KWARGS))
         except ImportError:
             click.echo("YAML output requires PyYAML package", err=True)
-            click.echo(json.dumps(final_config, indent=2))
+            click.echo(orjson.dumps(final_config, option=orjson.OPT_INDENT_2))
     elif output_format == 'env':
-        click.echo("# Environment variables for MCP Server")
-        click.echo(f"MCP_LLM_ENABLED={final_config['llm_enabled']}")
-        click.echo(f"MCP_LLM_PROVIDER={final_config['llm_provider']}")
-        click.echo(f"MCP_MODEL_ID={final_config['model_id']}")
-        click.echo(f"MCP_AWS_REGION={final_config['aws_region']}")
-        click.echo(f"MCP_TEMPERATURE={final_config['temperature']}")
-        click.echo(f"MCP_MAX_TOKENS={final_config['max_tokens']}")
-        click.echo(f"MCP_TIMEOUT_SECONDS={final_config['timeout_seconds']}")
-        click.echo(f"MCP_FALLBACK_MODE={final_config['fallback_mode']}")
-        
         data_sources = final_config['data_sources']
-        click.echo(f"MCP_FIRECRAWL_ENABLED={data_sources['firecrawl_enabled']}")
-        click.echo(f"MCP_APOLLO_ENABLED={data_sources['apollo_enabled']}")
-        click.echo(f"MCP_SERPER_ENABLED={data_sources['serper_enabled']}")
-        click.echo(f"MCP_PLAYWRIGHT_ENABLED={data_sources['playwright_enabled']}")
-        click.echo(f"MCP_LINKEDIN_AUTH={data_sources['linkedin_auth']}")
-        click.echo(f"MCP_JOB_BOARDS_AUTH={data_sources['job_boards_auth']}")
+        click.echo("\n".join((
+            "# Environment variables for MCP Server",
+            f"MCP_LLM_ENABLED={final_config['llm_enabled']}",
+            f"MCP_LLM_PROVIDER={final_config['llm_provider']}",
+            f"MCP_MODEL_ID={final_config['model_id']}",
+            f"MCP_AWS_REGION={final_config['aws_region']}",
+            f"MCP_TEMPERATURE={final_config['temperature']}",
+            f"MCP_MAX_TOKENS={final_config['max_tokens']}",
+            f"MCP_TIMEOUT_SECONDS={final_config['timeout_seconds']}",
+            f"MCP_FALLBACK_MODE={final_config['fallback_mode']}",
+            f"MCP_FIRECRAWL_ENABLED={data_sources['firecrawl_enabled']}",
+            f"MCP_APOLLO_ENABLED={data_sources['apollo_enabled']}",
+            f"MCP_SERPER_ENABLED={data_sources['serper_enabled']}",
+            f"MCP_PLAYWRIGHT_ENABLED={data_sources['playwright_enabled']}",
+            f"MCP_LINKEDIN_AUTH={data_sources['linkedin_auth']}",
+            f"MCP_JOB_BOARDS_AUTH={data_sources['job_boards_auth']}",
+        )))
 
 @mcp_cli.command("benchmark")
 @click.option("--test-company", type=str, default="TestCorp", help="Company name for benchmark test")
 @click.option("--iterations", type=int, default=1, help="Number of benchmark iterations")
+@click.option("--concurrency", type=click.IntRange(min=1), default=1, help="Maximum iterations run at the same time")
+@click.option("--async-mode", is_flag=True, help="Start every iteration's research up front so research jobs overlap")
 @click.option("--measure-performance", is_flag=True, help="Measure detailed performance metrics")
-def benchmark(test_company: str, iterations: int, measure_performance: bool):
+@click.option("--quiet", is_flag=True, help="Only print the summary, not per-iteration progress")
+def benchmark(test_company: str, iterations: int, concurrency: int, async_mode: bool,
+              measure_performance: bool, quiet: bool):
     """Run benchmark tests for MCP server performance."""
+    import asyncio
     import time
+    from src.mcp_server.tools import research_prospect, create_profile, get_prospect_data
     
     click.echo(f"=== MCP Server Benchmark ===")
     click.echo(f"Test Company: {test_company}")
     click.echo(f"Iterations: {iterations}")
+    click.echo(f"Concurrency: {concurrency}")
     
-    async def run_benchmark():
-        total_time = 0
-        successful_runs = 0
+    async def _timed_research():
+        """Run research_prospect; returns the result with its start and end timestamps."""
+        start = time.perf_counter_ns()
+        result = await research_prospect(test_company)
+        return result, start, time.perf_counter_ns()
+    
+    async def _one_iteration(i, sem, research_job=None):
+        """Run research, profile and data retrieval once; returns the stage timings or None.
         
-        for i in range(iterations):
-            click.echo(f"\nIteration {i + 1}/{iterations}")
-            
+        With a research_job already running, only its result is awaited here.
+        Progress lines are collected and written together when the iteration ends.
+        """
+        async with sem:
+            buf = [f"\nIteration {i + 1}/{iterations}"]
             try:
-                start_time = time.time()
-                
                 # Test research_prospect
-                click.echo("  Testing research_prospect...")
-                research_result = await research_prospect(test_company)
-                research_time = time.time() - start_time
+                buf.append("  Testing research_prospect...")
+                if research_job is None:
+                    research_job = _timed_research()
+                research_result, t0, t1 = await research_job
                 
-                # Extract prospect_id from result
-                prospect_id = research_result.get('prospect_id')
+                # Extract prospect_id from the markdown summary
+                match = _PROSPECT_ID_PATTERN.search(research_result)
+                prospect_id = match.group(1) if match else None
                 if not prospect_id:
-                    click.echo("  ✗ No prospect_id returned from research")
-                    continue
+                    buf.append(f"  ✗ Iteration {i + 1}: no prospect_id returned from research")
+                    return None
                 
                 # Test create_profile
-                click.echo("  Testing create_profile...")
-                profile_start = time.time()
+                buf.append("  Testing create_profile...")
                 profile_result = await create_profile(prospect_id)
-                profile_time = time.time() - profile_start
+                t2 = time.perf_counter_ns()
                 
                 # Test get_prospect_data
-                click.echo("  Testing get_prospect_data...")
-                data_start = time.time()
+                buf.append("  Testing get_prospect_data...")
                 data_result = await get_prospect_data(prospect_id)
-                data_time = time.time() - data_start
+                t3 = time.perf_counter_ns()
                 
-                total_iteration_time = time.time() - start_time
-                total_time += total_iteration_time
-                successful_runs += 1
+                # Stage timings are deltas between adjacent timestamps, in nanoseconds
+                timings = (t1 - t0, t2 - t1, t3 - t2, t3 - t0)
                 
                 if measure_performance:
-                    click.echo(f"    Research time: {research_time:.2f}s")
-                    click.echo(f"    Profile time: {profile_time:.2f}s")
-                    click.echo(f"    Data retrieval time: {data_time:.2f}s")
-                    click.echo(f"    Total time: {total_iteration_time:.2f}s")
-                
-                click.echo(f"  ✓ Iteration {i + 1} completed successfully")
+                    research_ns, profile_ns, data_ns, total_ns = timings
+                    buf.append(f"    Research time: {research_ns / 1e9:.2f}s")
+                    buf.append(f"    Profile time: {profile_ns / 1e9:.2f}s")
+                    buf.append(f"    Data retrieval time: {data_ns / 1e9:.2f}s")
+                    buf.append(f"    Total time: {total_ns / 1e9:.2f}s")
                 
-            except Exception as e:
-                click.echo(f"  ✗ Iteration {i + 1} failed: {e}")
+                buf.append(f"  ✓ Iteration {i + 1} completed successfully")
+                return timings
+            finally:
+                if not quiet:
+                    click.echo("\n".join(buf))
+    
+    async def run_benchmark():
+        sem = asyncio.Semaphore(concurrency)
+        wall_start = time.perf_counter_ns()
+        # In async mode research is dispatched for all iterations at once and the
+        # semaphore only bounds the profile and data stages
+        if async_mode:
+            jobs = [asyncio.create_task(_timed_research()) for _ in range(iterations)]
+        else:
+            jobs = [None] * iterations
+        results = await asyncio.gather(
+            *(_one_iteration(i, sem, jobs[i]) for i in range(iterations)), return_exceptions=True
+        )
+        wall_time = (time.perf_counter_ns() - wall_start) / 1e9
+        
+        total_ns = 0
+        successful_runs = 0
+        for i, result in enumerate(results):
+            if isinstance(result, Exception):
+                click.echo(f"  ✗ Iteration {i + 1} failed: {result}")
+            elif result is not None:
+                total_ns += result[3]
+                successful_runs += 1
         
         # Summary
         click.echo(f"\n=== Benchmark Results ===")
         click.echo(f"Successful runs: {successful_runs}/{iterations}")
+        total_time = total_ns / 1e9
         if successful_runs > 0:
             avg_time = total_time / successful_runs
             click.echo(f"Average time per run: {avg_time:.2f}s")
             click.echo(f"Total time: {total_time:.2f}s")
+        click.echo(f"Wall-clock time: {wall_time:.2f}s")
         
         success_rate = (successful_runs / iterations) * 100
         click.echo(f"Success rate: {success_rate:.1f}%")
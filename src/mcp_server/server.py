@@ -5,13 +5,22 @@ Implements the Model Context Protocol to expose 4 specialized prospect research
 Enhanced with complete data source integration and LLM intelligence middleware.
 """
 
+import anyio
 import asyncio
-import json
+import functools
+import io
+import logging
+import orjson
 import os
+import sys
+from collections import Counter
+from jsonschema import Draft7Validator
+from jsonschema.exceptions import best_match
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
 from mcp.types import Resource, Tool, TextContent
-from .tools import research_prospect, create_profile, get_prospect_data, search_prospects, initialize_tools_with_config
+
+from src.database.operations import init_db, list_prospects_default, prospects_version
 
 # Import structured logging
 from src.logging_config import get_logger, OperationContext, setup_logging
@@ -89,12 +98,78 @@ TOOLS = [
     )
 ]
 
+# ICP resource file, cached in memory until its mtime or size changes
+_ICP_PATH = "data/icp.md"
+_icp_cache = {"stamp": None, "content": None}
+
+def _read_icp() -> str:
+    """Return the ICP definition, re-reading the file only when it has changed on disk."""
+    st = os.stat(_ICP_PATH)
+    stamp = (st.st_mtime_ns, st.st_size)
+    if stamp != _icp_cache["stamp"]:
+        with open(_ICP_PATH, "r") as f:
+            _icp_cache["content"] = f.read()
+        _icp_cache["stamp"] = stamp
+    return _icp_cache["content"]
+
+def _search_match_count(result: str) -> dict:
+    """Extract the match count from a search_prospects result for logging."""
+    match_count = 0
+    if "Found **" in result:
+        try:
+            match_count = int(result.split("Found **")[1].split("**")[0])
+        except (IndexError, ValueError):
+            pass
+    return {"matches_found": match_count}
+
+# Exception type -> (log message, client error template) for failed tool calls.
+# Network errors are listed separately because they subclass OSError.
+_NETWORK_ERROR = ("Network error during tool execution",
+                  "Network error: Unable to connect to external services for {name}")
+_TOOL_ERRORS = {
+    ConnectionError: _NETWORK_ERROR,
+    TimeoutError: _NETWORK_ERROR,
+    OSError: ("File system error during tool execution",
+              "File system error: Unable to access required files for {name}"),
+}
+
+# Argument validators compiled once from each tool's inputSchema
+_VALIDATORS = {tool.name: Draft7Validator(tool.inputSchema) for tool in TOOLS}
+
+# Tool name -> required argument; tools are looked up in the tools module by name
+_DISPATCH = {
+    "research_prospect": "company",
+    "create_profile": "prospect_id",
+    "get_prospect_data": "prospect_id",
+    "search_prospects": "query",
+}
+
+@functools.cache
+def _tools():
+    """Import the tools module on first use; it pulls in the data source, LLM and file stacks."""
+    from . import tools
+    return tools
+
+# Tool name -> extra log fields describing a tool's result
+_RESULT_SUMMARIES = {
+    "research_prospect": lambda result: {"contains_error": "❌" in result},
+    "create_profile": lambda result: {"contains_error": "❌" in result},
+    "get_prospect_data": lambda result: {"contains_research": "Research Report" in result,
+                                         "contains_profile": "Prospect Profile" in result},
+    "search_prospects": _search_match_count,
+}
+
+# Serialized prospects resource, reused until a prospect write bumps the version
+_prospects_cache = {"version": None, "payload": None}
+
 @server.list_tools()
 async def handle_list_tools() -> list[Tool]:
-    """List available prospect research tools."""
+    """List available prospect research tools (the module-level list, built once at import)."""
     return TOOLS
 
-@server.call_tool()
+# Arguments are checked against the precompiled validators below instead of the
+# framework re-validating the schema on every call
+@server.call_tool(validate_input=False)
 async def handle_call_tool(name: str, arguments: dict) -> list[TextContent]:
     """Execute prospect research tools with structured logging and context tracking.
     
@@ -106,7 +181,7 @@ async def handle_call_tool(name: str, arguments: dict) -> list[TextContent]:
         List of text content responses
         
     Raises:
-        ValueError: If tool name is unknown or required parameters are missing
+        ValueError: If tool name is unknown or arguments do not match its input schema
         RuntimeError: If tool execution fails due to internal errors
     """
     # Extract prospect_id if available for context tracking
@@ -114,84 +189,31 @@ async def handle_call_tool(name: str, arguments: dict) -> list[TextContent]:
     
     with OperationContext(operation=f"mcp_tool_{name}", prospect_id=str(prospect_id), tool_name=name):
         try:
-            # Validate tool name
-            if name not in ["research_prospect", "create_profile", "get_prospect_data", "search_prospects"]:
-                logger.warning("Unknown tool requested", tool_name=name, available_tools=["research_prospect", "create_profile", "get_prospect_data", "search_prospects"])
-                raise ValueError(f"Unknown tool: {name}")
+            # Validate tool name with one table lookup, then the arguments against the tool's schema
+            try:
+                arg_name = _DISPATCH[name]
+            except KeyError:
+                logger.warning("Unknown tool requested", tool_name=name, available_tools=list(_DISPATCH))
+                raise ValueError(f"Unknown tool: {name}") from None
             
-            # Tool-specific parameter validation and execution
-            if name == "research_prospect":
-                if "company" not in arguments:
-                    logger.warning("Missing required parameter for research_prospect", required_param="company", provided_args=list(arguments.keys()))
-                    raise ValueError("Missing required parameter: company")
-                
-                company = arguments["company"]
-                logger.info("Starting prospect research", company=company, data_sources=["LinkedIn", "Apollo", "Job Boards", "News", "Gov Registries"])
-                
-                result = await research_prospect(company)
-                
-                logger.info("Prospect research completed successfully", 
-                          company=company, 
-                          result_length=len(result),
-                          contains_error="❌" in result)
-                return [TextContent(type="text", text=result)]
+            validator = _VALIDATORS[name]
+            if not validator.is_valid(arguments):
+                error = best_match(validator.iter_errors(arguments))
+                logger.warning("Invalid tool arguments", tool_name=name, error_message=error.message, provided_args=list(arguments.keys()))
+                raise ValueError(f"Invalid arguments for {name}: {error.message}")
             
-            elif name == "create_profile":
-                if "prospect_id" not in arguments:
-                    logger.warning("Missing required parameter for create_profile", required_param="prospect_id", provided_args=list(arguments.keys()))
-                    raise ValueError("Missing required parameter: prospect_id")
-                
-                prospect_id = arguments["prospect_id"]
-                logger.info("Starting profile creation", prospect_id=prospect_id)
-                
-                result = await create_profile(prospect_id)
-                
-                logger.info("Profile creation completed successfully",
-                          prospect_id=prospect_id,
-                          result_length=len(result),
-                          contains_error="❌" in result)
-                return [TextContent(type="text", text=result)]
+            value = arguments[arg_name]
+            logger.info("Starting tool execution", tool_name=name, **{arg_name: value})
             
-            elif name == "get_prospect_data":
-                if "prospect_id" not in arguments:
-                    logger.warning("Missing required parameter for get_prospect_data", required_param="prospect_id", provided_args=list(arguments.keys()))
-                    raise ValueError("Missing required parameter: prospect_id")
-                
-                prospect_id = arguments["prospect_id"]
-                logger.info("Retrieving prospect data", prospect_id=prospect_id)
-                
-                result = await get_prospect_data(prospect_id)
-                
-                logger.info("Prospect data retrieval completed successfully",
-                          prospect_id=prospect_id,
-                          result_length=len(result),
-                          contains_research="Research Report" in result,
-                          contains_profile="Prospect Profile" in result)
-                return [TextContent(type="text", text=result)]
+            result = await getattr(_tools(), name)(value)
             
-            elif name == "search_prospects":
-                if "query" not in arguments:
-                    logger.warning("Missing required parameter for search_prospects", required_param="query", provided_args=list(arguments.keys()))
-                    raise ValueError("Missing required parameter: query")
-                
-                query = arguments["query"]
-                logger.info("Starting prospect search", query=query, query_length=len(query))
-                
-                result = await search_prospects(query)
-                
-                # Extract match count from result
-                match_count = 0
-                if "Found **" in result:
-                    try:
-                        match_count = int(result.split("Found **")[1].split("**")[0])
-                    except (IndexError, ValueError):
-                        pass
-                
-                logger.info("Prospect search completed successfully",
-                          query=query,
+            # The result summaries scan the whole result, so only build them when INFO is logged
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Tool execution completed successfully",
+                          tool_name=name,
                           result_length=len(result),
-                          matches_found=match_count)
-                return [TextContent(type="text", text=result)]
+                          **_RESULT_SUMMARIES[name](result))
+            return [TextContent(type="text", text=result)]
                 
         except ValueError as ve:
             # Client errors - invalid input, missing parameters, etc.
@@ -202,46 +224,51 @@ async def handle_call_tool(name: str, arguments: dict) -> list[TextContent]:
                          arguments=arguments)
             raise ve  # Re-raise to let MCP framework handle properly
             
-        except (OSError, PermissionError) as file_error:
-            # File system errors
-            logger.exception("File system error during tool execution",
-                           error_type=type(file_error).__name__,
-                           tool_name=name)
-            raise RuntimeError(f"File system error: Unable to access required files for {name}")
-            
-        except (ConnectionError, TimeoutError) as network_error:
-            # Network connectivity issues (for external API calls)
-            logger.exception("Network error during tool execution",
-                           error_type=type(network_error).__name__,
-                           tool_name=name)
-            raise RuntimeError(f"Network error: Unable to connect to external services for {name}")
-            
         except Exception as e:
-            # Top-level handler for any unexpected errors
-            logger.exception("Unexpected error during tool execution",
-                           error_type=type(e).__name__,
-                           error_message=str(e),
-                           tool_name=name,
-                           arguments=arguments)
-            raise RuntimeError(f"Internal server error: {name} execution failed - {str(e)}")
+            # Internal errors - logged and converted to a RuntimeError for the client
+            raise _map_tool_error(e, name, arguments) from e
+
+def _map_tool_error(error: Exception, name: str, arguments: dict) -> RuntimeError:
+    """Log a failed tool call and build the RuntimeError reported to the client.
+    
+    The exception's MRO is matched against _TOOL_ERRORS so the most specific
+    category wins; anything unmatched is reported as an internal server error.
+    """
+    for error_class in type(error).__mro__:
+        if error_class in _TOOL_ERRORS:
+            log_message, client_message = _TOOL_ERRORS[error_class]
+            logger.exception(log_message,
+                           error_type=type(error).__name__,
+                           tool_name=name)
+            return RuntimeError(client_message.format(name=name))
+    
+    logger.exception("Unexpected error during tool execution",
+                   error_type=type(error).__name__,
+                   error_message=str(error),
+                   tool_name=name,
+                   arguments=arguments)
+    return RuntimeError(f"Internal server error: {name} execution failed - {str(error)}")
+
+# Define available resources
+RESOURCES = [
+    Resource(
+        uri="prospect://prospects/",
+        name="All Prospects",
+        description="List of all prospects with metadata",
+        mimeType="application/json"
+    ),
+    Resource(
+        uri="prospect://icp",
+        name="Ideal Customer Profile",
+        description="Current ICP criteria for prospect qualification", 
+        mimeType="text/markdown"
+    )
+]
 
 @server.list_resources()
 async def handle_list_resources() -> list[Resource]:
     """List available prospect resources."""
-    return [
-        Resource(
-            uri="prospect://prospects/",
-            name="All Prospects",
-            description="List of all prospects with metadata",
-            mimeType="application/json"
-        ),
-        Resource(
-            uri="prospect://icp",
-            name="Ideal Customer Profile",
-            description="Current ICP criteria for prospect qualification", 
-            mimeType="text/markdown"
-        )
-    ]
+    return RESOURCES
 
 @server.read_resource()
 async def handle_read_resource(uri: str) -> str:
@@ -253,45 +280,56 @@ async def handle_read_resource(uri: str) -> str:
             if uri == "prospect://icp":
                 # Read ICP definition
                 try:
-                    with open("data/icp.md", "r") as f:
-                        content = f.read()
-                        logger.info("Successfully read ICP definition", 
-                                  content_length=len(content),
-                                  file_path="data/icp.md")
-                        return content
+                    # stat/read run in a worker thread so disk I/O doesn't block the event loop
+                    content = await asyncio.to_thread(_read_icp)
+                    logger.info("Successfully read ICP definition", 
+                              content_length=len(content),
+                              file_path=_ICP_PATH)
+                    return content
                 except FileNotFoundError:
                     logger.warning("ICP definition file not found, returning default content",
-                                 file_path="data/icp.md",
+                                 file_path=_ICP_PATH,
                                  default_content=True)
                     return "# ICP Definition\n\nICP definition not yet configured."
                 except (OSError, PermissionError) as e:
                     logger.exception("File system error reading ICP definition",
-                                   file_path="data/icp.md",
+                                   file_path=_ICP_PATH,
                                    error_type=type(e).__name__)
                     raise RuntimeError("Unable to access ICP definition file")
             
             elif uri == "prospect://prospects/":
                 # Return list of all prospects
-                from src.database.operations import list_prospects
+                # Read the version before querying so a write during the query forces a refresh
+                version = prospects_version()
+                if _prospects_cache["version"] == version:
+                    logger.info("Serving prospects from cache",
+                              result_length=len(_prospects_cache["payload"]),
+                              version=version)
+                    return _prospects_cache["payload"]
                 try:
-                    prospects = await list_prospects()
+                    prospects = await list_prospects_default()
+                    # One pass over the rows builds both the payload and the status counts;
+                    # id is stored as a string and orjson writes datetimes as ISO 8601 itself
+                    status_breakdown = Counter()
                     prospects_data = []
                     for prospect in prospects:
+                        status = prospect.status.name
+                        status_breakdown[status] += 1
                         prospects_data.append({
-                            "id": str(prospect.id),
+                            "id": prospect.id,
                             "company_name": prospect.company_name,
                             "domain": prospect.domain,
-                            "status": prospect.status.name,
-                            "created_at": prospect.created_at.isoformat()
+                            "status": status,
+                            "created_at": prospect.created_at
                         })
                     
-                    import json
-                    result = json.dumps(prospects_data, indent=2)
+                    result = orjson.dumps(prospects_data, option=orjson.OPT_INDENT_2).decode()
+                    _prospects_cache["version"] = version
+                    _prospects_cache["payload"] = result
                     logger.info("Successfully retrieved prospects from database",
                               prospect_count=len(prospects_data),
                               result_length=len(result),
-                              status_breakdown={status.name: sum(1 for p in prospects if p.status == status) 
-                                              for status in set(p.status for p in prospects)})
+                              status_breakdown=dict(status_breakdown))
                     return result
                     
                 except Exception as e:
@@ -327,6 +365,24 @@ async def handle_read_resource(uri: str) -> str:
                            uri=uri)
             raise RuntimeError(f"Internal server error: Unable to read resource {uri} - {str(e)}")
 
+# Read size for the stdio transport; several queued JSON-RPC lines are pulled in per read
+_STDIN_BUFFER_SIZE = 1 << 16
+
+def _buffered_stdin(buffer_size: int = _STDIN_BUFFER_SIZE):
+    """Open a large-buffered async text stream on the stdin descriptor for stdio_server.
+    
+    Returns None when stdin has no usable descriptor, leaving stdio_server to
+    fall back to its default stream.
+    """
+    try:
+        raw = open(sys.stdin.fileno(), "rb", buffering=buffer_size, closefd=False)
+    except (AttributeError, OSError, ValueError):
+        return None
+    text = io.TextIOWrapper(raw, encoding="utf-8")
+    # TextIOWrapper decodes in _CHUNK_SIZE pieces (8 KiB by default); match the buffer
+    text._CHUNK_SIZE = buffer_size
+    return anyio.wrap_file(text)
+
 async def main():
     """Main entry point for the MCP server with structured logging and comprehensive error handling."""
     with OperationContext(operation="mcp_server_startup"):
@@ -338,7 +394,6 @@ async def main():
             
             # Initialize database on startup
             try:
-                from src.database.operations import init_db
                 logger.info("Initializing database", operation="database_init")
                 await init_db()
                 logger.info("Database initialized successfully",
@@ -359,7 +414,7 @@ async def main():
             # Initialize tools with configuration from environment
             try:
                 config_str = os.getenv('MCP_SERVER_CONFIG', '{}')
-                config = json.loads(config_str) if config_str else {}
+                config = orjson.loads(config_str) if config_str else {}
                 
                 # Add default configuration if not provided
                 default_config = {
@@ -389,7 +444,7 @@ async def main():
                           llm_enabled=final_config['llm_enabled'],
                           data_sources_count=len(final_config['data_sources']))
                 
-                initialize_tools_with_config(final_config)
+                _tools().initialize_tools_with_config(final_config)
                 
                 logger.info("Tools initialized successfully with enhanced capabilities",
                           operation="tools_init",
@@ -400,14 +455,14 @@ async def main():
                              error_type=type(e).__name__,
                              error_message=str(e))
                 # Initialize with empty config as fallback
-                initialize_tools_with_config({})
+                _tools().initialize_tools_with_config({})
             
             # Start the MCP server
             logger.info("Starting MCP server with stdio transport",
                       transport="stdio",
                       server_capabilities=["tools", "resources"])
             
-            async with stdio_server() as (read_stream, write_stream):
+            async with stdio_server(stdin=_buffered_stdin()) as (read_stream, write_stream):
                 try:
                     logger.info("MCP server listening for connections")
                     await server.run(
@@ -446,5 +501,13 @@ async def main():
                            startup_phase="unknown")
             raise RuntimeError(f"Fatal server error: {str(e)}")
 
+def run(coro):
+    """Run a coroutine on uvloop when it is installed, otherwise on the default asyncio loop."""
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(coro)
+    return uvloop.run(coro)
+
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    run(main())
\ No newline at end of file
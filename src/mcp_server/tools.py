@@ -66,7 +66,7 @@ async def research_prospect(company: str) -> str:
         )
         
         # Collect comprehensive data from all available sources
-        logger.info(f"Starting comprehensive research for {company}")
+        logger.info("Starting comprehensive research for %s", company)
         raw_data = await _data_source_manager.collect_all_prospect_data(company)
         
         # Enhance data with LLM intelligence middleware
@@ -85,7 +85,7 @@ async def research_prospect(company: str) -> str:
                 'total_sources': raw_data.get('total_sources', 9)
             }
         except Exception as e:
-            logger.warning(f"Enhanced research failed, using fallback: {e}")
+            logger.warning("Enhanced research failed, using fallback: %s", e)
             research_result = await pr_research.research_prospect(company)
             research_result['enhanced_data'] = {'middleware_status': 'fallback', 'fallback_reason': str(e)}
         
@@ -123,7 +123,7 @@ async def research_prospect(company: str) -> str:
         return result
         
     except Exception as e:
-        logger.error(f"Error in research_prospect for {company}: {str(e)}")
+        logger.error("Error in research_prospect for %s: %s", company, e)
         return f"❌ **Error during comprehensive research for {company}**:\n{str(e)}\n\n" \
                f"💡 **Troubleshooting**:\n" \
                f"- Check API keys in environment variables\n" \
@@ -191,7 +191,7 @@ async def create_profile(prospect_id: str) -> str:
                 # Add enhanced strategy to the result
                 profile_result['enhanced_strategy'] = enhanced_strategy
             except Exception as e:
-                logger.warning(f"Enhanced profile creation failed, using fallback: {e}")
+                logger.warning("Enhanced profile creation failed, using fallback: %s", e)
                 profile_result = await pr_profile.create_profile(research_prospect_id, research_filename)
                 profile_result['enhanced_strategy'] = {'middleware_status': 'fallback', 'fallback_reason': str(e)}
             
@@ -245,7 +245,7 @@ async def create_profile(prospect_id: str) -> str:
                 # Add enhanced strategy to the result
                 profile_result['enhanced_strategy'] = enhanced_strategy
             except Exception as e:
-                logger.warning(f"Enhanced profile creation failed, using fallback: {e}")
+                logger.warning("Enhanced profile creation failed, using fallback: %s", e)
                 profile_result = await pr_profile.create_profile(prospect_id, research_filename)
                 profile_result['enhanced_strategy'] = {'middleware_status': 'fallback', 'fallback_reason': str(e)}
             
@@ -269,7 +269,7 @@ async def create_profile(prospect_id: str) -> str:
             return result
                
     except Exception as e:
-        logger.error(f"Error in create_profile for {prospect_id}: {str(e)}")
+        logger.error("Error in create_profile for %s: %s", prospect_id, e)
         return f"❌ **Error during AI-enhanced profile creation for {prospect_id}**:\n{str(e)}\n\n" \
                f"💡 **Troubleshooting**:\n" \
                f"- Ensure research_prospect was completed successfully\n" \
@@ -460,7 +460,7 @@ async def get_prospect_data(prospect_id: str) -> str:
         return "\n".join(result_parts)
         
     except Exception as e:
-        logger.error(f"Error in get_prospect_data for {prospect_id}: {str(e)}")
+        logger.error("Error in get_prospect_data for %s: %s", prospect_id, e)
         return f"❌ **Error retrieving prospect data for {prospect_id}**:\n{str(e)}\n\n" \
                f"💡 **Troubleshooting**:\n" \
                f"- Verify prospect_id is correct\n" \
@@ -484,7 +484,7 @@ async def search_prospects(query: str) -> str:
         all_prospects = await db_operations.list_prospects_default()
         matching_prospects = []
         
-        logger.info(f"Searching {len(all_prospects)} prospects for query: {query}")
+        logger.info("Searching %d prospects for query: %s", len(all_prospects), query)
 
         for prospect in all_prospects:
             prospect_id = str(prospect.id)
@@ -607,7 +607,7 @@ async def search_prospects(query: str) -> str:
                    f"**Suggested Queries**: 'AI', 'cloud', 'startup', 'enterprise', 'automation'"
                    
     except Exception as e:
-        logger.error(f"Error in search_prospects for query '{query}': {str(e)}")
+        logger.error("Error in search_prospects for query '%s': %s", query, e)
         return f"❌ **Error during advanced search for query '{query}'**:\n{str(e)}\n\n" \
                f"💡 **Troubleshooting**:\n" \
                f"- Check database connectivity\n" \
@@ -311,3 +311,22 @@ async def test_concurrent_operations(test_db):
         prospects = await list_prospects(session)
         concurrent_ids = {p.id for p in prospects if p.id.startswith("concurrent-")}
         assert len(concurrent_ids) == 3
+
+
+async def test_prospect_writes_bump_version(db_session):
+    """Test that prospect writes advance the version counter used by caches."""
+    from src.database.operations import prospects_version
+    start = prospects_version()
+    
+    await create_prospect(db_session, "version-1", "Version Co", "version.com")
+    assert prospects_version() == start + 1
+    
+    await update_prospect_status(db_session, "version-1", ProspectStatus.RESEARCHED)
+    assert prospects_version() == start + 2
+    
+    await list_prospects(db_session)
+    await update_prospect_status(db_session, "missing", ProspectStatus.RESEARCHED)
+    assert prospects_version() == start + 2
+    
+    assert await delete_prospect(db_session, "version-1")
+    assert prospects_version() == start + 3
@@ -390,6 +390,17 @@ class TestProfileAnalyzer:
         assert result['enhancement_status'] == 'manual_fallback'
         
         mock_logger.info.assert_called_once_with('Using fallback manual profile strategy')
+    
+    def test_fallback_profile_strategy_returns_independent_copies(self, analyzer, sample_research_data):
+        """Test mutating one fallback result does not leak into the next."""
+        first = analyzer._fallback_profile_strategy(sample_research_data)
+        first['talking_points'].append('Caller-specific point')
+        first['value_proposition'] = 'Patched'
+        
+        second = analyzer._fallback_profile_strategy(sample_research_data)
+        
+        assert second['talking_points'] == ['Manual talking point 1', 'Manual talking point 2']
+        assert second['value_proposition'] == 'Manual value proposition based on research'
 
 
 class TestAnalyzersIntegration:
@@ -0,0 +1,73 @@
+"""Unit tests for LLM request batching."""
+
+import asyncio
+import pytest
+from unittest.mock import Mock, AsyncMock
+
+from src.llm_enhancer.batching import BatchingClient
+
+
+class TestBatchingClient:
+    """Test cases for BatchingClient class."""
+    
+    @pytest.fixture
+    def mock_llm_client(self):
+        """Create mock Bedrock client."""
+        client = Mock()
+        client.analyze_research_data = AsyncMock(return_value={'enhanced_content': 'single'})
+        client.analyze_research_batch = AsyncMock(
+            side_effect=lambda items, analysis_type: [
+                {'enhanced_content': item['name']} for item in items
+            ]
+        )
+        return client
+    
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_share_one_call(self, mock_llm_client):
+        """Test requests arriving together are sent as one batch."""
+        batching = BatchingClient(mock_llm_client, max_batch_size=8, max_wait_seconds=0.05)
+        
+        results = await asyncio.gather(*(
+            batching.analyze_research_data({'name': name}, 'research') for name in ['A', 'B', 'C']
+        ))
+        
+        assert [r['enhanced_content'] for r in results] == ['A', 'B', 'C']
+        mock_llm_client.analyze_research_batch.assert_called_once()
+        mock_llm_client.analyze_research_data.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_batches_respect_max_size(self, mock_llm_client):
+        """Test bursts larger than max_batch_size are split."""
+        batching = BatchingClient(mock_llm_client, max_batch_size=2, max_wait_seconds=0.05)
+        
+        results = await asyncio.gather(*(
+            batching.analyze_research_data({'name': str(i)}, 'research') for i in range(5)
+        ))
+        
+        assert [r['enhanced_content'] for r in results[:4]] == ['0', '1', '2', '3']
+        assert mock_llm_client.analyze_research_batch.call_count == 2
+        mock_llm_client.analyze_research_data.assert_called_once()
+    
+    @pytest.mark.asyncio
+    async def test_single_request_skips_batch_prompt(self, mock_llm_client):
+        """Test a lone request uses the regular single-request path."""
+        batching = BatchingClient(mock_llm_client, max_wait_seconds=0.01)
+        
+        result = await batching.analyze_research_data({'name': 'A'}, 'profile')
+        
+        assert result == {'enhanced_content': 'single'}
+        mock_llm_client.analyze_research_data.assert_called_once_with({'name': 'A'}, 'profile')
+    
+    @pytest.mark.asyncio
+    async def test_batch_failure_propagates_to_callers(self, mock_llm_client):
+        """Test an exception from the batched call reaches every waiting caller."""
+        mock_llm_client.analyze_research_batch.side_effect = RuntimeError("Bedrock down")
+        batching = BatchingClient(mock_llm_client, max_wait_seconds=0.05)
+        
+        results = await asyncio.gather(
+            batching.analyze_research_data({'name': 'A'}),
+            batching.analyze_research_data({'name': 'B'}),
+            return_exceptions=True
+        )
+        
+        assert all(isinstance(r, RuntimeError) for r in results)
@@ -0,0 +1,88 @@
+"""Unit tests for the LLM response cache."""
+
+import pytest
+from unittest.mock import patch
+
+from src.llm_enhancer.cache import LLMCache, SemanticCache
+
+
+class TestLLMCache:
+    """Test cases for LLMCache class."""
+
+    @pytest.mark.asyncio
+    async def test_get_returns_independent_copy(self):
+        """Test mutating a cached value does not affect later hits."""
+        cache = LLMCache()
+        await cache.set('key', {'items': [1]})
+
+        first = await cache.get('key')
+        first['items'].append(2)
+
+        assert await cache.get('key') == {'items': [1]}
+        assert cache.stats == {'hits': 2, 'misses': 0}
+
+    @pytest.mark.asyncio
+    async def test_entry_expires_after_ttl(self):
+        """Test entries older than their TTL are treated as misses."""
+        cache = LLMCache(ttl_seconds=10)
+
+        with patch('src.llm_enhancer.cache.time.monotonic', return_value=100.0):
+            await cache.set('key', {'value': 1})
+            await cache.set('short', {'value': 2}, ttl=1)
+        with patch('src.llm_enhancer.cache.time.monotonic', return_value=105.0):
+            assert await cache.get('key') == {'value': 1}
+            assert await cache.get('short') is None
+        with patch('src.llm_enhancer.cache.time.monotonic', return_value=111.0):
+            assert await cache.get('key') is None
+
+        assert len(cache) == 0
+        assert cache.stats == {'hits': 1, 'misses': 2}
+
+    @pytest.mark.asyncio
+    async def test_evicts_least_recently_used(self):
+        """Test the cache is bounded by max_entries."""
+        cache = LLMCache(max_entries=2)
+
+        await cache.set('a', {'value': 1})
+        await cache.set('b', {'value': 2})
+        await cache.get('a')
+        await cache.set('c', {'value': 3})
+
+        assert await cache.get('b') is None
+        assert await cache.get('a') == {'value': 1}
+        assert await cache.get('c') == {'value': 3}
+
+
+class TestSemanticCache:
+    """Test cases for SemanticCache class."""
+
+    @pytest.mark.asyncio
+    async def test_near_duplicate_text_hits(self):
+        """Test text above the similarity threshold returns the stored value."""
+        cache = SemanticCache(threshold=0.9)
+        text = "Acme builds cloud analytics software for retail banks in Sydney and Melbourne"
+        await cache.set('acme', text, {'value': 1})
+
+        assert await cache.get('acme', text + " Brisbane") == {'value': 1}
+        assert await cache.get('acme', "Acme sells garden furniture") is None
+        assert cache.stats == {'hits': 1, 'misses': 1}
+
+    @pytest.mark.asyncio
+    async def test_lookup_limited_to_scope(self):
+        """Test identical text in another scope is not a hit."""
+        cache = SemanticCache()
+        await cache.set('acme', 'cloud analytics software', {'value': 1})
+
+        assert await cache.get('globex', 'cloud analytics software') is None
+
+    @pytest.mark.asyncio
+    async def test_oldest_entry_evicted_first(self):
+        """Test the cache keeps at most max_entries entries."""
+        cache = SemanticCache(max_entries=2)
+        await cache.set('a', 'first text', {'value': 1})
+        await cache.set('b', 'second text', {'value': 2})
+        await cache.set('c', 'third text', {'value': 3})
+
+        assert len(cache) == 2
+        assert await cache.get('a', 'first text') is None
+        assert await cache.get('c', 'third text') == {'value': 3}
@@ -0,0 +1,56 @@
+"""Unit tests for the LLM circuit breaker."""
+
+from unittest.mock import patch
+
+from src.llm_enhancer.circuit_breaker import CircuitBreaker, CLOSED, OPEN, HALF_OPEN
+
+
+class TestCircuitBreaker:
+    """Test cases for CircuitBreaker class."""
+    
+    def test_stays_closed_below_min_calls(self):
+        """Test a few early failures do not open the breaker."""
+        breaker = CircuitBreaker(failure_ratio=0.3, min_calls=5)
+        for _ in range(4):
+            breaker.record_failure()
+        
+        assert breaker.state == CLOSED
+        assert breaker.allow_request()
+    
+    def test_opens_when_failure_ratio_reached(self):
+        """Test the breaker opens once the window failure ratio crosses the threshold."""
+        breaker = CircuitBreaker(failure_ratio=0.3, min_calls=10)
+        for _ in range(7):
+            breaker.record_success()
+        for _ in range(3):
+            breaker.record_failure()
+        
+        assert breaker.state == OPEN
+        assert not breaker.allow_request()
+    
+    def test_half_open_allows_single_trial(self):
+        """Test one trial call is let through after the fallback duration."""
+        breaker = CircuitBreaker(fallback_duration=10, min_calls=1)
+        with patch('src.llm_enhancer.circuit_breaker.time.monotonic', return_value=100.0):
+            breaker.record_failure()
+        
+        with patch('src.llm_enhancer.circuit_breaker.time.monotonic', return_value=105.0):
+            assert not breaker.allow_request()
+        with patch('src.llm_enhancer.circuit_breaker.time.monotonic', return_value=110.0):
+            assert breaker.allow_request()
+            assert breaker.state == HALF_OPEN
+            assert not breaker.allow_request()
+    
+    def test_trial_outcome_closes_or_reopens(self):
+        """Test a successful trial closes the breaker and a failed one reopens it."""
+        breaker = CircuitBreaker(fallback_duration=0, min_calls=1)
+        breaker.record_failure()
+        
+        assert breaker.allow_request()
+        breaker.record_failure()
+        assert breaker.state == OPEN
+        
+        assert breaker.allow_request()
+        breaker.record_success()
+        assert breaker.state == CLOSED
+        assert breaker.allow_request()
@@ -15,6 +15,21 @@ import os
 from src.llm_enhancer.client import BedrockClient
 
 
+def converse_stream_response(text: str, input_tokens: int = 0, output_tokens: int = 0) -> Dict[str, Any]:
+    """Build a ConverseStream response whose text arrives in two deltas."""
+    middle = len(text) // 2
+    return {
+        'stream': [
+            {'messageStart': {'role': 'assistant'}},
+            {'contentBlockDelta': {'delta': {'text': text[:middle]}, 'contentBlockIndex': 0}},
+            {'contentBlockDelta': {'delta': {'text': text[middle:]}, 'contentBlockIndex': 0}},
+            {'contentBlockStop': {'contentBlockIndex': 0}},
+            {'messageStop': {'stopReason': 'end_turn'}},
+            {'metadata': {'usage': {'inputTokens': input_tokens, 'outputTokens': output_tokens}}}
+        ]
+    }
+
+
 class TestBedrockClient:
     """Test cases for AWS Bedrock client wrapper."""
     
@@ -32,17 +47,9 @@ class TestBedrockClient:
     def mock_boto3_client(self):
         """Mock boto3 bedrock-runtime client."""
         mock_client = Mock()
-        mock_client.converse.return_value = {
-            'output': {
-                'message': {
-                    'content': [{'text': 'Mock LLM response content'}]
-                }
-            },
-            'usage': {
-                'inputTokens': 100,
-                'outputTokens': 50
-            }
-        }
+        mock_client.converse_stream.return_value = converse_stream_response(
+            'Mock LLM response content', input_tokens=100, output_tokens=50
+        )
         return mock_client
     
     @pytest.fixture
@@ -95,6 +102,40 @@ class TestBedrockClient:
         assert bedrock_client.bedrock_client is None
         assert bedrock_client._prompts_cache == {}
     
+    def test_shared_client_reused_per_region_and_model(self):
+        """Test shared() returns one instance per (region, model_id)."""
+        first = BedrockClient.shared("us-east-1", "shared-model-id")
+        second = BedrockClient.shared("us-east-1", "shared-model-id")
+        other_region = BedrockClient.shared("us-west-2", "shared-model-id")
+        
+        assert first is second
+        assert first is not other_region
+        assert isinstance(first, BedrockClient)
+    
+    @pytest.mark.asyncio
+    async def test_max_tokens_capped_per_analysis_type(self, bedrock_client, mock_boto3_client):
+        """Test each analysis type sends its own output token cap."""
+        bedrock_client.bedrock_client = mock_boto3_client
+        bedrock_client._prompts_cache = {
+            'research_system': 'System', 'research_user': '{company_data}{data_sources}{research_data}',
+            'profile_system': 'System', 'profile_user': '{company_profile}{business_analysis}{target_contact}'
+        }
+        
+        await bedrock_client.analyze_research_data({}, 'research')
+        research_config = mock_boto3_client.converse_stream.call_args[1]['inferenceConfig']
+        await bedrock_client.analyze_research_data({}, 'profile')
+        profile_config = mock_boto3_client.converse_stream.call_args[1]['inferenceConfig']
+        
+        assert research_config['maxTokens'] == 2000
+        assert profile_config['maxTokens'] == 1000
+    
+    def test_max_tokens_overrides_merge_with_defaults(self):
+        """Test configured caps override only the types they name."""
+        client = BedrockClient(max_tokens_by_type={'profile': 600})
+        
+        assert client.max_tokens_by_type == {'research': 2000, 'profile': 600}
+        assert client._max_tokens_for('unknown') == 4096
+    
     @pytest.mark.asyncio
     async def test_initialize_success(self, bedrock_client, mock_boto3_client):
         """Test successful client initialization."""
@@ -182,6 +223,39 @@ class TestBedrockClient:
         assert 'innovation' in user_prompt
         assert 'John Doe' in user_prompt
     
+    def test_prepare_prompts_compacts_payload(self, bedrock_client):
+        """Test prompt payloads drop empty/noisy fields and truncate long strings."""
+        bedrock_client._prompts_cache = {
+            'research_system': 'System prompt for research',
+            'research_user': '{company_data}|{data_sources}|{research_data}'
+        }
+        raw_data = {
+            'company': {'name': 'Test Company', 'website': None, 'tags': [], 'raw_html': '<html></html>'},
+            'sources': ['apollo', ''],
+            'research': {'summary': 'x' * 5000, 'employees': 0}
+        }
+        
+        _, user_prompt = bedrock_client._prepare_prompts(raw_data, 'research')
+        company_json, sources_json, research_json = user_prompt.split('|')
+        
+        assert company_json == '{"name":"Test Company"}'
+        assert sources_json == '["apollo"]'
+        assert '"employees":0' in research_json
+        assert research_json.count('x') == 2000
+        assert '\n' not in user_prompt
+    
+    def test_prepare_prompts_matches_str_format(self, bedrock_client):
+        """Test precompiled templates render exactly like str.format, including escaped braces."""
+        template = 'Example {{"key": 1}}\nCompany: {company_data}\nSources: {data_sources}\nData: {research_data}'
+        bedrock_client._prompts_cache = {'research_system': 'System', 'research_user': template}
+        raw_data = {'company': {'name': 'Test'}, 'sources': ['apollo'], 'research': {'a': 1}}
+        
+        _, user_prompt = bedrock_client._prepare_prompts(raw_data, 'research')
+        
+        assert user_prompt == template.format(
+            company_data='{"name":"Test"}', data_sources='["apollo"]', research_data='{"a":1}'
+        )
+    
     def test_prepare_prompts_invalid_type(self, bedrock_client, sample_raw_data):
         """Test prompt preparation with invalid analysis type."""
         with pytest.raises(ValueError, match="Unknown analysis type"):
@@ -200,8 +274,8 @@ class TestBedrockClient:
         assert response == "Mock LLM response content"
         
         # Verify API call parameters
-        mock_boto3_client.converse.assert_called_once()
-        call_args = mock_boto3_client.converse.call_args
+        mock_boto3_client.converse_stream.assert_called_once()
+        call_args = mock_boto3_client.converse_stream.call_args
         
         assert call_args[1]['modelId'] == bedrock_client.model_id
         assert len(call_args[1]['messages']) == 1
@@ -211,6 +285,29 @@ class TestBedrockClient:
         assert call_args[1]['inferenceConfig']['temperature'] == 0.1
         assert call_args[1]['inferenceConfig']['maxTokens'] == 4096
         assert call_args[1]['inferenceConfig']['topP'] == 0.9
+        assert 'performanceConfig' not in call_args[1]
+    
+    @pytest.mark.asyncio
+    async def test_call_converse_api_configured_temperature(self, mock_boto3_client):
+        """Test the client's temperature is used for the inference config."""
+        client = BedrockClient(region="us-east-1", model_id="test-model-id", temperature=0.3)
+        client.bedrock_client = mock_boto3_client
+        
+        await client._call_converse_api("System prompt", "User prompt")
+        
+        call_args = mock_boto3_client.converse_stream.call_args
+        assert call_args[1]['inferenceConfig']['temperature'] == 0.3
+    
+    @pytest.mark.asyncio
+    async def test_call_converse_api_latency_optimized(self, mock_boto3_client):
+        """Test latency-optimized inference is requested only when configured."""
+        client = BedrockClient(region="us-east-2", model_id="test-model-id", latency_mode="optimized")
+        client.bedrock_client = mock_boto3_client
+        
+        await client._call_converse_api("System prompt", "User prompt")
+        
+        call_args = mock_boto3_client.converse_stream.call_args
+        assert call_args[1]['performanceConfig'] == {'latency': 'optimized'}
     
     @pytest.mark.asyncio
     async def test_call_converse_api_no_system_prompt(self, bedrock_client, mock_boto3_client):
@@ -222,18 +319,182 @@ class TestBedrockClient:
         assert response == "Mock LLM response content"
         
         # Verify system prompts array is empty
-        call_args = mock_boto3_client.converse.call_args
+        call_args = mock_boto3_client.converse_stream.call_args
         assert call_args[1]['system'] == []
     
+    @pytest.mark.asyncio
+    async def test_call_converse_api_prompt_cache_checkpoint(self, bedrock_client, mock_boto3_client):
+        """Test the system prompt is followed by a cache point when prompt caching is on."""
+        bedrock_client.bedrock_client = mock_boto3_client
+        bedrock_client.prompt_cache_enabled = True
+        
+        await bedrock_client._call_converse_api("System prompt", "User prompt")
+        
+        call_args = mock_boto3_client.converse_stream.call_args
+        assert call_args[1]['system'] == [
+            {'text': 'System prompt'},
+            {'cachePoint': {'type': 'default'}}
+        ]
+        assert call_args[1]['messages'][0]['content'] == [{'text': 'User prompt'}]
+    
     @pytest.mark.asyncio
     async def test_call_converse_api_error(self, bedrock_client, mock_boto3_client):
         """Test Converse API call with error."""
         bedrock_client.bedrock_client = mock_boto3_client
-        mock_boto3_client.converse.side_effect = Exception("API call failed")
+        mock_boto3_client.converse_stream.side_effect = Exception("API call failed")
         
         with pytest.raises(Exception, match="API call failed"):
             await bedrock_client._call_converse_api("System prompt", "User prompt")
     
+    @pytest.mark.asyncio
+    async def test_analyze_research_data_stream_yields_deltas(self, bedrock_client, sample_raw_data, mock_boto3_client):
+        """Test streaming analysis yields text deltas as they arrive."""
+        bedrock_client.bedrock_client = mock_boto3_client
+        bedrock_client._prompts_cache = {
+            'research_system': 'System prompt',
+            'research_user': 'User prompt template: {company_data}'
+        }
+        
+        chunks = [chunk async for chunk in bedrock_client.analyze_research_data_stream(sample_raw_data, 'research')]
+        
+        assert len(chunks) == 2
+        assert "".join(chunks) == "Mock LLM response content"
+    
+    @pytest.mark.asyncio
+    async def test_call_converse_api_does_not_block_event_loop(self, bedrock_client):
+        """Test concurrent Converse calls overlap instead of serializing on the event loop."""
+        import time
+        
+        def slow_converse_stream(**kwargs):
+            time.sleep(0.2)
+            return converse_stream_response("Slow response")
+        
+        mock_client = Mock()
+        mock_client.converse_stream.side_effect = slow_converse_stream
+        bedrock_client.bedrock_client = mock_client
+        
+        start = time.perf_counter()
+        results = await asyncio.gather(
+            bedrock_client._call_converse_api("System", "User 1"),
+            bedrock_client._call_converse_api("System", "User 2")
+        )
+        elapsed = time.perf_counter() - start
+        
+        assert results == ["Slow response", "Slow response"]
+        assert elapsed < 0.35
+    
+    @pytest.mark.asyncio
+    async def test_analyze_research_batch_splits_results(self, bedrock_client, mock_boto3_client):
+        """Test batched analysis sends one request and returns results in order."""
+        bedrock_client.bedrock_client = mock_boto3_client
+        bedrock_client._prompts_cache = {
+            'research_system': 'System prompt',
+            'research_user': 'Company: {company_data}'
+        }
+        batch_response = json.dumps([
+            {'id': 1, 'content': '# Report B'},
+            {'id': 0, 'content': '# Report A'}
+        ])
+        
+        with patch.object(bedrock_client, '_call_converse_api', return_value=batch_response) as mock_api:
+            results = await bedrock_client.analyze_research_batch(
+                [{'company': {'name': 'A'}}, {'company': {'name': 'B'}}, {'company': {'name': 'C'}}],
+                'research'
+            )
+        
+        mock_api.assert_called_once()
+        system_prompt, batch_prompt = mock_api.call_args[0]
+        assert system_prompt == 'System prompt'
+        assert '<request id="2">' in batch_prompt
+        assert mock_api.call_args[1]['max_tokens'] == 3 * 2000
+        assert results[0]['enhanced_content'] == '# Report A'
+        assert results[1]['enhanced_content'] == '# Report B'
+        assert results[1]['batch_size'] == 3
+        assert results[2]['enhancement_status'] == 'error'
+    
+    @pytest.mark.asyncio
+    async def test_analyze_research_batch_unparseable_response(self, bedrock_client, mock_boto3_client):
+        """Test every batched request gets an error result when the response is not JSON."""
+        bedrock_client.bedrock_client = mock_boto3_client
+        bedrock_client._prompts_cache = {'research_system': 'System', 'research_user': '{company_data}'}
+        
+        with patch.object(bedrock_client, '_call_converse_api', return_value="# Not an array"):
+            results = await bedrock_client.analyze_research_batch([{}, {}], 'research')
+        
+        assert [r['enhancement_status'] for r in results] == ['error', 'error']
+    
+    @pytest.mark.asyncio
+    async def test_call_converse_api_retries_throttling(self, bedrock_client, mock_boto3_client):
+        """Test throttled requests are retried with backoff before succeeding."""
+        from botocore.exceptions import ClientError
+        
+        throttled = ClientError(
+            {'Error': {'Code': 'ThrottlingException', 'Message': 'Rate exceeded'}}, 'ConverseStream'
+        )
+        mock_boto3_client.converse_stream.side_effect = [
+            throttled, converse_stream_response("Recovered response")
+        ]
+        bedrock_client.bedrock_client = mock_boto3_client
+        
+        with patch('src.llm_enhancer.client.asyncio.sleep', new_callable=AsyncMock) as mock_sleep:
+            response = await bedrock_client._call_converse_api("System", "User")
+        
+        assert response == "Recovered response"
+        assert mock_boto3_client.converse_stream.call_count == 2
+        mock_sleep.assert_called_once()
+    
+    @pytest.mark.asyncio
+    async def test_call_converse_api_does_not_retry_validation_errors(self, bedrock_client, mock_boto3_client):
+        """Test non-transient errors are raised without retrying."""
+        from botocore.exceptions import ClientError
+        
+        mock_boto3_client.converse_stream.side_effect = ClientError(
+            {'Error': {'Code': 'ValidationException', 'Message': 'Bad request'},
+             'ResponseMetadata': {'HTTPStatusCode': 400}}, 'ConverseStream'
+        )
+        bedrock_client.bedrock_client = mock_boto3_client
+        
+        with pytest.raises(ClientError):
+            await bedrock_client._call_converse_api("System", "User")
+        
+        assert mock_boto3_client.converse_stream.call_count == 1
+    
+    @pytest.mark.asyncio
+    async def test_analyze_with_data_tools_serves_requested_sections(self, sample_raw_data):
+        """Test retrieval mode keeps data out of the prompt and answers tool calls."""
+        client = BedrockClient(region="us-east-1", model_id="test-model-id", data_tools_enabled=True)
+        client._prompts_cache = {
+            'research_system': 'System prompt',
+            'research_user': 'Company: {company_data}\nSources: {data_sources}\nData: {research_data}'
+        }
+        mock_client = Mock()
+        mock_client.converse.side_effect = [
+            {
+                'stopReason': 'tool_use',
+                'output': {'message': {'role': 'assistant', 'content': [
+                    {'toolUse': {'toolUseId': 'tool-1', 'name': 'get_company_data', 'input': {'section': 'company'}}}
+                ]}}
+            },
+            {
+                'stopReason': 'end_turn',
+                'output': {'message': {'role': 'assistant', 'content': [{'text': '# Report for Test Company'}]}}
+            }
+        ]
+        client.bedrock_client = mock_client
+        
+        result = await client.analyze_research_data(sample_raw_data, 'research')
+        
+        assert result['enhanced_content'] == '# Report for Test Company'
+        first_call = mock_client.converse.call_args_list[0][1]
+        user_prompt = first_call['messages'][0]['content'][0]['text']
+        assert 'Test Company' not in user_prompt
+        assert 'section "company"' in user_prompt
+        assert first_call['toolConfig']['tools'][0]['toolSpec']['name'] == 'get_company_data'
+        
+        tool_result = mock_client.converse.call_args_list[1][1]['messages'][2]['content'][0]['toolResult']
+        assert tool_result['toolUseId'] == 'tool-1'
+        assert 'Test Company' in tool_result['content'][0]['text']
+    
     def test_parse_llm_response_research(self, bedrock_client):
         """Test LLM response parsing for research."""
         response = "# Research Analysis\nDetailed analysis content..."
@@ -376,11 +637,8 @@ class TestBedrockClientIntegration:
     async def test_end_to_end_research_analysis(self, bedrock_client_integration, comprehensive_raw_data):
         """Test complete end-to-end research analysis flow."""
         mock_boto3_client = Mock()
-        mock_boto3_client.converse.return_value = {
-            'output': {
-                'message': {
-                    'content': [{
-                        'text': """# Business Intelligence Report
+        mock_boto3_client.converse_stream.return_value = converse_stream_response(
+            """# Business Intelligence Report
 
 ## Company Overview
 TechCorp Solutions is a rapidly growing software company specializing in AI-powered solutions.
@@ -397,12 +655,9 @@ TechCorp Solutions is a rapidly growing software company specializing in AI-powe
 - Cloud infrastructure optimization
 
 ## Recommended Approach
-Focus on technical value proposition and growth enablement."""
-                    }]
-                }
-            },
-            'usage': {'inputTokens': 500, 'outputTokens': 200}
-        }
+Focus on technical value proposition and growth enablement.""",
+            input_tokens=500, output_tokens=200
+        )
         
         # Mock successful initialization and prompt loading
         with patch('boto3.client', return_value=mock_boto3_client), \
@@ -422,8 +677,8 @@ Focus on technical value proposition and growth enablement."""
             assert 'Jane Smith' in result['enhanced_content']
             
             # Verify API call was made correctly
-            mock_boto3_client.converse.assert_called_once()
-            call_args = mock_boto3_client.converse.call_args[1]
+            mock_boto3_client.converse_stream.assert_called_once()
+            call_args = mock_boto3_client.converse_stream.call_args[1]
             assert call_args['modelId'] == bedrock_client_integration.model_id
             assert len(call_args['messages']) == 1
             assert call_args['inferenceConfig']['temperature'] == 0.1
@@ -432,11 +687,8 @@ Focus on technical value proposition and growth enablement."""
     async def test_end_to_end_profile_analysis(self, bedrock_client_integration, comprehensive_raw_data):
         """Test complete end-to-end profile analysis flow."""
         mock_boto3_client = Mock()
-        mock_boto3_client.converse.return_value = {
-            'output': {
-                'message': {
-                    'content': [{
-                        'text': """# Prospect Engagement Profile
+        mock_boto3_client.converse_stream.return_value = converse_stream_response(
+            """# Prospect Engagement Profile
 
 ## Target Contact
 **Jane Smith** - Chief Technology Officer at TechCorp Solutions
@@ -452,12 +704,9 @@ Focus on technical value proposition and growth enablement."""
 3. Technology alignment with Python/React/AWS stack
 
 ## Recommended Outreach
-Lead with technical value proposition focused on AI integration and team scaling solutions."""
-                    }]
-                }
-            },
-            'usage': {'inputTokens': 400, 'outputTokens': 150}
-        }
+Lead with technical value proposition focused on AI integration and team scaling solutions.""",
+            input_tokens=400, output_tokens=150
+        )
         
         with patch('boto3.client', return_value=mock_boto3_client), \
              patch('builtins.open', mock_open(read_data="Mock prompt content")):
@@ -496,10 +745,9 @@ Lead with technical value proposition focused on AI integration and team scaling
     async def test_prompt_template_substitution(self, bedrock_client_integration):
         """Test that prompt templates are properly substituted with data."""
         mock_boto3_client = Mock()
-        mock_boto3_client.converse.return_value = {
-            'output': {'message': {'content': [{'text': 'Test response'}]}},
-            'usage': {'inputTokens': 10, 'outputTokens': 5}
-        }
+        mock_boto3_client.converse_stream.return_value = converse_stream_response(
+            'Test response', input_tokens=10, output_tokens=5
+        )
         
         test_data = {
             'company': {'name': 'TestCorp', 'industry': 'Testing'},
@@ -522,7 +770,7 @@ Lead with technical value proposition focused on AI integration and team scaling
             await bedrock_client_integration.analyze_research_data(test_data, 'research')
             
             # Verify that user prompt was properly formatted
-            call_args = mock_boto3_client.converse.call_args[1]
+            call_args = mock_boto3_client.converse_stream.call_args[1]
             user_message = call_args['messages'][0]['content'][0]['text']
             
             assert 'TestCorp' in user_message
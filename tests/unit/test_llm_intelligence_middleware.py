@@ -0,0 +1,815 @@
+"""Unit tests for LLM middleware module."""
+
+import asyncio
+import threading
+import orjson
+import pytest
+from datetime import datetime
+from unittest.mock import AsyncMock, Mock, patch
+from typing import Dict, Any
+
+from src.llm_enhancer.cache import LLMCache
+from src.llm_enhancer.client import _to_prompt_json
+from src.llm_enhancer.middleware import LLMMiddleware, _compact_field
+
+
+class TestLLMMiddlewareCache:
+    """Test cases for the LLM response cache."""
+
+    @pytest.fixture
+    def middleware(self):
+        """Create LLMMiddleware instance with a mocked research analyzer."""
+        middleware = LLMMiddleware({'llm_enabled': True})
+        middleware.research_analyzer.analyze_comprehensive_data = AsyncMock(
+            return_value={
+                'company_background': 'AI-enhanced company background',
+                'enhancement_status': 'ai_enhanced'
+            }
+        )
+        return middleware
+
+    @pytest.fixture
+    def sample_raw_data(self) -> Dict[str, Any]:
+        """Sample raw data for testing."""
+        return {
+            'apollo_data': {'company': 'Test Company', 'employees': 100},
+            'successful_sources_count': 1,
+            'errors': []
+        }
+
+    @pytest.mark.asyncio
+    async def test_repeated_payload_served_from_cache(self, middleware, sample_raw_data):
+        """Test identical payloads only reach the analyzer once."""
+        first = await middleware.enhance_research_data(sample_raw_data)
+        second = await middleware.enhance_research_data(dict(sample_raw_data))
+
+        assert first['middleware_status'] == 'success'
+        assert second['middleware_status'] == 'cache_hit'
+        assert second['company_background'] == 'AI-enhanced company background'
+        middleware.research_analyzer.analyze_comprehensive_data.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_cache_disabled(self, sample_raw_data):
+        """Test caching can be turned off via configuration."""
+        middleware = LLMMiddleware({'llm_enabled': True, 'cache_enabled': False})
+        middleware.research_analyzer.analyze_comprehensive_data = AsyncMock(
+            return_value={'enhancement_status': 'ai_enhanced'}
+        )
+
+        await middleware.enhance_research_data(sample_raw_data)
+        await middleware.enhance_research_data(sample_raw_data)
+
+        assert middleware.research_analyzer.analyze_comprehensive_data.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_analysis_not_cached(self, middleware, sample_raw_data):
+        """Test error responses are not stored in the cache."""
+        middleware.research_analyzer.analyze_comprehensive_data.return_value = {
+            'enhancement_status': 'error'
+        }
+
+        await middleware.enhance_research_data(sample_raw_data)
+        await middleware.enhance_research_data(sample_raw_data)
+
+        assert middleware.research_analyzer.analyze_comprehensive_data.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_profile_strategy_served_from_cache(self, middleware):
+        """Test identical profile requests only reach the analyzer once."""
+        middleware.profile_analyzer.generate_strategy = AsyncMock(
+            return_value={'conversation_starters': ['Hello'], 'enhancement_status': 'ai_enhanced'}
+        )
+        research_data = {'research_content': '# Test Company research'}
+
+        first = await middleware.enhance_profile_strategy(research_data)
+        second = await middleware.enhance_profile_strategy(dict(research_data))
+
+        assert first['middleware_status'] == 'success'
+        assert second['middleware_status'] == 'cache_hit'
+        middleware.profile_analyzer.generate_strategy.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_injected_cache_used(self, sample_raw_data):
+        """Test a cache passed to the constructor replaces the default."""
+        cache = LLMCache(max_entries=10)
+        middleware = LLMMiddleware({'llm_enabled': True}, cache=cache)
+        middleware.research_analyzer.analyze_comprehensive_data = AsyncMock(
+            return_value={'enhancement_status': 'ai_enhanced'}
+        )
+
+        await middleware.enhance_research_data(sample_raw_data)
+
+        assert middleware.cache is cache
+        assert len(cache) == 1
+
+    @pytest.mark.asyncio
+    async def test_health_check_reports_cache_stats(self, middleware, sample_raw_data):
+        """Test cache hits and misses are surfaced in the health check."""
+        await middleware.enhance_research_data(sample_raw_data)
+        await middleware.enhance_research_data(sample_raw_data)
+
+        health = await middleware.health_check()
+
+        assert health['cache'] == {'enabled': True, 'entries': 1, 'hits': 1, 'misses': 1}
+
+    def test_cache_key_ignores_key_order(self, middleware):
+        """Test cache keys are canonical and fixed-size."""
+        first = middleware._cache_key('research', {'a': 1, 'b': {'y': 2, 'x': 1}})
+        second = middleware._cache_key('research', {'b': {'x': 1, 'y': 2}, 'a': 1})
+
+        assert first == second
+        assert len(first) == 32
+        assert middleware._cache_key('research', {'a': 2, 'b': {'y': 2, 'x': 1}}) != first
+
+    def test_cache_key_accepts_non_json_payloads(self, middleware):
+        """Test payloads with datetimes and non-string keys still key deterministically."""
+        payload = {'collected_at': datetime(2024, 1, 1), 'counts': {1: 'one', 2: 'two'}}
+
+        assert middleware._cache_key('research', payload) == middleware._cache_key('research', dict(payload))
+        assert middleware._cache_key('research', payload) != middleware._cache_key(
+            'research', {**payload, 'collected_at': datetime(2024, 1, 2)}
+        )
+
+    def test_cache_key_scoped_by_operation_and_model(self, middleware):
+        """Test the same payload keys differently per operation and model."""
+        payload = {'company': 'Test Company'}
+        research_key = middleware._cache_key('research', payload)
+
+        assert middleware._cache_key('profile', payload) != research_key
+        middleware.model_id = 'other-model'
+        assert middleware._cache_key('research', payload) != research_key
+
+
+class TestLLMMiddlewareSemanticCache:
+    """Test cases for the near-duplicate semantic cache tier."""
+
+    @pytest.fixture
+    def middleware(self):
+        """Create LLMMiddleware instance with the semantic cache enabled."""
+        middleware = LLMMiddleware({'llm_enabled': True, 'semantic_cache_enabled': True})
+        middleware.research_analyzer.analyze_comprehensive_data = AsyncMock(
+            return_value={'company_background': 'Acme background', 'enhancement_status': 'ai_enhanced'}
+        )
+        return middleware
+
+    @staticmethod
+    def collected_data(company: str, timestamp: str) -> Dict[str, Any]:
+        """Research data as collected by the data source manager."""
+        return {
+            'company': company,
+            'timestamp': timestamp,
+            'apollo_data': {'industry': 'Cloud analytics', 'employees': 120, 'location': 'Sydney'},
+            'news_data': {'articles': ['Company raises Series B to expand analytics platform']},
+            'performance_metrics': {'total_time': timestamp}
+        }
+
+    @pytest.mark.asyncio
+    async def test_drifted_payload_served_from_semantic_cache(self, middleware):
+        """Test payloads differing only in per-run fields reuse the stored result."""
+        await middleware.enhance_research_data(self.collected_data('Acme', '2025-01-01T00:00:00'))
+        result = await middleware.enhance_research_data(self.collected_data('Acme', '2025-01-02T00:00:00'))
+
+        assert result['middleware_status'] == 'semantic_cache_hit'
+        assert result['company_background'] == 'Acme background'
+        middleware.research_analyzer.analyze_comprehensive_data.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_other_company_not_matched(self, middleware):
+        """Test similar content for a different company is not reused."""
+        await middleware.enhance_research_data(self.collected_data('Acme', '2025-01-01T00:00:00'))
+        result = await middleware.enhance_research_data(self.collected_data('Globex', '2025-01-01T00:00:00'))
+
+        assert result['middleware_status'] == 'success'
+        assert middleware.research_analyzer.analyze_comprehensive_data.call_count == 2
+
+    def test_disabled_by_default(self):
+        """Test the semantic tier is opt-in."""
+        assert LLMMiddleware({'llm_enabled': True}).semantic_cache is None
+
+
+class TestLLMMiddlewareCircuitBreaker:
+    """Test cases for short-circuiting the LLM while it is failing."""
+
+    @pytest.mark.asyncio
+    async def test_failures_open_circuit_and_skip_llm(self):
+        """Test repeated LLM errors stop further calls until the breaker recovers."""
+        middleware = LLMMiddleware({
+            'llm_enabled': True, 'cache_enabled': False,
+            'circuit_min_calls': 2, 'circuit_fallback_duration': 60
+        })
+        middleware.research_analyzer.analyze_comprehensive_data = AsyncMock(
+            return_value={'enhancement_status': 'error'}
+        )
+        raw_data = {'apollo_data': {'company': 'Test Company'}}
+
+        await middleware.enhance_research_data(raw_data)
+        await middleware.enhance_research_data(raw_data)
+        result = await middleware.enhance_research_data(raw_data)
+
+        assert result['middleware_status'] == 'circuit_open'
+        assert result['enhancement_status'] == 'manual_processing'
+        assert middleware.research_analyzer.analyze_comprehensive_data.call_count == 2
+        assert (await middleware.health_check())['circuit_breaker'] == 'open'
+
+    @pytest.mark.asyncio
+    async def test_timeouts_count_as_failures(self):
+        """Test timed out analyses are recorded against the breaker."""
+        middleware = LLMMiddleware({
+            'llm_enabled': True, 'cache_enabled': False, 'timeout_seconds': 0.01,
+            'circuit_min_calls': 1
+        })
+
+        async def slow_analysis(raw_data):
+            await asyncio.sleep(1)
+
+        middleware.profile_analyzer.generate_strategy = AsyncMock(side_effect=slow_analysis)
+
+        result = await middleware.enhance_profile_strategy({'research_content': 'Research'})
+
+        assert result['middleware_status'] == 'timeout'
+        assert middleware.circuit_breaker.state == 'open'
+
+    @pytest.mark.asyncio
+    async def test_cancelled_callers_not_counted_as_failures(self):
+        """Test cancelling a caller mid-analysis does not trip the breaker."""
+        middleware = LLMMiddleware({'llm_enabled': True, 'cache_enabled': False, 'circuit_min_calls': 1})
+        started = asyncio.Event()
+
+        async def slow_analysis(raw_data):
+            started.set()
+            await asyncio.sleep(10)
+
+        middleware.profile_analyzer.generate_strategy = AsyncMock(side_effect=slow_analysis)
+
+        task = asyncio.create_task(middleware.enhance_profile_strategy({'research_content': 'Research'}))
+        await started.wait()
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        assert middleware.circuit_breaker.state == 'closed'
+
+
+class TestLLMMiddlewareAdaptiveTimeout:
+    """Test cases for latency-based per-operation timeouts."""
+
+    def test_configured_timeout_until_enough_samples(self):
+        """Test the configured timeout applies while samples are scarce."""
+        middleware = LLMMiddleware({'llm_enabled': True, 'timeout_seconds': 60})
+        middleware._latency['research'].extend([2.0] * 19)
+
+        assert middleware._timeout_for('research') == 60
+
+    def test_timeout_follows_p95_latency(self):
+        """Test the timeout is 1.5x p95 within the configured bounds, per operation."""
+        middleware = LLMMiddleware({'llm_enabled': True, 'timeout_seconds': 60, 'min_timeout_seconds': 5})
+        middleware._latency['research'].extend([4.0] * 95 + [10.0] * 5)
+        middleware._latency['profile'].extend([1.0] * 100)
+
+        assert middleware._timeout_for('research') == 15.0
+        assert middleware._timeout_for('profile') == 5
+
+    @pytest.mark.asyncio
+    async def test_successful_calls_record_latency(self):
+        """Test only successful analyses contribute latency samples."""
+        middleware = LLMMiddleware({'llm_enabled': True, 'cache_enabled': False})
+        middleware.research_analyzer.analyze_comprehensive_data = AsyncMock(
+            side_effect=[{'enhancement_status': 'ai_enhanced'}, {'enhancement_status': 'error'}]
+        )
+        raw_data = {'apollo_data': {'company': 'Test Company'}}
+
+        await middleware.enhance_research_data(raw_data)
+        await middleware.enhance_research_data(raw_data)
+
+        assert len(middleware._latency['research']) == 1
+
+
+class TestLLMMiddlewareModelChain:
+    """Test cases for falling back to secondary models."""
+
+    @pytest.fixture
+    def middleware(self):
+        """Create LLMMiddleware instance with a two-model chain."""
+        return LLMMiddleware({
+            'llm_enabled': True, 'cache_enabled': False,
+            'model_chain': ['primary-model', 'secondary-model']
+        })
+
+    def test_primary_model_taken_from_chain(self, middleware):
+        """Test the first chain entry becomes the primary model."""
+        assert middleware.model_id == 'primary-model'
+        assert middleware.bedrock_client.model_id == 'primary-model'
+        assert [model_id for model_id, _, _ in middleware._fallback_analyzers] == ['secondary-model']
+
+    @pytest.mark.asyncio
+    async def test_next_model_used_after_primary_error(self, middleware):
+        """Test an error from the primary model is retried on the next model."""
+        middleware.research_analyzer.analyze_comprehensive_data = AsyncMock(
+            return_value={'enhancement_status': 'error'}
+        )
+        secondary = middleware._fallback_analyzers[0][1]
+        secondary.analyze_comprehensive_data = AsyncMock(
+            return_value={'company_background': 'Secondary result', 'enhancement_status': 'ai_enhanced'}
+        )
+
+        result = await middleware.enhance_research_data({'apollo_data': {'company': 'Test Company'}})
+
+        assert result['middleware_status'] == 'success'
+        assert result['model_used'] == 'secondary-model'
+        assert result['company_background'] == 'Secondary result'
+
+    @pytest.mark.asyncio
+    async def test_manual_fallback_after_chain_exhausted(self, middleware):
+        """Test failures on every model end in the manual fallback."""
+        middleware.profile_analyzer.generate_strategy = AsyncMock(side_effect=RuntimeError("throttled"))
+        middleware._fallback_analyzers[0][2].generate_strategy = AsyncMock(side_effect=RuntimeError("down"))
+
+        result = await middleware.enhance_profile_strategy({'research_content': 'Research'})
+
+        assert result['middleware_status'] == 'error'
+        assert result['fallback_reason'] == 'down'
+
+    @pytest.mark.asyncio
+    async def test_fallback_model_result_not_cached(self):
+        """Test a secondary model's result is never served from cache as the primary's."""
+        middleware = LLMMiddleware({'llm_enabled': True, 'model_chain': ['primary-model', 'secondary-model']})
+        middleware.research_analyzer.analyze_comprehensive_data = AsyncMock(
+            return_value={'enhancement_status': 'error'}
+        )
+        secondary = middleware._fallback_analyzers[0][1]
+        secondary.analyze_comprehensive_data = AsyncMock(
+            return_value={'company_background': 'Secondary result', 'enhancement_status': 'ai_enhanced'}
+        )
+        raw_data = {'apollo_data': {'company': 'Test Company'}}
+
+        await middleware.enhance_research_data(raw_data)
+        result = await middleware.enhance_research_data(dict(raw_data))
+
+        assert result['middleware_status'] == 'success'
+        assert middleware.research_analyzer.analyze_comprehensive_data.call_count == 2
+        assert len(middleware.cache) == 0
+
+    @pytest.mark.asyncio
+    async def test_chain_shares_one_deadline(self):
+        """Test a primary timeout leaves no extra time budget for the next model."""
+        middleware = LLMMiddleware({
+            'llm_enabled': True, 'cache_enabled': False, 'timeout_seconds': 0.05,
+            'model_chain': ['primary-model', 'secondary-model']
+        })
+
+        async def slow_analysis(raw_data):
+            await asyncio.sleep(1)
+
+        middleware.research_analyzer.analyze_comprehensive_data = AsyncMock(side_effect=slow_analysis)
+        secondary = middleware._fallback_analyzers[0][1]
+        secondary.analyze_comprehensive_data = AsyncMock(return_value={'enhancement_status': 'ai_enhanced'})
+
+        result = await middleware.enhance_research_data({'apollo_data': {'company': 'Test Company'}})
+
+        assert result['middleware_status'] == 'timeout'
+        secondary.analyze_comprehensive_data.assert_not_called()
+
+
+class TestLLMMiddlewareMaxTokens:
+    """Test cases for per-analysis-type output token caps."""
+
+    def test_per_type_caps_passed_to_client(self):
+        """Test a max_tokens dict sets caps per analysis type."""
+        middleware = LLMMiddleware({'llm_enabled': True, 'max_tokens': {'research': 1500}})
+
+        assert middleware.bedrock_client.max_tokens_by_type == {'research': 1500, 'profile': 1000}
+
+    def test_single_max_tokens_acts_as_ceiling(self):
+        """Test a single max_tokens number caps every analysis type."""
+        middleware = LLMMiddleware({'llm_enabled': True, 'max_tokens': 1200})
+
+        assert middleware.bedrock_client.max_tokens_by_type == {'research': 1200, 'profile': 1000}
+
+
+class TestLLMMiddlewareBotocoreConfig:
+    """Test cases for the botocore configuration passed to Bedrock clients."""
+
+    def test_config_sized_from_middleware_settings(self):
+        """Test the pool, retries and timeouts follow the middleware config."""
+        middleware = LLMMiddleware({'llm_enabled': True, 'max_concurrency': 32, 'timeout_seconds': 45})
+        botocore_config = middleware.bedrock_client.botocore_config
+
+        assert botocore_config.max_pool_connections == 32
+        assert botocore_config.retries == {'max_attempts': 2, 'mode': 'adaptive'}
+        assert botocore_config.read_timeout == 45
+        assert botocore_config.connect_timeout == 5
+
+    def test_equal_settings_share_client(self):
+        """Test middleware instances with equal settings reuse one Bedrock client."""
+        first = LLMMiddleware({'llm_enabled': True, 'max_concurrency': 4})
+        second = LLMMiddleware({'llm_enabled': True, 'max_concurrency': 4})
+
+        assert first.bedrock_client is second.bedrock_client
+        assert first.bedrock_client.botocore_config.max_pool_connections == 10
+
+
+    def test_prompt_cache_enabled_by_default(self):
+        """Test prompt caching is passed to the Bedrock client and can be turned off."""
+        enabled = LLMMiddleware({'llm_enabled': True})
+        disabled = LLMMiddleware({'llm_enabled': True, 'prompt_cache': False})
+
+        assert enabled.bedrock_client.prompt_cache_enabled is True
+        assert disabled.bedrock_client.prompt_cache_enabled is False
+        assert enabled.bedrock_client is not disabled.bedrock_client
+
+    def test_temperature_passed_to_client(self):
+        """Test the configured temperature reaches the client and separates shared clients."""
+        default = LLMMiddleware({'llm_enabled': True})
+        warmer = LLMMiddleware({'llm_enabled': True, 'temperature': 0.7})
+
+        assert default.bedrock_client.temperature == 0.3
+        assert warmer.bedrock_client.temperature == 0.7
+        assert default.bedrock_client is not warmer.bedrock_client
+
+    def test_latency_mode_passed_to_client(self):
+        """Test latency mode defaults to standard and is part of the shared client key."""
+        standard = LLMMiddleware({'llm_enabled': True})
+        optimized = LLMMiddleware({'llm_enabled': True, 'latency_mode': 'optimized'})
+
+        assert standard.bedrock_client.latency_mode == 'standard'
+        assert optimized.bedrock_client.latency_mode == 'optimized'
+        assert standard.bedrock_client is not optimized.bedrock_client
+
+
+class TestLLMMiddlewarePayloadCompaction:
+    """Test cases for cutting oversized research fields before analysis."""
+
+    @pytest.fixture
+    def middleware(self):
+        """Create LLMMiddleware instance with a small field budget and mocked analyzer."""
+        middleware = LLMMiddleware({'llm_enabled': True, 'max_field_chars': 100})
+        middleware.research_analyzer.analyze_comprehensive_data = AsyncMock(
+            return_value={'enhancement_status': 'ai_enhanced'}
+        )
+        return middleware
+
+    @pytest.mark.asyncio
+    async def test_oversized_lists_cut_to_head_and_tail(self, middleware):
+        """Test long lists keep their ends, record the cut and the result is tagged."""
+        raw_data = {
+            'company': 'Test Company',
+            'company_website': {'description': 'a' * 60 + 'b' * 60},
+            'job_boards': {'jobs': [f'job-{index}' for index in range(50)]}
+        }
+
+        result = await middleware.enhance_research_data(raw_data)
+
+        payload = middleware.research_analyzer.analyze_comprehensive_data.call_args[0][0]
+        assert payload['company'] == 'Test Company'
+        assert payload['company_website'] is raw_data['company_website']
+        jobs = payload['job_boards']['jobs']
+        assert jobs[0] == 'job-0' and jobs[-1] == 'job-49'
+        assert all(item.startswith('job-') for item in jobs)
+        assert payload['job_boards']['jobs_omitted_items'] == 50 - len(jobs)
+        assert len(raw_data['job_boards']['jobs']) == 50
+        assert result['payload_compacted'] is True
+
+    def test_compacted_list_tail_reaches_prompt(self):
+        """Test the kept list tail and the omitted count survive prompt serialization."""
+        raw_data = {'jobs': [f'job-{index:05d}' for index in range(2000)]}
+
+        payload, truncated = _compact_field(raw_data, 8000)
+        prompt_json = orjson.loads(_to_prompt_json(payload))
+
+        assert truncated is True
+        assert prompt_json['jobs'][-1] == 'job-01999'
+        assert prompt_json['jobs_omitted_items'] == 2000 - len(prompt_json['jobs'])
+
+    def test_long_strings_left_to_client_cap(self):
+        """Test strings are not cut here; the client applies the one length cap."""
+        raw_data = {'description': 'x' * 12000}
+
+        payload, truncated = _compact_field(raw_data, 8000)
+
+        assert payload is raw_data
+        assert truncated is False
+
+    @pytest.mark.asyncio
+    async def test_small_payload_passed_through(self, middleware):
+        """Test payloads within budget reach the analyzer unchanged and untagged."""
+        raw_data = {'company': 'Test Company', 'apollo_data': {'employees': 100}}
+
+        result = await middleware.enhance_research_data(raw_data)
+
+        assert middleware.research_analyzer.analyze_comprehensive_data.call_args[0][0] is raw_data
+        assert 'payload_compacted' not in result
+
+
+class TestLLMMiddlewareHealthCheck:
+    """Test cases for the cached health check."""
+
+    @pytest.mark.asyncio
+    async def test_result_reused_within_ttl(self):
+        """Test probes within the TTL reuse the last result without pinging Bedrock."""
+        middleware = LLMMiddleware({'llm_enabled': True, 'health_check_ttl_seconds': 5})
+
+        with patch.object(middleware.bedrock_client, 'ping', AsyncMock(return_value=True)) as mock_ping:
+            with patch('src.llm_enhancer.middleware.time.monotonic', return_value=100.0):
+                first = await middleware.health_check()
+                first['connectivity'] = 'mutated'
+                second = await middleware.health_check()
+            with patch('src.llm_enhancer.middleware.time.monotonic', return_value=106.0):
+                await middleware.health_check()
+
+        assert second['connectivity'] == 'healthy'
+        assert mock_ping.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_ping_reports_unhealthy(self):
+        """Test a failed ping marks connectivity unhealthy."""
+        middleware = LLMMiddleware({'llm_enabled': True})
+
+        with patch.object(middleware.bedrock_client, 'ping', AsyncMock(return_value=False)):
+            health = await middleware.health_check()
+
+        assert health['connectivity'] == 'unhealthy'
+        assert health['last_check'] == 'failed: Bedrock client unavailable'
+
+
+class TestLLMMiddlewareMetrics:
+    """Test cases for cache and fallback metrics."""
+
+    @pytest.mark.asyncio
+    async def test_cache_hits_and_fallbacks_counted(self):
+        """Test cache hits and fallback reasons are recorded with their labels."""
+        middleware = LLMMiddleware({'llm_enabled': True})
+        middleware.research_analyzer.analyze_comprehensive_data = AsyncMock(
+            return_value={'enhancement_status': 'ai_enhanced'}
+        )
+        raw_data = {'apollo_data': {'company': 'Test Company'}}
+
+        with patch('src.llm_enhancer.middleware.CACHE_HITS', Mock()) as cache_hits, \
+             patch('src.llm_enhancer.middleware.FALLBACK_REASONS', Mock()) as fallback_reasons, \
+             patch('src.llm_enhancer.middleware.BEDROCK_LATENCY', Mock()) as latency:
+            await middleware.enhance_research_data(raw_data)
+            await middleware.enhance_research_data(raw_data)
+            await middleware.enhance_profile_strategy({})
+
+        cache_hits.labels.assert_called_once_with('research', 'exact')
+        fallback_reasons.labels.assert_called_once_with('profile', 'validation_failed')
+        latency.labels.assert_called_once_with('research', middleware.model_id)
+
+
+class TestLLMMiddlewareCoalescing:
+    """Test cases for single-flight request coalescing."""
+
+    @pytest.mark.asyncio
+    async def test_identical_concurrent_requests_share_one_call(self):
+        """Test concurrent identical payloads trigger a single analysis."""
+        middleware = LLMMiddleware({'llm_enabled': True, 'cache_enabled': False})
+
+        async def slow_analysis(raw_data):
+            await asyncio.sleep(0.05)
+            return {'company_background': 'Shared result', 'enhancement_status': 'ai_enhanced'}
+
+        middleware.research_analyzer.analyze_comprehensive_data = AsyncMock(side_effect=slow_analysis)
+        raw_data = {'apollo_data': {'company': 'Test Company'}}
+
+        results = await asyncio.gather(*(middleware.enhance_research_data(dict(raw_data)) for _ in range(3)))
+
+        assert [r['company_background'] for r in results] == ['Shared result'] * 3
+        assert results[0] is not results[1]
+        middleware.research_analyzer.analyze_comprehensive_data.assert_called_once()
+        assert middleware._inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_cancelled_first_caller_does_not_cancel_waiters(self):
+        """Test a waiter takes over the call when the first caller is cancelled."""
+        middleware = LLMMiddleware({'llm_enabled': True, 'cache_enabled': False})
+        started = asyncio.Event()
+        calls = []
+
+        async def analysis(raw_data):
+            calls.append(raw_data)
+            if len(calls) == 1:
+                started.set()
+                await asyncio.sleep(10)
+            return {'company_background': 'Retried result', 'enhancement_status': 'ai_enhanced'}
+
+        middleware.research_analyzer.analyze_comprehensive_data = AsyncMock(side_effect=analysis)
+        raw_data = {'apollo_data': {'company': 'Test Company'}}
+
+        first = asyncio.create_task(middleware.enhance_research_data(dict(raw_data)))
+        await started.wait()
+        second = asyncio.create_task(middleware.enhance_research_data(dict(raw_data)))
+        await asyncio.sleep(0)
+        first.cancel()
+
+        result = await second
+        assert first.cancelled()
+        assert not second.cancelled()
+        assert result['company_background'] == 'Retried result'
+        assert len(calls) == 2
+        assert middleware._inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_failure_propagates_to_waiters(self):
+        """Test an ordinary failure of the shared call reaches every joined caller."""
+        middleware = LLMMiddleware({'llm_enabled': True, 'cache_enabled': False})
+
+        async def failing_enhancement(raw_data, request_key):
+            await asyncio.sleep(0.01)
+            raise RuntimeError("boom")
+
+        middleware._run_research_enhancement = AsyncMock(side_effect=failing_enhancement)
+        raw_data = {'apollo_data': {'company': 'Test Company'}}
+
+        results = await asyncio.gather(
+            *(middleware.enhance_research_data(dict(raw_data)) for _ in range(2)),
+            return_exceptions=True
+        )
+
+        assert [str(r) for r in results] == ["boom", "boom"]
+        assert all(isinstance(r, RuntimeError) for r in results)
+        middleware._run_research_enhancement.assert_called_once()
+
+
+class TestLLMMiddlewareFanOut:
+    """Test cases for concurrent enhancement of multiple payloads."""
+
+    @pytest.mark.asyncio
+    async def test_payloads_enhanced_concurrently_in_order(self):
+        """Test distinct payloads run concurrently and keep input order."""
+        middleware = LLMMiddleware({'llm_enabled': True, 'cache_enabled': False})
+
+        async def slow_analysis(raw_data):
+            await asyncio.sleep(0.1)
+            return {
+                'company_background': raw_data['apollo_data']['company'],
+                'enhancement_status': 'ai_enhanced'
+            }
+
+        middleware.research_analyzer.analyze_comprehensive_data = AsyncMock(side_effect=slow_analysis)
+        payloads = [{'apollo_data': {'company': f'Company {i}'}} for i in range(5)]
+
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        results = await middleware.enhance_research_data_many(payloads)
+        elapsed = loop.time() - started
+
+        assert [r['company_background'] for r in results] == [f'Company {i}' for i in range(5)]
+        assert elapsed < 0.3
+
+    @pytest.mark.asyncio
+    async def test_failure_isolated_to_its_payload(self):
+        """Test an unexpected error only falls back for the failing payload."""
+        middleware = LLMMiddleware({'llm_enabled': True, 'cache_enabled': False})
+        middleware.research_analyzer.analyze_comprehensive_data = AsyncMock(
+            return_value={'enhancement_status': 'ai_enhanced'}
+        )
+        original = middleware.enhance_research_data
+
+        async def flaky_enhance(raw_data):
+            if raw_data.get('fail'):
+                raise RuntimeError("boom")
+            return await original(raw_data)
+
+        with patch.object(middleware, 'enhance_research_data', side_effect=flaky_enhance):
+            results = await middleware.enhance_research_data_many(
+                [{'apollo_data': {'company': 'Test Company'}}, {'fail': True}]
+            )
+
+        assert results[0]['middleware_status'] == 'success'
+        assert results[1]['middleware_status'] == 'error'
+        assert results[1]['fallback_reason'] == 'boom'
+
+    @pytest.mark.asyncio
+    async def test_cancelled_payload_cancels_batch(self):
+        """Test a cancelled payload is re-raised instead of returned as a result."""
+        middleware = LLMMiddleware({'llm_enabled': True, 'cache_enabled': False})
+
+        async def cancelled_enhance(raw_data):
+            raise asyncio.CancelledError()
+
+        with patch.object(middleware, 'enhance_research_data', side_effect=cancelled_enhance):
+            with pytest.raises(asyncio.CancelledError):
+                await middleware.enhance_research_data_many([{'apollo_data': {'company': 'Test Company'}}])
+
+
+class TestLLMMiddlewareEnhanceAll:
+    """Test cases for chained research and profile enhancement."""
+
+    @pytest.mark.asyncio
+    async def test_profile_built_from_research_result(self):
+        """Test the profile analyzer receives content from the research result."""
+        middleware = LLMMiddleware({'llm_enabled': True, 'cache_enabled': False})
+        middleware.research_analyzer.analyze_comprehensive_data = AsyncMock(return_value={
+            'company_background': 'Acme builds analytics software',
+            'technology_stack': ['AWS', 'Python'],
+            'pain_points': [],
+            'enhancement_status': 'ai_enhanced'
+        })
+        middleware.profile_analyzer.generate_strategy = AsyncMock(
+            return_value={'value_proposition': 'Faster insights', 'enhancement_status': 'ai_enhanced'}
+        )
+
+        result = await middleware.enhance_all({'company': 'Acme', 'apollo_data': {'employees': 50}})
+
+        profile_input = middleware.profile_analyzer.generate_strategy.call_args[0][0]
+        assert profile_input['company_name'] == 'Acme'
+        assert '## Company Background\nAcme builds analytics software' in profile_input['research_content']
+        assert 'AWS, Python' in profile_input['research_content']
+        assert 'Pain Points' not in profile_input['research_content']
+        assert result['research']['middleware_status'] == 'success'
+        assert result['profile']['value_proposition'] == 'Faster insights'
+
+
+class TestLLMMiddlewareManualFallback:
+    """Test cases for the rule-based research and profile fallbacks."""
+
+    @pytest.fixture
+    def middleware(self):
+        """Create LLMMiddleware instance with LLM enhancement disabled."""
+        return LLMMiddleware({'llm_enabled': False})
+
+    def test_keywords_matched_across_all_sources(self, middleware):
+        """Test tech and pain point keywords are found in any source, in table order."""
+        raw_data = {
+            'company_website': {'description': 'Kubernetes platform built with Python'},
+            'serper_search': ['Acme plans a cloud migration on AWS', 'Security review'],
+            'errors': []
+        }
+
+        result = middleware._fallback_to_manual_research(raw_data)
+
+        assert result['technology_stack'] == ['Python', 'AWS', 'Kubernetes']
+        assert result['pain_points'] == ["Cloud migration", "Security concerns"]
+
+    def test_profile_starters_follow_rule_order(self, middleware):
+        """Test each starter uses its first matching rule and its own company default."""
+        result = middleware._fallback_to_manual_profile({
+            'research_content': 'Growth in CLOUD analytics after recent Funding'
+        })
+
+        assert result['conversation_starter_1'] == (
+            "How is your company approaching your cloud transformation journey?"
+        )
+        assert result['conversation_starter_2'] == (
+            "How is your organization leveraging data to drive business decisions?"
+        )
+        assert result['conversation_starter_3'] == (
+            "What's the biggest technology challenge your team is looking to solve?"
+        )
+        assert result['timing_recommendation'].startswith("Strong timing")
+
+    def test_corpus_uses_string_leaves_only(self, middleware):
+        """Test the keyword corpus skips dict keys, non-strings and oversized blobs."""
+        corpus = middleware._build_corpus({
+            'security_data': {'note': 'Runs on AWS', 'employees': 250},
+            'company_website': {'raw_html': 'kubernetes ' * 2000},
+            'serper_search': ['Python services']
+        })
+
+        assert corpus == 'runs on aws python services'
+
+    def test_extract_all_fills_every_research_field(self, middleware):
+        """Test one extraction pass returns all six research fields."""
+        extracted = middleware._extract_all({
+            'company_website': {'description': 'SaaS for shops', 'stack': 'React and Redis'},
+            'apollo_data': {'industry': 'Commerce', 'contacts': [{'name': 'Ann', 'title': 'CTO'}]},
+            'job_boards': {'jobs': [{}, {}]},
+            'news_data': {'articles': [{'title': 'Acme focuses on retention'}]}
+        })
+
+        assert set(extracted) == {
+            'company_background', 'business_model', 'technology_stack',
+            'pain_points', 'recent_developments', 'decision_makers'
+        }
+        assert extracted['business_model'] == "Business Model: SaaS"
+        assert extracted['technology_stack'] == ['React', 'Redis']
+        assert extracted['pain_points'] == ["Customer retention"]
+        assert extracted['recent_developments'] == [
+            "News: Acme focuses on retention", "Hiring Activity: 2 open positions"
+        ]
+        assert extracted['decision_makers'] == ["Ann - CTO"]
+
+    @pytest.mark.asyncio
+    async def test_fallback_runs_off_event_loop(self, middleware):
+        """Test manual fallbacks run in the fallback thread pool."""
+        thread_names = []
+        original = middleware._fallback_to_manual_research
+
+        def record_thread(raw_data):
+            thread_names.append(threading.current_thread().name)
+            return original(raw_data)
+
+        middleware._fallback_to_manual_research = record_thread
+        result = await middleware.enhance_research_data({'company': 'Test Company'})
+
+        assert result['enhancement_status'] == 'manual_processing'
+        assert thread_names[0].startswith('llm-fallback')
+
+    @pytest.mark.asyncio
+    async def test_fallback_pool_shared_across_instances(self):
+        """Test short-lived middleware instances do not each start their own pool."""
+        instances = [LLMMiddleware({'llm_enabled': False}) for _ in range(10)]
+        for middleware in instances:
+            await middleware.enhance_research_data({'company': 'Test Company'})
+
+        fallback_threads = [t for t in threading.enumerate() if t.name.startswith('llm-fallback')]
+        assert 0 < len(fallback_threads) <= 4
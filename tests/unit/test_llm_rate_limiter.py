@@ -0,0 +1,50 @@
+"""Unit tests for the Bedrock rate limiter."""
+
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from src.llm_enhancer.rate_limiter import BedrockRateLimiter, get_rate_limiter
+from src.llm_enhancer.client import BedrockClient
+
+
+class TestBedrockRateLimiter:
+    """Test cases for BedrockRateLimiter class."""
+    
+    def test_default_burst_is_one_minute(self):
+        """Test the bucket holds one minute of throughput by default."""
+        limiter = BedrockRateLimiter(tokens_per_sec=100)
+        assert limiter.burst == 6000
+    
+    def test_invalid_rate(self):
+        """Test a non-positive rate is rejected."""
+        with pytest.raises(ValueError):
+            BedrockRateLimiter(tokens_per_sec=0)
+    
+    @pytest.mark.asyncio
+    async def test_acquire_within_burst_does_not_wait(self):
+        """Test requests within the bucket capacity proceed immediately."""
+        limiter = BedrockRateLimiter(tokens_per_sec=100, burst=1000)
+        
+        with patch('src.llm_enhancer.rate_limiter.asyncio.sleep', new_callable=AsyncMock) as mock_sleep:
+            await limiter.acquire(600)
+            await limiter.acquire(400)
+        
+        mock_sleep.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_acquire_waits_for_deficit(self):
+        """Test exceeding the bucket sleeps for the time needed to refill."""
+        limiter = BedrockRateLimiter(tokens_per_sec=100, burst=1000)
+        
+        with patch('src.llm_enhancer.rate_limiter.time.monotonic', return_value=50.0), \
+             patch('src.llm_enhancer.rate_limiter.asyncio.sleep', new_callable=AsyncMock) as mock_sleep:
+            limiter._updated_at = 50.0
+            await limiter.acquire(1000)
+            await limiter.acquire(250)
+        
+        mock_sleep.assert_called_once_with(2.5)
+    
+    def test_clients_share_limiter(self):
+        """Test every BedrockClient uses the same process-wide limiter."""
+        assert BedrockClient()._rate_limiter is BedrockClient(region="us-east-1")._rate_limiter
+        assert BedrockClient()._rate_limiter is get_rate_limiter()
@@ -0,0 +1,282 @@
+"""Unit tests for structured logging configuration."""
+
+import io
+import json
+import logging
+import os
+import queue
+import sys
+from datetime import datetime
+from unittest.mock import patch
+
+from src.logging_config import (
+    BufferedStreamHandler, ContextLogger, ContextQueueHandler, LogContext, OperationContext,
+    StructuredFormatter, get_logger, log_context, setup_logging
+)
+
+
+def make_record(message: str = "Test message", **extra) -> logging.LogRecord:
+    """Build a log record as Logger.log would, including extra fields."""
+    record = logging.LogRecord('test.logger', logging.INFO, __file__, 10, message, None, None)
+    record.__dict__.update(extra)
+    return record
+
+
+class TestStructuredFormatter:
+    """Test cases for StructuredFormatter class."""
+
+    def test_output_is_json_with_base_fields(self):
+        """Test records format as one JSON object with the base fields."""
+        entry = json.loads(StructuredFormatter().format(make_record("Café opened")))
+
+        assert entry['message'] == "Café opened"
+        assert entry['level'] == 'INFO'
+        assert entry['logger'] == 'test.logger'
+        assert entry['line'] == 10
+
+    def test_extra_fields_and_context_included(self):
+        """Test extra fields are serialized, falling back to str for other types."""
+        token = log_context.set(LogContext('research_prospect'))
+        try:
+            output = StructuredFormatter().format(
+                make_record(collected_at=datetime(2024, 1, 1), counts={1: 'one'})
+            )
+        finally:
+            log_context.reset(token)
+
+        entry = json.loads(output)
+        assert entry['operation'] == 'research_prospect'
+        assert entry['collected_at'] == '2024-01-01T00:00:00'
+        assert entry['counts'] == {'1': 'one'}
+
+    def test_reserved_record_attributes_excluded(self):
+        """Test standard LogRecord attributes are not repeated as extra fields."""
+        entry = json.loads(StructuredFormatter().format(make_record(custom='value')))
+
+        assert entry['custom'] == 'value'
+        assert not {'msg', 'args', 'levelno', 'pathname', 'created'} & set(entry)
+
+    def test_traceback_formatted_once_and_optional(self):
+        """Test the traceback is cached on the record and can be left out."""
+        try:
+            raise ValueError("bad value")
+        except ValueError:
+            record = logging.LogRecord('test.logger', logging.ERROR, __file__, 10, "failed",
+                                       None, sys.exc_info())
+
+        with patch.object(StructuredFormatter, 'formatException', return_value='trace') as mock_format:
+            first = json.loads(StructuredFormatter().format(record))
+            second = json.loads(StructuredFormatter().format(record))
+        brief = json.loads(StructuredFormatter(include_traceback=False).format(record))
+
+        mock_format.assert_called_once()
+        assert first['exception'] == second['exception'] == {
+            'type': 'ValueError', 'message': 'bad value', 'traceback': 'trace'
+        }
+        assert brief['exception']['traceback'] is None
+
+
+class TestBufferedStreamHandler:
+    """Test cases for BufferedStreamHandler class."""
+
+    def test_flushes_on_warning_and_close(self):
+        """Test info records stay buffered until a warning or close flushes them."""
+        sink = io.BytesIO()
+        stream = io.TextIOWrapper(sink, encoding='utf-8', write_through=False)
+        handler = BufferedStreamHandler(stream, flush_interval=60)
+        handler.setFormatter(logging.Formatter('%(message)s'))
+
+        handler.handle(make_record("first"))
+        assert sink.getvalue() == b''
+
+        handler.handle(logging.LogRecord('test.logger', logging.WARNING, __file__, 10, "second", None, None))
+        assert sink.getvalue() == b'first\nsecond\n'
+
+        handler.handle(make_record("third"))
+        handler.close()
+        assert sink.getvalue().endswith(b'third\n')
+
+    def test_structured_lines_written_as_bytes(self):
+        """Test JSON lines bypass the text layer and keep their order."""
+        sink = io.BytesIO()
+        stream = io.TextIOWrapper(sink, encoding='utf-8', write_through=False)
+        handler = BufferedStreamHandler(stream, flush_interval=60)
+        handler.setFormatter(StructuredFormatter())
+
+        handler.handle(make_record("Café"))
+        handler.handle(make_record("second"))
+        handler.close()
+
+        lines = sink.getvalue().decode('utf-8').splitlines()
+        assert [json.loads(line)['message'] for line in lines] == ["Café", "second"]
+
+
+class TestContextQueueHandler:
+    """Test cases for ContextQueueHandler class."""
+
+    def test_queued_record_keeps_logging_context(self):
+        """Test context captured at enqueue time is used when formatting later."""
+        handler = ContextQueueHandler(queue.Queue())
+        token = log_context.set(LogContext('create_profile'))
+        try:
+            handler.handle(make_record("Profile ready"))
+        finally:
+            log_context.reset(token)
+
+        entry = json.loads(StructuredFormatter().format(handler.queue.get_nowait()))
+        assert entry['operation'] == 'create_profile'
+        assert 'log_context' not in entry
+
+    def test_full_queue_drops_oldest_record(self):
+        """Test logging never blocks when the listener falls behind."""
+        handler = ContextQueueHandler(queue.Queue(maxsize=2))
+        for message in ("first", "second", "third"):
+            handler.handle(make_record(message))
+
+        assert [handler.queue.get_nowait().msg for _ in range(2)] == ["second", "third"]
+
+
+class TestContextLogger:
+    """Test cases for ContextLogger class."""
+
+    def test_disabled_level_skips_context_lookup(self):
+        """Test records below the logger level return before reading context."""
+        context_logger = ContextLogger('test.disabled')
+        context_logger.logger.setLevel(logging.WARNING)
+
+        with patch('src.logging_config.log_context') as mock_context, \
+                patch.object(context_logger.logger, 'handle') as mock_handle:
+            context_logger.debug("not emitted", detail='value')
+
+        mock_context.get.assert_not_called()
+        mock_handle.assert_not_called()
+
+    def test_is_enabled_for_follows_logger_level(self):
+        """Test isEnabledFor reflects the wrapped logger's level."""
+        context_logger = ContextLogger('test.enabled')
+        context_logger.logger.setLevel(logging.WARNING)
+
+        assert not context_logger.isEnabledFor(logging.INFO)
+        assert context_logger.isEnabledFor(logging.ERROR)
+
+    def test_operation_context_attached_inside_operation(self):
+        """Test records logged inside an operation carry its context once."""
+        context_logger = ContextLogger('test.context')
+
+        with patch.object(context_logger.logger, 'handle') as mock_handle:
+            with OperationContext('research', prospect_id='p-1') as operation:
+                context_logger.info("working")
+            context_logger.info("done")
+
+        inside, after = (call.args[0] for call in mock_handle.call_args_list)
+        assert inside.operation_context == {
+            'operation': 'research', 'prospect_id': 'p-1',
+            'tool_name': None, 'request_id': operation.request_id
+        }
+        assert not hasattr(after, 'operation_context')
+
+    def test_record_points_at_call_site(self):
+        """Test records report the function that called the ContextLogger."""
+        context_logger = ContextLogger('test.caller')
+
+        with patch.object(context_logger.logger, 'handle') as mock_handle:
+            context_logger.warning("careful", step=2)
+
+        record = mock_handle.call_args.args[0]
+        assert record.funcName == 'test_record_points_at_call_site'
+        assert record.module == 'test_logging_config'
+        assert record.step == 2
+
+    def test_get_logger_reuses_instance_per_name(self):
+        """Test get_logger returns one ContextLogger per name."""
+        assert get_logger('test.memoized') is get_logger('test.memoized')
+        assert get_logger('test.memoized') is not get_logger('test.other')
+
+
+class TestOperationContext:
+    """Test cases for OperationContext class."""
+
+    def test_request_ids_unique_hex(self):
+        """Test each operation gets a distinct 32-character hex request ID."""
+        request_ids = {OperationContext('research').request_id for _ in range(1000)}
+
+        assert len(request_ids) == 1000
+        assert all(len(value) == 32 and int(value, 16) >= 0 for value in request_ids)
+
+    def test_duration_measured_with_monotonic_clock(self):
+        """Test durations come from the monotonic clock, not wall-clock time."""
+        context = OperationContext('research')
+
+        with patch('src.logging_config.time.monotonic_ns', side_effect=[1_000_000_000, 3_500_000_000]), \
+                patch.object(ContextLogger, 'info') as mock_info:
+            with context:
+                pass
+
+        assert mock_info.call_args.kwargs['duration_seconds'] == 2.5
+
+
+class TestSetupLogging:
+    """Test cases for setup_logging."""
+
+    def test_null_handler_when_stderr_discarded(self):
+        """Test no formatting pipeline is installed when stderr goes to the null device."""
+        root_logger = logging.getLogger()
+        saved_handlers, saved_level = root_logger.handlers[:], root_logger.level
+        try:
+            with open(os.devnull, 'w') as devnull, patch('sys.stderr', devnull), \
+                    patch('src.logging_config._stop_queue_listener'):
+                setup_logging()
+            assert [type(handler) for handler in root_logger.handlers] == [logging.NullHandler]
+        finally:
+            root_logger.handlers[:] = saved_handlers
+            root_logger.setLevel(saved_level)
+
+    def test_instances_have_no_dict(self):
+        """Test per-operation and per-logger objects use slots."""
+        assert not hasattr(OperationContext('research'), '__dict__')
+        assert not hasattr(ContextLogger('test.slots'), '__dict__')
+
+    def test_nested_operation_restores_outer_context(self):
+        """Test leaving a nested operation restores the enclosing operation's context."""
+        with OperationContext('research', prospect_id='p-1') as outer:
+            with OperationContext('profile', tool_name='create_profile'):
+                assert log_context.get().operation == 'profile'
+            assert log_context.get() == LogContext('research', 'p-1', None, outer.request_id)
+
+        assert log_context.get() == LogContext()
+
+    def test_buffered_handler_uses_configured_batching(self):
+        """Test buffer size and flush interval are applied to the console handler."""
+        root_logger = logging.getLogger()
+        saved_handlers, saved_level = root_logger.handlers[:], root_logger.level
+        sink = io.BytesIO()
+        stream = io.TextIOWrapper(io.BufferedWriter(sink, buffer_size=1024), encoding='utf-8')
+        try:
+            with patch('src.logging_config._buffered_stderr', return_value=stream) as mock_stderr, \
+                    patch('src.logging_config._stop_queue_listener'), \
+                    patch('src.logging_config._stderr_discarded', return_value=False):
+                setup_logging(queued=False, buffer_size=1024, flush_interval=0.05)
+            handler = root_logger.handlers[0]
+            mock_stderr.assert_called_once_with(1024)
+            assert isinstance(handler, BufferedStreamHandler)
+            assert handler.flush_interval == 0.05
+        finally:
+            root_logger.handlers[0].close()
+            root_logger.handlers[:] = saved_handlers
+            root_logger.setLevel(saved_level)
+
+    def test_records_logged_after_listener_stops_are_written(self):
+        """Test records from later atexit hooks bypass the stopped queue listener."""
+        import subprocess
+        code = (
+            "import atexit, logging; "
+            "atexit.register(lambda: logging.getLogger('late').error('late error')); "
+            "from src.logging_config import setup_logging; "
+            "setup_logging(structured=False, buffered=False); "
+            "logging.getLogger('early').info('early info')"
+        )
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+
+        assert "early - INFO - early info" in result.stderr
+        assert "late - ERROR - late error" in result.stderr
+        assert "Logging error" not in result.stderr
@@ -0,0 +1,293 @@
+import orjson
+from click.testing import CliRunner
+from src.mcp_server.cli import mcp_cli
+
+def test_config_json_uses_environment_overrides(monkeypatch):
+    monkeypatch.setenv("MCP_SERVER_CONFIG", orjson.dumps({"temperature": 0.7}).decode())
+    runner = CliRunner()
+    result = runner.invoke(mcp_cli, ["config"])
+    assert result.exit_code == 0
+    body = result.output.split("\n", 1)[1]
+    config = orjson.loads(body)
+    assert config["temperature"] == 0.7
+    assert config["fallback_mode"] == "graceful"
+
+def test_config_ignores_invalid_environment_json(monkeypatch):
+    monkeypatch.setenv("MCP_SERVER_CONFIG", "{not json")
+    runner = CliRunner()
+    result = runner.invoke(mcp_cli, ["config"])
+    assert result.exit_code == 0
+    assert '"llm_provider": "bedrock"' in result.output
+
+def test_test_tool_rejects_invalid_json():
+    runner = CliRunner()
+    result = runner.invoke(mcp_cli, ["test-tool", "research_prospect", "{bad"])
+    assert result.exit_code == 0
+    assert "Invalid JSON arguments" in result.output
+
+def test_test_tool_requires_parameter():
+    runner = CliRunner()
+    result = runner.invoke(mcp_cli, ["test-tool", "create_profile", '{"company": "x"}'])
+    assert result.exit_code == 0
+    assert "create_profile requires 'prospect_id' parameter" in result.output
+
+def test_validate_all_reports_database_error_and_runs_checks(capsys):
+    import asyncio
+    from unittest.mock import AsyncMock
+    from src.mcp_server.cli import _validate_all
+    init_db = AsyncMock(side_effect=RuntimeError("db down"))
+    asyncio.run(_validate_all(init_db, {}, False, False, True))
+    captured = capsys.readouterr()
+    init_db.assert_awaited_once()
+    assert "Database error: db down" in captured.err
+    assert "=== Data Source Validation ===" in captured.out
+
+def test_connectivity_checks_read_environment_snapshot(capsys, monkeypatch):
+    import asyncio
+    from src.mcp_server.cli import _test_api_connectivity
+    monkeypatch.delenv("SERPER_API_KEY", raising=False)
+    asyncio.run(_test_api_connectivity({"SERPER_API_KEY": "key"}))
+    out = capsys.readouterr().out
+    assert "Serper API key available" in out
+    assert "Firecrawl" not in out
+
+# Markdown summary in the shape tools.research_prospect returns
+_RESEARCH_RESULT = "✅ **Complete Research Completed for Test Company**\n\n📊 **Prospect ID**: p-1\n"
+
+def _fake_tools(monkeypatch, research_prospect):
+    import sys
+    import types
+    from unittest.mock import AsyncMock
+    tools = types.ModuleType("src.mcp_server.tools")
+    tools.research_prospect = research_prospect
+    tools.create_profile = AsyncMock(return_value="profile")
+    tools.get_prospect_data = AsyncMock(return_value="data")
+    monkeypatch.setitem(sys.modules, "src.mcp_server.tools", tools)
+    monkeypatch.setattr("src.mcp_server.tools", tools, raising=False)
+    return tools
+
+def test_benchmark_runs_iterations_concurrently(monkeypatch):
+    import asyncio
+    state = {"active": 0, "peak": 0}
+
+    async def research_prospect(company):
+        state["active"] += 1
+        state["peak"] = max(state["peak"], state["active"])
+        await asyncio.sleep(0.01)
+        state["active"] -= 1
+        return _RESEARCH_RESULT
+
+    _fake_tools(monkeypatch, research_prospect)
+    runner = CliRunner()
+    result = runner.invoke(mcp_cli, ["benchmark", "--iterations", "4", "--concurrency", "2"])
+    assert result.exit_code == 0
+    assert "Successful runs: 4/4" in result.output
+    assert state["peak"] == 2
+
+def test_benchmark_counts_failed_iterations(monkeypatch):
+    from unittest.mock import AsyncMock
+    _fake_tools(monkeypatch, AsyncMock(side_effect=RuntimeError("boom")))
+    runner = CliRunner()
+    result = runner.invoke(mcp_cli, ["benchmark", "--iterations", "2"])
+    assert result.exit_code == 0
+    assert "Iteration 1 failed: boom" in result.output
+    assert "Successful runs: 0/2" in result.output
+
+def test_benchmark_reads_prospect_id_from_research_summary(monkeypatch):
+    from unittest.mock import AsyncMock
+    tools = _fake_tools(monkeypatch, AsyncMock(return_value=_RESEARCH_RESULT))
+    runner = CliRunner()
+    result = runner.invoke(mcp_cli, ["benchmark", "--iterations", "1"])
+    assert result.exit_code == 0
+    assert "✓ Iteration 1 completed successfully" in result.output
+    assert "Successful runs: 1/1" in result.output
+    tools.create_profile.assert_awaited_once_with("p-1")
+    tools.get_prospect_data.assert_awaited_once_with("p-1")
+
+def test_benchmark_reports_research_error_summary(monkeypatch):
+    from unittest.mock import AsyncMock
+    _fake_tools(monkeypatch, AsyncMock(return_value="❌ **Error during comprehensive research for Test Company**:\nboom"))
+    runner = CliRunner()
+    result = runner.invoke(mcp_cli, ["benchmark", "--iterations", "1"])
+    assert result.exit_code == 0
+    assert "no prospect_id returned from research" in result.output
+    assert "Successful runs: 0/1" in result.output
+
+def test_cli_import_does_not_load_server_stack():
+    import subprocess
+    import sys
+    code = (
+        "import sys, src.mcp_server.cli; "
+        "loaded = [m for m in ('src.mcp_server.server', 'src.mcp_server.tools', 'asyncio') if m in sys.modules]; "
+        "print(','.join(loaded))"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == ""
+
+def test_test_tool_dispatches_required_argument(monkeypatch):
+    from unittest.mock import AsyncMock
+    tools = _fake_tools(monkeypatch, AsyncMock())
+    tools.search_prospects = AsyncMock(return_value="matches")
+    runner = CliRunner()
+    result = runner.invoke(mcp_cli, ["test-tool", "search_prospects", '{"query": "fintech"}'])
+    assert result.exit_code == 0
+    tools.search_prospects.assert_awaited_once_with("fintech")
+    assert "matches" in result.output
+
+def test_benchmark_reports_stage_timings(monkeypatch):
+    from unittest.mock import AsyncMock
+    _fake_tools(monkeypatch, AsyncMock(return_value=_RESEARCH_RESULT))
+    runner = CliRunner()
+    result = runner.invoke(mcp_cli, ["benchmark", "--measure-performance"])
+    assert result.exit_code == 0
+    for label in ("Research time", "Profile time", "Data retrieval time", "Total time"):
+        assert f"    {label}: 0.00s" in result.output
+
+def test_benchmark_async_mode_overlaps_research(monkeypatch):
+    import asyncio
+    state = {"active": 0, "peak": 0}
+
+    async def research_prospect(company):
+        state["active"] += 1
+        state["peak"] = max(state["peak"], state["active"])
+        await asyncio.sleep(0.01)
+        state["active"] -= 1
+        return _RESEARCH_RESULT
+
+    _fake_tools(monkeypatch, research_prospect)
+    runner = CliRunner()
+    result = runner.invoke(mcp_cli, ["benchmark", "--iterations", "3", "--async-mode"])
+    assert result.exit_code == 0
+    assert "Successful runs: 3/3" in result.output
+    assert state["peak"] == 3
+
+def test_config_yaml_keeps_key_order(monkeypatch):
+    import pytest
+    yaml = pytest.importorskip("yaml")
+    monkeypatch.delenv("MCP_SERVER_CONFIG", raising=False)
+    runner = CliRunner()
+    result = runner.invoke(mcp_cli, ["config", "--output-format", "yaml"])
+    assert result.exit_code == 0
+    body = result.output.split("\n", 1)[1]
+    config = yaml.safe_load(body)
+    assert list(config)[:2] == ["llm_enabled", "llm_provider"]
+    assert config["data_sources"]["linkedin_auth"] is False
+
+def test_config_env_output(monkeypatch):
+    monkeypatch.setenv("MCP_SERVER_CONFIG", orjson.dumps({"max_tokens": 123}).decode())
+    runner = CliRunner()
+    result = runner.invoke(mcp_cli, ["config", "--output-format", "env"])
+    assert result.exit_code == 0
+    lines = result.output.splitlines()
+    assert lines[1] == "# Environment variables for MCP Server"
+    assert "MCP_MAX_TOKENS=123" in lines
+    assert lines[-1] == "MCP_JOB_BOARDS_AUTH=False"
+
+def test_info_lists_all_tools():
+    runner = CliRunner()
+    result = runner.invoke(mcp_cli, ["info"])
+    assert result.exit_code == 0
+    for name in ("research_prospect", "create_profile", "get_prospect_data", "search_prospects"):
+        assert f"• {name}\n  Description:" in result.output
+    assert result.output.endswith("Parameters: query (string)\n\n")
+
+def test_config_merges_partial_data_sources(monkeypatch):
+    overlay = {"data_sources": {"apollo_enabled": False}}
+    monkeypatch.setenv("MCP_SERVER_CONFIG", orjson.dumps(overlay).decode())
+    runner = CliRunner()
+    result = runner.invoke(mcp_cli, ["config"])
+    assert result.exit_code == 0
+    data_sources = orjson.loads(result.output.split("\n", 1)[1])["data_sources"]
+    assert data_sources["apollo_enabled"] is False
+    assert data_sources["firecrawl_enabled"] is True
+    assert data_sources["job_boards_auth"] is False
+
+def test_load_runtime_config_decodes_each_value_once(monkeypatch):
+    from src.mcp_server.cli import _load_runtime_config, _parse_runtime_config
+    _parse_runtime_config.cache_clear()
+    monkeypatch.setenv("MCP_SERVER_CONFIG", '{"max_tokens": 1}')
+    first = _load_runtime_config()
+    assert _load_runtime_config() is first
+    assert _parse_runtime_config.cache_info().hits == 1
+    monkeypatch.setenv("MCP_SERVER_CONFIG", "[1, 2]")
+    assert _load_runtime_config() == {}
+
+def test_benchmark_quiet_prints_only_summary(monkeypatch):
+    from unittest.mock import AsyncMock
+    _fake_tools(monkeypatch, AsyncMock(return_value=_RESEARCH_RESULT))
+    runner = CliRunner()
+    result = runner.invoke(mcp_cli, ["benchmark", "--iterations", "2", "--quiet"])
+    assert result.exit_code == 0
+    assert "Testing research_prospect" not in result.output
+    assert "Successful runs: 2/2" in result.output
+
+def test_benchmark_iteration_output_is_grouped(monkeypatch):
+    from unittest.mock import AsyncMock
+    _fake_tools(monkeypatch, AsyncMock(return_value=_RESEARCH_RESULT))
+    runner = CliRunner()
+    result = runner.invoke(mcp_cli, ["benchmark", "--iterations", "2", "--concurrency", "2"])
+    assert result.exit_code == 0
+    block = (
+        "Iteration 1/2\n"
+        "  Testing research_prospect...\n"
+        "  Testing create_profile...\n"
+        "  Testing get_prospect_data...\n"
+        "  ✓ Iteration 1 completed successfully\n"
+    )
+    assert block in result.output
+
+def test_data_source_manager_is_shared(monkeypatch):
+    import sys
+    import types
+    from src.mcp_server.cli import _data_source_manager
+    fake = types.ModuleType("src.data_sources.manager")
+    fake.DataSourceManager = object
+    monkeypatch.setitem(sys.modules, "src.data_sources.manager", fake)
+    monkeypatch.setattr("src.data_sources.manager", fake, raising=False)
+    _data_source_manager.cache_clear()
+    try:
+        assert _data_source_manager() is _data_source_manager()
+    finally:
+        _data_source_manager.cache_clear()
+
+def _fake_server(monkeypatch, main):
+    import asyncio
+    import sys
+    import types
+    server = types.ModuleType("src.mcp_server.server")
+    server.main = main
+    server.run = asyncio.run
+    monkeypatch.setitem(sys.modules, "src.mcp_server.server", server)
+    monkeypatch.setattr("src.mcp_server.server", server, raising=False)
+    monkeypatch.setenv("MCP_SERVER_CONFIG", "{}")
+
+def test_start_stops_server_on_sigint(monkeypatch):
+    import asyncio
+    import os
+    import signal
+    state = {"cancelled": False}
+
+    async def main():
+        os.kill(os.getpid(), signal.SIGINT)
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            state["cancelled"] = True
+            raise
+
+    _fake_server(monkeypatch, main)
+    runner = CliRunner()
+    result = runner.invoke(mcp_cli, ["start", "--skip-validation"])
+    assert result.exit_code == 0
+    assert state["cancelled"]
+    assert "MCP server stopped." in result.output
+
+def test_start_reports_server_errors(monkeypatch):
+    async def main():
+        raise RuntimeError("transport closed")
+
+    _fake_server(monkeypatch, main)
+    runner = CliRunner()
+    result = runner.invoke(mcp_cli, ["start", "--skip-validation"])
+    assert isinstance(result.exception, RuntimeError)
+    assert "Error starting MCP server: transport closed" in result.output